@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sys
+import threading
+from time import perf_counter
+
+from wexample_helpers.classes.example.example import Example
+
+
+class ThreadedDispatchBenchmarkExample(Example):
+    DISPATCHES_PER_THREAD = 50_000
+
+    def execute(self) -> None:
+        print("=== Threaded Dispatch Benchmark ===\n")
+
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        print(f"   GIL enabled: {is_gil_enabled}\n")
+
+        baseline = None
+        for threads in (1, 2, 4, 8):
+            rate = self._measure(threads)
+            baseline = baseline or rate
+            print(
+                f"   {threads} thread(s): {rate:>12,.0f} dispatch/s"
+                f"  (x{rate / baseline:.2f})"
+            )
+
+    def _measure(self, threads: int) -> float:
+        """Dispatch from several threads on one shared dispatcher."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+
+        class App(EventDispatcherMixin):
+            pass
+
+        app = App()
+
+        def on_tick(event: Event) -> None:
+            pass
+
+        app.add_event_listener("tick", on_tick)
+        app.add_event_listener("tick", on_tick)
+        event = Event(name="tick")
+        barrier = threading.Barrier(threads + 1)
+
+        def worker() -> None:
+            barrier.wait()
+            for _ in range(self.DISPATCHES_PER_THREAD):
+                app.dispatch(event)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        started = perf_counter()
+        for thread in workers:
+            thread.join()
+
+        return threads * self.DISPATCHES_PER_THREAD / (perf_counter() - started)
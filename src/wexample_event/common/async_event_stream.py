@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable, Generator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.event import Event
+
+
+class AsyncEventStream:
+    """Bounded async iterator over the events dispatched under one name.
+
+    Events are buffered until consumed. What happens once the buffer is
+    full depends on ``overflow``:
+
+    - ``"drop_oldest"`` (default): the oldest event is dropped and counted
+      in ``dropped``, so a slow consumer never blocks the dispatching side.
+    - ``"block"``: the producer waits for space (backpressure). Other
+      threads block in dispatch; on the loop thread the listener returns an
+      awaitable, so producers there must use dispatch_async. A plain
+      dispatch on the loop thread cannot wait: once the buffer is full, its
+      event is dropped and counted in ``dropped``, and the listener fails.
+
+    Listeners may fire from any thread, events are handed over to the
+    owning loop thread-safely. Producers still waiting when the stream is
+    closed have their event dropped.
+    """
+
+    OVERFLOW_MODES = ("block", "drop_oldest")
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcherMixin,
+        name: str,
+        *,
+        maxsize: int = 1024,
+        predicate: Callable[[Event], bool] | None = None,
+        overflow: str = "drop_oldest",
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        if overflow not in self.OVERFLOW_MODES:
+            raise ValueError(f"overflow must be one of {self.OVERFLOW_MODES}")
+
+        self.dispatcher = dispatcher
+        self.dropped = 0
+        self.maxsize = maxsize
+        self.name = name
+        self.overflow = overflow
+        self.predicate = predicate
+        self._buffer: deque[Event] = deque()
+        self._putters: deque[asyncio.Future[None]] = deque()
+        self._closed = False
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._waiter: asyncio.Future[None] | None = None
+
+        dispatcher.add_event_listener(name, self._on_event)
+
+    def __aiter__(self) -> AsyncEventStream:
+        return self
+
+    async def __anext__(self) -> Event:
+        while not self._buffer:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        event = self._buffer.popleft()
+        self._wake_putter()
+        return event
+
+    async def __aenter__(self) -> AsyncEventStream:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Unsubscribe from the dispatcher; buffered events can still be drained."""
+        if self._closed:
+            return
+        self._closed = True
+        self.dispatcher.remove_event_listener(self.name, self._on_event)
+        if threading.get_ident() == self._loop_thread:
+            self._wake()
+        else:
+            self._loop.call_soon_threadsafe(self._wake)
+
+    def _on_event(self, event: Event) -> Awaitable[None] | None:
+        if self._closed:
+            return None
+        if self.predicate is not None and not self.predicate(event):
+            return None
+        block = self.overflow == "block"
+        if threading.get_ident() == self._loop_thread:
+            if block and len(self._buffer) >= self.maxsize:
+                return _PendingPut(self, event)
+            self._push(event)
+        elif block:
+            asyncio.run_coroutine_threadsafe(self._put(event), self._loop).result()
+        else:
+            self._loop.call_soon_threadsafe(self._push, event)
+        return None
+
+    def _push(self, event: Event) -> None:
+        if len(self._buffer) >= self.maxsize:
+            self._buffer.popleft()
+            self.dropped += 1
+        self._buffer.append(event)
+        self._wake()
+
+    async def _put(self, event: Event) -> None:
+        while len(self._buffer) >= self.maxsize and not self._closed:
+            putter = self._loop.create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            finally:
+                if putter in self._putters:
+                    self._putters.remove(putter)
+        if self._closed:
+            self.dropped += 1
+            return
+        self._buffer.append(event)
+        self._wake()
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+        if self._closed:
+            while self._putters:
+                self._wake_putter()
+
+    def _wake_putter(self) -> None:
+        while self._putters:
+            putter = self._putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                return
+
+
+class _PendingPut:
+    """Put awaited by dispatch_async on the loop thread of a full stream.
+
+    The coroutine is only created once awaited; a plain dispatch closes the
+    awaitable instead, which counts the event as dropped.
+    """
+
+    __slots__ = ("event", "settled", "stream")
+
+    def __init__(self, stream: AsyncEventStream, event: Event) -> None:
+        self.event = event
+        self.settled = False
+        self.stream = stream
+
+    def __await__(self) -> Generator[Any, None, None]:
+        self.settled = True
+        return self.stream._put(self.event).__await__()
+
+    def close(self) -> None:
+        if not self.settled:
+            self.settled = True
+            self.stream.dropped += 1
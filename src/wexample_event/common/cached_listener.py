@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import inspect
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from time import monotonic
+from typing import Any
+
+from wexample_event.dataclass.event import Event
+from wexample_event.dataclass.listener_cache_stats import ListenerCacheStats
+from wexample_event.dataclass.listener_record import EventCallback
+
+CacheKey = Callable[[Event], Hashable]
+
+DEFAULT_CACHE_SIZE = 128
+
+
+class CachedListener:
+    """Listener wrapper memoizing results by a key computed from the event.
+
+    ``key`` maps an event to a hashable cache key; events mapping to a key
+    already cached are answered with the stored result and the wrapped
+    callback is not called. A key of None bypasses the cache. At most
+    ``maxsize`` results are kept, the least recently used being evicted
+    first, and results older than ``ttl`` seconds are recomputed.
+
+    Only idempotent listeners should be memoized: a hit skips every side
+    effect of the callback. Failures are never cached. Results of async
+    callbacks are cached once awaited.
+    """
+
+    def __init__(
+        self,
+        callback: EventCallback,
+        key: CacheKey,
+        *,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if not callable(callback):
+            raise TypeError("callback must be callable")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.__wrapped__ = callback
+        self.clock = clock
+        self.evictions = 0
+        self.hits = 0
+        self.key = key
+        self.maxsize = maxsize
+        self.misses = 0
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> Any:
+        cache_key = self.key(event)
+        if cache_key is None:
+            return self.__wrapped__(event)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                if entry[0] > self.clock():
+                    self._entries.move_to_end(cache_key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[cache_key]
+                self.evictions += 1
+            self.misses += 1
+
+        result = self.__wrapped__(event)
+        if inspect.isawaitable(result):
+            return self._store_awaited(cache_key, result)
+        self._store(cache_key, result)
+        return result
+
+    def __repr__(self) -> str:
+        return f"<CachedListener {self.__wrapped__!r}>"
+
+    def cache_clear(self) -> None:
+        """Drop every cached result; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> ListenerCacheStats:
+        with self._lock:
+            return ListenerCacheStats(
+                callback=self.__wrapped__,
+                evictions=self.evictions,
+                hits=self.hits,
+                maxsize=self.maxsize,
+                misses=self.misses,
+                size=len(self._entries),
+            )
+
+    def _store(self, cache_key: Hashable, result: Any) -> None:
+        expires = float("inf") if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._entries[cache_key] = (expires, result)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    async def _store_awaited(self, cache_key: Hashable, awaitable: Any) -> Any:
+        result = await awaitable
+        self._store(cache_key, result)
+        return result
+
+
+def cached_listener(
+    key: CacheKey,
+    *,
+    maxsize: int = DEFAULT_CACHE_SIZE,
+    ttl: float | None = None,
+) -> Callable[[EventCallback], CachedListener]:
+    """Decorator memoizing a plain function listener (see CachedListener).
+
+    Methods declared with EventListenerMixin.on should use its cache_key
+    option instead, which gives each bound instance its own cache.
+    """
+
+    def decorator(callback: EventCallback) -> CachedListener:
+        return CachedListener(callback, key, maxsize=maxsize, ttl=ttl)
+
+    return decorator
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class CascadeGraph:
+    """Counts of which events were dispatched from listeners of which.
+
+    An edge ``(parent, child)`` is recorded each time a listener handling
+    ``parent`` dispatches ``child``; ``roots`` counts the dispatches started
+    outside any listener. Attach it with set_cascade_graph.
+    """
+
+    def __init__(self) -> None:
+        self.edges: dict[tuple[str, str], int] = {}
+        self.roots: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.edges = {}
+            self.roots = {}
+
+    def cycles(self) -> list[list[str]]:
+        """Groups of events that can trigger each other, e.g. A -> B -> A.
+
+        Each group is a strongly connected component of the graph with more
+        than one event, or an event dispatching itself; names are sorted.
+        """
+        successors: dict[str, list[str]] = {}
+        for parent, child in list(self.edges):
+            successors.setdefault(parent, []).append(child)
+            successors.setdefault(child, [])
+
+        # Iterative Tarjan, so long chains cannot hit the recursion limit.
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        groups: list[list[str]] = []
+        for start in successors:
+            if start in index:
+                continue
+            work = [(start, iter(successors[start]))]
+            index[start] = lowlink[start] = len(index)
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(successors[child])))
+                    elif child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index[node]:
+                    continue
+                group = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    group.append(member)
+                    if member == node:
+                        break
+                if len(group) > 1 or (node, node) in self.edges:
+                    groups.append(sorted(group))
+        return sorted(groups)
+
+    def record(self, parent: str | None, child: str) -> None:
+        with self._lock:
+            if parent is None:
+                self.roots[child] = self.roots.get(child, 0) + 1
+            else:
+                self.edges[parent, child] = self.edges.get((parent, child), 0) + 1
+
+    def to_dot(self) -> str:
+        """Graphviz description of the graph, edges labelled by count."""
+        lines = ["digraph cascades {"]
+        for (parent, child), count in sorted(self.edges.items()):
+            lines.append(f'  {_quote(parent)} -> {_quote(child)} [label="{count}"];')
+        lines.append("}")
+        return "\n".join(lines)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any
+
+from wexample_event.common.error_policy import DispatchErrorPolicy
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.dispatch_result import DispatchResult
+    from wexample_event.dataclass.event import Event
+
+DedupKey = Callable[["Event"], Hashable]
+
+# Innermost deferred block open in the current thread or task.
+deferred_scope: ContextVar[DeferredDispatch | None] = ContextVar(
+    "event_deferred_scope", default=None
+)
+
+
+class DeferredDispatch:
+    """Buffer the dispatches of a block and run them when it exits cleanly.
+
+    Created by EventDispatcherMixin.deferred. While the block runs, events
+    passed to ``dispatch`` on that dispatcher from the same thread or task
+    are kept instead of dispatched; they are dispatched in order on a clean
+    exit and dropped when the block raises or calls ``rollback``.
+
+    A failing listener does not stop the flush: unless their policy is
+    ``log_and_continue``, events are dispatched collecting failures, and a
+    DeferredDispatchError listing them is raised once every event ran.
+
+    Events with the same ``key`` are dispatched once: at the position of the
+    first one, with the last one's content (``keep="last"``) or the first
+    one's (``keep="first"``). A key of None never deduplicates; without
+    ``key`` every event is kept. A block nested in another deferred block of
+    the same dispatcher hands its events to the outer block on exit.
+    """
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcherMixin,
+        *,
+        key: DedupKey | None = None,
+        keep: str = "last",
+        error_policy: DispatchErrorPolicy | str | None = None,
+    ) -> None:
+        if keep not in ("first", "last"):
+            raise ValueError("keep must be 'first' or 'last'")
+
+        self.dispatcher = dispatcher
+        self.error_policy = error_policy
+        self.keep = keep
+        self.key = key
+        self.parent: DeferredDispatch | None = None
+        # Dedup key -> (event, error_policy it was dispatched with).
+        self._buffer: dict[Hashable, tuple[Event, Any]] = {}
+        self._token: Token[DeferredDispatch | None] | None = None
+
+    def __enter__(self) -> DeferredDispatch:
+        if self._token is not None:
+            raise RuntimeError("DeferredDispatch is already active")
+        self.parent = deferred_scope.get()
+        self._token = deferred_scope.set(self)
+        self._count_block(1)
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        deferred_scope.reset(self._token)
+        self._token = None
+        self._count_block(-1)
+        if exc_type is not None:
+            self.rollback()
+            return
+
+        outer = None if self.parent is None else self.parent._find(self.dispatcher)
+        buffered = list(self._buffer.values())
+        self._buffer.clear()
+        if outer is not None:
+            for event, error_policy in buffered:
+                outer.defer(event, error_policy)
+            return
+
+        failed: list[DispatchResult] = []
+        error: Exception | None = None
+        for event, error_policy in buffered:
+            policy = self.dispatcher._resolve_error_policy(
+                self.error_policy if error_policy is None else error_policy
+            )
+            if policy is DispatchErrorPolicy.LOG_AND_CONTINUE:
+                self.dispatcher.dispatch(event, error_policy=policy)
+                continue
+            try:
+                result = self.dispatcher.dispatch_with_result(
+                    event, error_policy=DispatchErrorPolicy.COLLECT
+                )
+            except Exception as raised:
+                # Raised by the dispatch itself, e.g. a cascade limit.
+                error = error or raised
+                continue
+            if not result.ok:
+                failed.append(result)
+
+        if error is not None:
+            raise error
+        if failed:
+            from wexample_event.exception.deferred_dispatch_error import (
+                DeferredDispatchError,
+            )
+
+            raise DeferredDispatchError(failed) from failed[0].errors[0]
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def pending(self) -> list[Event]:
+        """Buffered events, in the order they will be dispatched."""
+        return [event for event, _ in self._buffer.values()]
+
+    def defer(
+        self, event: Event, error_policy: DispatchErrorPolicy | str | None = None
+    ) -> None:
+        """Buffer event, merging it with a buffered duplicate if any."""
+        dedup_key = None if self.key is None else self.key(event)
+        if dedup_key is None:
+            # Unique key, so the event is never merged.
+            dedup_key = object()
+        elif dedup_key in self._buffer and self.keep == "first":
+            return
+        self._buffer[dedup_key] = (event, error_policy)
+
+    def rollback(self) -> None:
+        """Drop the buffered events."""
+        self._buffer.clear()
+
+    def _count_block(self, delta: int) -> None:
+        """Track open blocks, so dispatch() skips the scope lookup without any."""
+        dispatcher = self.dispatcher
+        _, lock, _ = dispatcher._ensure_dispatcher_state()
+        with lock:
+            dispatcher._event_deferred_blocks += delta
+
+    def _find(self, dispatcher: EventDispatcherMixin) -> DeferredDispatch | None:
+        scope: DeferredDispatch | None = self
+        while scope is not None and scope.dispatcher is not dispatcher:
+            scope = scope.parent
+        return scope
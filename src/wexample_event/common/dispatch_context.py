@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+from wexample_event.dataclass.dispatch_frame import DispatchFrame
+
+# Innermost dispatch running in the current thread or task.
+dispatch_frame: ContextVar[DispatchFrame | None] = ContextVar(
+    "event_dispatch_frame", default=None
+)
+
+
+def current_dispatch() -> DispatchFrame | None:
+    """Frame of the dispatch whose listeners are currently running, if any.
+
+    Its parents are the dispatches whose listeners triggered it. Frames
+    are kept by dispatchers with cascade limits, a cascade graph, a tracer
+    or _track_dispatch_frames set; dispatches of other dispatchers are
+    skipped.
+    """
+    return dispatch_frame.get()
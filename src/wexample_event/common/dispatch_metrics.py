@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING
+
+from wexample_event.common.dispatch_tracer import DispatchTracer
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.common.event_phase import EventPhase
+    from wexample_event.dataclass.event import Event
+    from wexample_event.dataclass.listener_record import EventCallback
+
+Labels = tuple[tuple[str, str], ...]
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_COUNTERS = {
+    "bubble_hops_total": "Ancestor dispatchers reached while propagating.",
+    "dispatched_total": "Events dispatched.",
+    "listener_errors_total": "Listener calls that raised.",
+    "listener_invocations_total": "Listener calls.",
+    "listener_latency_seconds_count": None,
+    "listener_latency_seconds_sum": None,
+    "once_removed_total": "Once-listeners removed after firing.",
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _quantile(ordered: list[float], quantile: float) -> float:
+    """Nearest-rank quantile of a sorted, non-empty list."""
+    return ordered[min(len(ordered) - 1, max(0, int(quantile * len(ordered))))]
+
+
+class _MetricShard:
+    """Counters and latency samples written by a single thread."""
+
+    __slots__ = ("counters", "samples")
+
+    def __init__(self) -> None:
+        self.counters: dict[tuple[str, Labels], float] = {}
+        self.samples: dict[str, deque[tuple[float, float]]] = {}
+
+
+class DispatchMetrics(DispatchTracer):
+    """Tracer keeping live dispatch counters, exportable for Prometheus.
+
+    Counts dispatched events, listener calls and failures, once-listener
+    removals and bubbling hops per event name, and listener latency
+    quantiles over the last ``window`` seconds (at most ``max_samples``
+    samples per event name and thread). Install it like any tracer, or
+    with EventDispatcherMixin.enable_dispatch_metrics.
+
+    Each thread writes to its own shard without locking; shards are only
+    summed when metrics are read, so recording costs a few dict updates.
+    Gauges such as queue depths are read from callables registered with
+    ``add_gauge``.
+    """
+
+    def __init__(
+        self,
+        *,
+        namespace: str = "wexample_event",
+        window: float = 60.0,
+        max_samples: int = 1024,
+        quantiles: Iterable[float] = (0.5, 0.9, 0.99),
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if max_samples <= 0:
+            raise ValueError("max_samples must be a positive integer")
+
+        self.clock = clock
+        self.max_samples = max_samples
+        self.namespace = namespace
+        self.quantiles = tuple(quantiles)
+        self.window = window
+        self._gauges: dict[str, tuple[Callable[[], float], str]] = {}
+        self._local = threading.local()
+        self._shards: list[_MetricShard] = []
+        self._shards_lock = threading.Lock()
+        self._started: ContextVar[tuple[float, ...]] = ContextVar(
+            f"dispatch_metrics_{id(self)}", default=()
+        )
+
+    def add_gauge(self, name: str, read: Callable[[], float], help: str = "") -> None:
+        """Export the value returned by read() as a gauge, e.g. a queue depth."""
+        self._gauges[name] = (read, help)
+
+    def counters(self) -> dict[tuple[str, Labels], float]:
+        """Current counter values, summed over every thread."""
+        totals: dict[tuple[str, Labels], float] = {}
+        for shard in self._iter_shards():
+            for key, value in shard.counters.copy().items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def latency_quantiles(self) -> dict[str, dict[float, float]]:
+        """Listener latency quantiles per event name over the window."""
+        since = self.clock() - self.window
+        merged: dict[str, list[float]] = {}
+        for shard in self._iter_shards():
+            for name, samples in shard.samples.copy().items():
+                merged.setdefault(name, []).extend(
+                    duration for at, duration in samples.copy() if at >= since
+                )
+        return {
+            name: {
+                quantile: _quantile(ordered, quantile) for quantile in self.quantiles
+            }
+            for name, ordered in (
+                (name, sorted(values)) for name, values in merged.items()
+            )
+            if ordered
+        }
+
+    def on_bubble(
+        self, dispatcher: EventDispatcherMixin, event: Event, phase: EventPhase
+    ) -> None:
+        self._inc(
+            "bubble_hops_total",
+            (("event", event.name), ("phase", phase.name.lower())),
+        )
+
+    def on_dispatch_start(self, dispatcher: EventDispatcherMixin, event: Event) -> None:
+        self._inc("dispatched_total", (("event", event.name),))
+
+    def on_listener_end(
+        self,
+        dispatcher: EventDispatcherMixin,
+        event: Event,
+        callback: EventCallback,
+        error: Exception | None,
+    ) -> None:
+        started = self._started.get()
+        if not started:
+            return
+        self._started.set(started[:-1])
+        duration = perf_counter() - started[-1]
+
+        labels = (("event", event.name),)
+        shard = self._shard()
+        counters = shard.counters
+        for metric, amount in (
+            ("listener_invocations_total", 1),
+            ("listener_latency_seconds_count", 1),
+            ("listener_latency_seconds_sum", duration),
+        ):
+            counters[metric, labels] = counters.get((metric, labels), 0) + amount
+        if error is not None:
+            self._inc("listener_errors_total", labels)
+
+        samples = shard.samples.get(event.name)
+        if samples is None:
+            samples = shard.samples[event.name] = deque(maxlen=self.max_samples)
+        samples.append((self.clock(), duration))
+
+    def on_listener_start(
+        self, dispatcher: EventDispatcherMixin, event: Event, callback: EventCallback
+    ) -> None:
+        # A stack, as listeners may dispatch (and time) nested events.
+        self._started.set((*self._started.get(), perf_counter()))
+
+    def on_once_removed(
+        self, dispatcher: EventDispatcherMixin, event: Event, count: int
+    ) -> None:
+        self._inc("once_removed_total", (("event", event.name),), count)
+
+    def render_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        prefix = f"{self.namespace}_" if self.namespace else ""
+        by_metric: dict[str, list[tuple[Labels, float]]] = {}
+        for (metric, labels), value in sorted(self.counters().items()):
+            by_metric.setdefault(metric, []).append((labels, value))
+
+        lines: list[str] = []
+        for metric, help_text in _COUNTERS.items():
+            if help_text is None or metric not in by_metric:
+                continue
+            lines.append(f"# HELP {prefix}{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}{metric} counter")
+            for labels, value in by_metric[metric]:
+                lines.append(f"{prefix}{metric}{_format_labels(labels)} {value:g}")
+
+        summary = f"{prefix}listener_latency_seconds"
+        quantiles = self.latency_quantiles()
+        if quantiles or "listener_latency_seconds_count" in by_metric:
+            lines.append(
+                f"# HELP {summary} Listener latency over the last {self.window:g}s."
+            )
+            lines.append(f"# TYPE {summary} summary")
+            for name, values in sorted(quantiles.items()):
+                for quantile, value in values.items():
+                    labels = (("event", name), ("quantile", f"{quantile:g}"))
+                    lines.append(f"{summary}{_format_labels(labels)} {value:.9g}")
+            for suffix in ("count", "sum"):
+                for labels, value in by_metric.get(
+                    f"listener_latency_seconds_{suffix}", ()
+                ):
+                    lines.append(
+                        f"{summary}_{suffix}{_format_labels(labels)} {value:.9g}"
+                    )
+
+        for name, (read, help_text) in sorted(self._gauges.items()):
+            if help_text:
+                lines.append(f"# HELP {prefix}{name} {help_text}")
+            lines.append(f"# TYPE {prefix}{name} gauge")
+            lines.append(f"{prefix}{name} {float(read()):g}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        """Forget every counter and latency sample."""
+        with self._shards_lock:
+            self._shards = []
+            self._local = threading.local()
+
+    def serve_prometheus(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> ThreadingHTTPServer:
+        """Serve the metrics over HTTP from a daemon thread.
+
+        Every path answers with render_prometheus(); the bound port is in
+        ``server.server_address``. Stop it with ``server.shutdown()``.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = metrics.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(
+            target=server.serve_forever, name="dispatch-metrics", daemon=True
+        ).start()
+        return server
+
+    def write_prometheus(self, path: str | os.PathLike[str]) -> None:
+        """Write the metrics to path atomically, e.g. for a textfile collector."""
+        tmp_path = f"{os.fspath(path)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+    def _inc(self, metric: str, labels: Labels, amount: float = 1) -> None:
+        counters = self._shard().counters
+        counters[metric, labels] = counters.get((metric, labels), 0) + amount
+
+    def _iter_shards(self) -> list[_MetricShard]:
+        with self._shards_lock:
+            return list(self._shards)
+
+    def _shard(self) -> _MetricShard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _MetricShard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.common.event_phase import EventPhase
+    from wexample_event.dataclass.event import Event
+    from wexample_event.dataclass.listener_record import EventCallback
+
+
+class DispatchTracer:
+    """Hooks called while events are dispatched; every hook is a no-op here.
+
+    Install a subclass on one dispatcher with set_dispatch_tracer, or on
+    every dispatcher with EventDispatcherMixin.set_global_dispatch_tracer.
+    A dispatcher reports the dispatches it starts and the listeners it runs
+    to its own tracer. Hooks run synchronously in the dispatching thread
+    and should not raise.
+    """
+
+    def on_bubble(
+        self, dispatcher: EventDispatcherMixin, event: Event, phase: EventPhase
+    ) -> None:
+        """Propagation reached an ancestor dispatcher, in the given phase."""
+
+    def on_dispatch_end(self, dispatcher: EventDispatcherMixin, event: Event) -> None:
+        """The dispatch of event finished, successfully or not."""
+
+    def on_dispatch_start(self, dispatcher: EventDispatcherMixin, event: Event) -> None:
+        """dispatcher starts dispatching event."""
+
+    def on_listener_end(
+        self,
+        dispatcher: EventDispatcherMixin,
+        event: Event,
+        callback: EventCallback,
+        error: Exception | None,
+    ) -> None:
+        """callback returned, or failed with error."""
+
+    def on_listener_start(
+        self, dispatcher: EventDispatcherMixin, event: Event, callback: EventCallback
+    ) -> None:
+        """dispatcher is about to call callback with event."""
+
+    def on_once_removed(
+        self, dispatcher: EventDispatcherMixin, event: Event, count: int
+    ) -> None:
+        """count once-listeners were claimed by the dispatch of event."""
@@ -1,59 +1,426 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
+import logging
 import threading
-from collections.abc import Mapping
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
 from itertools import count
-from typing import Any, ClassVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from wexample_event.common.cached_listener import CachedListener
+from wexample_event.common.deferred_dispatch import (
+    DedupKey,
+    DeferredDispatch,
+    deferred_scope,
+)
+from wexample_event.common.dispatch_context import dispatch_frame
+from wexample_event.common.error_policy import DEFAULT_ERROR_POLICY, DispatchErrorPolicy
+from wexample_event.common.event_phase import EventPhase
 from wexample_event.common.priority import DEFAULT_PRIORITY, EventPriority
+from wexample_event.common.propagation import propagation_state
+from wexample_event.common.tracer_group import TracerGroup
+from wexample_event.dataclass.dispatch_frame import DispatchFrame
+from wexample_event.dataclass.dispatch_result import DispatchResult
 from wexample_event.dataclass.event import Event
-from wexample_event.dataclass.listener_record import EventCallback, ListenerRecord
+from wexample_event.dataclass.event_filter import EventFilter
+from wexample_event.dataclass.filter_condition import filter_value
+from wexample_event.dataclass.listener_bucket import ListenerBucket
+from wexample_event.dataclass.listener_cache_stats import ListenerCacheStats
+from wexample_event.dataclass.listener_outcome import ListenerOutcome
+from wexample_event.dataclass.propagation_state import PropagationState
+from wexample_event.dataclass.listener_record import (
+    CaptureKey,
+    EventCallback,
+    EventKey,
+    ListenerRecord,
+)
+from wexample_event.dataclass.typed_event import TypedEvent
+from wexample_event.exception.event_cascade_error import EventCascadeError
+
+if TYPE_CHECKING:
+    from contextvars import Token
+
+    from wexample_event.common.async_event_stream import AsyncEventStream
+    from wexample_event.common.cascade_graph import CascadeGraph
+    from wexample_event.common.dispatch_metrics import DispatchMetrics
+    from wexample_event.common.dispatch_tracer import DispatchTracer
+    from wexample_event.common.event_iterator import EventIterator
+
+logger = logging.getLogger(__name__)
+
+# Guards the lazy creation of per-instance dispatcher state.
+_STATE_LOCK = threading.Lock()
+
+# Whether a dispatcher class is linked into a tree, resolved once per class.
+_TREE_CLASSES: dict[type, bool] = {}
+
+# Event classes a typed event is routed to, resolved once per class.
+_ROUTING_KEYS: dict[type[Event], tuple[type[Event], ...]] = {}
+
+
+def _resolve_routing_keys(event_class: type[Event]) -> tuple[type[Event], ...]:
+    keys = _ROUTING_KEYS.get(event_class)
+    if keys is None:
+        keys = tuple(
+            base
+            for base in event_class.__mro__
+            if isinstance(base, type) and issubclass(base, Event)
+        )
+        _ROUTING_KEYS[event_class] = keys
+    return keys
+
+
+def _base_key(key: Any) -> EventKey:
+    """Event name or class a listener storage key belongs to."""
+    if isinstance(key, tuple):
+        key = key[0]
+    if isinstance(key, CaptureKey):
+        key = key.key
+    return key
+
+
+def _add_counts(
+    node: Any, attr: str, deltas: dict[EventKey, int], *, create: bool = True
+) -> bool:
+    """Apply count deltas to a per-key counter attribute of node.
+
+    Without create, a node lacking the attribute is left untouched and
+    False is returned.
+    """
+    with node._get_counts_lock():
+        counts = getattr(node, attr, None)
+        if counts is None:
+            if not create:
+                return False
+            counts = {}
+            setattr(node, attr, counts)
+        for key, delta in deltas.items():
+            total = counts.get(key, 0) + delta
+            if total:
+                counts[key] = total
+            else:
+                counts.pop(key, None)
+    return True
+
+
+def _clear_propagation_state() -> Token[PropagationState | None] | None:
+    """Unset the propagation state of an enclosing dispatch, if any."""
+    if propagation_state.get() is None:
+        return None
+    return propagation_state.set(None)
+
+
+def _is_tree_class(cls: type[EventDispatcherMixin]) -> bool:
+    """Whether cls links its instances to parents or children."""
+    linked = _TREE_CLASSES.get(cls)
+    if linked is None:
+        linked = _TREE_CLASSES[cls] = (
+            cls._get_bubbling_parent is not EventDispatcherMixin._get_bubbling_parent
+            or cls._get_event_children is not EventDispatcherMixin._get_event_children
+        )
+    return linked
+
+
+def _matching_filter_slots(
+    event: Event,
+    keys: tuple[EventKey, ...],
+    filters: dict[EventKey, dict[tuple[str, str], frozenset[Any]]],
+) -> list[tuple[Any, ...]]:
+    slots = []
+    for key in keys:
+        index = filters.get(key)
+        if not index:
+            continue
+        for (source, field), values in index.items():
+            value = filter_value(event, source, field)
+            try:
+                if value in values:
+                    slots.append((key, source, field, value))
+            except TypeError:
+                pass
+    return slots
 
 
 class EventDispatcherMixin:
     """Mixin providing a lightweight observer pattern implementation."""
 
+    _ANCESTOR_ATTR: ClassVar[str] = "_event_ancestor_counts"
+    _COUNTS_LOCK_ATTR: ClassVar[str] = "_event_counts_lock"
+    _FILTERS_ATTR: ClassVar[str] = "_event_listener_filters"
     _LISTENERS_ATTR: ClassVar[str] = "_event_listeners"
     _LOCK_ATTR: ClassVar[str] = "_event_listener_lock"
     _ORDER_ATTR: ClassVar[str] = "_event_listener_order"
+    _STICKY_ATTR: ClassVar[str] = "_event_sticky_events"
+    _SUBTREE_ATTR: ClassVar[str] = "_event_subtree_counts"
     _UNSET: ClassVar[object] = object()
+    _enable_ancestor_index: ClassVar[bool] = False
     _enable_bubbling: ClassVar[bool] = False
+    # Limits on dispatches started from listeners (see _enter_dispatch).
+    _max_cascade_fanout: ClassVar[int | None] = None
+    _max_dispatch_depth: ClassVar[int | None] = None
+    # Keep dispatch frames (see current_dispatch) without limits, graph or
+    # tracer, which imply them.
+    _track_dispatch_frames: ClassVar[bool] = False
+    # Set on the instance by set_cascade_graph.
+    _event_cascade_graph: CascadeGraph | None = None
+    # Set on the instance once it registers a capture listener.
+    _event_capture_enabled: bool = False
+    # Number of deferred() blocks open on the instance, in any thread.
+    _event_deferred_blocks: int = 0
+    # Set on the instance by make_sticky: kept events per sticky key.
+    _event_sticky_events: dict[EventKey, deque[Event]] | None = None
+    _event_error_policy: ClassVar[DispatchErrorPolicy] = DEFAULT_ERROR_POLICY
+    # Set on the instance by enable_dispatch_metrics.
+    _event_metrics: DispatchMetrics | None = None
+    # Set on the instance by set_dispatch_tracer.
+    _event_own_tracer: DispatchTracer | None = None
+    # Hooks called while dispatching: the own tracer and metrics of the
+    # instance, or for every other dispatcher the tracer installed by
+    # set_global_dispatch_tracer; None keeps dispatch untraced.
+    _event_tracer: DispatchTracer | None = None
 
     def add_event_listener(
         self,
-        name: str,
+        name: EventKey,
         callback: EventCallback,
         *,
         once: bool = False,
         priority: int | EventPriority = DEFAULT_PRIORITY,
+        where: Mapping[str, Any] | EventFilter | None = None,
+        capture: bool = False,
+        replay: bool = False,
     ) -> None:
-        """Register a callback for the given event name."""
+        """Register a callback for the given event name or TypedEvent class.
+
+        With replay, the events kept for a sticky name (see make_sticky) are
+        delivered to the callback right away, oldest first; a once-listener
+        receiving a replayed event is not registered at all. The kept events
+        are read while registering, so a sticky event dispatched meanwhile
+        reaches the callback exactly once, replayed or live.
+
+        Capture listeners run during the capture phase, before the listeners
+        of the target and of the dispatchers below them (see
+        _dispatch_into).
+
+        ``where`` restricts the callback to events whose payload (or
+        ``metadata.``-prefixed) fields equal, or belong to, the given values.
+        Filtered listeners are indexed, so events only reach the listeners
+        whose filter matches.
+        """
         if not callable(callback):
             raise TypeError("callback must be callable")
+        if isinstance(name, type) and not issubclass(name, Event):
+            raise TypeError("event class must be a subclass of Event")
+        event_filter = (
+            EventFilter.from_mapping(where)
+            if where is not None and not isinstance(where, EventFilter)
+            else where
+        )
 
         listeners, lock, order_seq = self._ensure_dispatcher_state()
-        record = ListenerRecord(
-            callback=callback,
-            once=once,
-            priority=int(priority),
-            order=next(order_seq),
-        )
+        key = CaptureKey(name) if capture else name
 
         with lock:
-            bucket = listeners.setdefault(name, [])
-            bucket.append(record)
-            bucket.sort(key=lambda item: (-item.priority, item.order))
+            replayed = (
+                self._kept_sticky_events(name, event_filter, once) if replay else []
+            )
+            if not (once and replayed):
+                if capture:
+                    self._event_capture_enabled = True
+                slots, residual = self._index_listener_filter(key, event_filter, once)
+                # Drawn under the lock: count() is not atomic without the GIL.
+                record = ListenerRecord(
+                    callback=callback,
+                    once=once,
+                    priority=int(priority),
+                    order=next(order_seq),
+                    filter=residual,
+                )
+                for slot in slots:
+                    bucket = listeners.get(slot)
+                    self._publish_bucket(
+                        slot,
+                        (
+                            bucket.inserted(record)
+                            if bucket
+                            else ListenerBucket.from_records((record,))
+                        ),
+                    )
+
+        if replayed:
+            self._replay_sticky_events(callback, replayed)
+
+    def broadcast(
+        self,
+        event: Event | str,
+        *,
+        payload: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        source: Any | object = _UNSET,
+        error_policy: DispatchErrorPolicy | str | None = None,
+    ) -> Event:
+        """Dispatch an event on this dispatcher and all its descendants.
+
+        Descendants come from _get_event_children() and are visited depth
+        first, parents before children. Subtrees holding no listener for the
+        event are skipped without being walked (see _attach_event_child).
+        Events do not bubble or capture during a broadcast, which counts as
+        one dispatch for the cascade limits and the tracer.
+        """
+        dispatched_event = self._coerce_event(
+            event, payload=payload, metadata=metadata, source=source
+        )
+        policy = self._resolve_error_policy(error_policy)
+        result = (
+            None
+            if policy is DispatchErrorPolicy.RAISE_FIRST
+            else DispatchResult(event=dispatched_event)
+        )
+        keys = self._routing_keys(dispatched_event)
 
-    def clear_event_listeners(self, name: str | None = None) -> None:
+        token = self._enter_dispatch(dispatched_event)
+        propagation_token = _clear_propagation_state()
+        tracer = self._event_tracer
+        try:
+            if tracer is not None:
+                tracer.on_dispatch_start(self, dispatched_event)
+            stack: list[EventDispatcherMixin] = [self]
+            while stack:
+                node = stack.pop()
+                if not node._subtree_has_listeners(keys):
+                    continue
+                node._invoke_phase(dispatched_event, policy, result, capture=True)
+                node._invoke_phase(dispatched_event, policy, result, capture=False)
+                children = list(node._get_event_children())
+                children.reverse()
+                stack.extend(children)
+        finally:
+            if tracer is not None:
+                tracer.on_dispatch_end(self, dispatched_event)
+            if propagation_token is not None:
+                propagation_state.reset(propagation_token)
+            if token is not None:
+                dispatch_frame.reset(token)
+
+        if result is not None and policy is DispatchErrorPolicy.COLLECT:
+            result.raise_for_errors()
+
+        return dispatched_event
+
+    async def broadcast_async(
+        self,
+        event: Event | str,
+        *,
+        payload: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        source: Any | object = _UNSET,
+        error_policy: DispatchErrorPolicy | str | None = None,
+        concurrent: bool = False,
+    ) -> Event:
+        """Asynchronous counterpart of broadcast.
+
+        With concurrent, the tree is walked level by level and the
+        dispatchers of one level run their listeners concurrently.
+        """
+        dispatched_event = self._coerce_event(
+            event, payload=payload, metadata=metadata, source=source
+        )
+        policy = self._resolve_error_policy(error_policy)
+        result = (
+            None
+            if policy is DispatchErrorPolicy.RAISE_FIRST
+            else DispatchResult(event=dispatched_event)
+        )
+        keys = self._routing_keys(dispatched_event)
+
+        async def visit(node: EventDispatcherMixin) -> None:
+            await node._invoke_phase_async(
+                dispatched_event, policy, result, capture=True
+            )
+            await node._invoke_phase_async(
+                dispatched_event, policy, result, capture=False
+            )
+
+        token = self._enter_dispatch(dispatched_event)
+        propagation_token = _clear_propagation_state()
+        tracer = self._event_tracer
+        try:
+            if tracer is not None:
+                tracer.on_dispatch_start(self, dispatched_event)
+            if concurrent:
+                level: list[EventDispatcherMixin] = [self]
+                while level:
+                    level = [
+                        node for node in level if node._subtree_has_listeners(keys)
+                    ]
+                    await asyncio.gather(*(visit(node) for node in level))
+                    level = [
+                        child for node in level for child in node._get_event_children()
+                    ]
+            else:
+                stack: list[EventDispatcherMixin] = [self]
+                while stack:
+                    node = stack.pop()
+                    if not node._subtree_has_listeners(keys):
+                        continue
+                    await visit(node)
+                    children = list(node._get_event_children())
+                    children.reverse()
+                    stack.extend(children)
+        finally:
+            if tracer is not None:
+                tracer.on_dispatch_end(self, dispatched_event)
+            if propagation_token is not None:
+                propagation_state.reset(propagation_token)
+            if token is not None:
+                dispatch_frame.reset(token)
+
+        if result is not None and policy is DispatchErrorPolicy.COLLECT:
+            result.raise_for_errors()
+
+        return dispatched_event
+
+    def clear_event_listeners(self, name: EventKey | None = None) -> None:
         """Remove all listeners. When name is provided, only that event is cleared."""
         listeners, lock, _ = self._ensure_dispatcher_state()
 
         with lock:
             if name is None:
-                listeners.clear()
-            else:
-                listeners.pop(name, None)
+                for slot in list(listeners):
+                    self._publish_bucket(slot, ListenerBucket())
+                self._get_filter_index().clear()
+                return
+            for key in (name, CaptureKey(name)):
+                for slot in (key, *self._filter_slots(key)):
+                    self._publish_bucket(slot, ListenerBucket())
+                self._get_filter_index().pop(key, None)
+
+    def clear_sticky_events(self, name: EventKey | None = None) -> None:
+        """Forget kept sticky events; names stay sticky."""
+        for key, events in (self._event_sticky_events or {}).items():
+            if name is None or key == name:
+                events.clear()
+
+    def deferred(
+        self,
+        *,
+        key: DedupKey | None = None,
+        keep: str = "last",
+        error_policy: DispatchErrorPolicy | str | None = None,
+    ) -> DeferredDispatch:
+        """Context manager holding back dispatch() calls until it exits.
+
+            with dispatcher.deferred(key=lambda e: (e.name, e.payload["id"])):
+                ...
+
+        Buffered events are deduplicated by key and dispatched on a clean
+        exit, or dropped if the block raises (see DeferredDispatch). Only
+        dispatch() is deferred, for the current thread or task.
+        """
+        return DeferredDispatch(self, key=key, keep=keep, error_policy=error_policy)
 
     def dispatch(
         self,
@@ -62,31 +429,33 @@ class EventDispatcherMixin:
         payload: Mapping[str, Any] | None = None,
         metadata: Mapping[str, Any] | None = None,
         source: Any | object = _UNSET,
+        error_policy: DispatchErrorPolicy | str | None = None,
     ) -> Event:
-        """Synchronously dispatch an event to all registered listeners."""
-        listeners = self._snapshot_listeners(
+        """Synchronously dispatch an event to all registered listeners.
+
+        Under the collect policy, listener failures are aggregated and raised
+        as a single EventDispatchError once every listener has run. Inside a
+        deferred() block the event is buffered instead.
+        """
+        dispatched_event = self._coerce_event(
             event, payload=payload, metadata=metadata, source=source
         )
-        dispatched_event, records = listeners
-
-        callbacks_to_remove: list[tuple[str, EventCallback]] = []
-        for name, record in records:
-            result = record.callback(dispatched_event)
-            if inspect.isawaitable(result):
-                raise RuntimeError(
-                    "Listener returned an awaitable; use dispatch_async for async listeners"
-                )
-            if record.once:
-                callbacks_to_remove.append((name, record.callback))
-
-        for name, callback in callbacks_to_remove:
-            self.remove_event_listener(name, callback)
+        scope = deferred_scope.get() if self._event_deferred_blocks else None
+        if scope is not None:
+            scope = scope._find(self)
+            if scope is not None:
+                scope.defer(dispatched_event, error_policy)
+                return dispatched_event
+        policy = self._resolve_error_policy(error_policy)
+        result = (
+            None
+            if policy is DispatchErrorPolicy.RAISE_FIRST
+            else DispatchResult(event=dispatched_event)
+        )
+        self._dispatch_into(dispatched_event, policy, result)
 
-        # Bubble event to parent if enabled
-        if self._enable_bubbling:
-            parent = self._get_bubbling_parent()
-            if parent:
-                parent.dispatch(dispatched_event)
+        if result is not None and policy is DispatchErrorPolicy.COLLECT:
+            result.raise_for_errors()
 
         return dispatched_event
 
@@ -97,32 +466,44 @@ class EventDispatcherMixin:
         payload: Mapping[str, Any] | None = None,
         metadata: Mapping[str, Any] | None = None,
         source: Any | object = _UNSET,
+        error_policy: DispatchErrorPolicy | str | None = None,
     ) -> Event:
         """Asynchronously dispatch an event, awaiting coroutine listeners."""
-        listeners = self._snapshot_listeners(
+        dispatched_event = self._coerce_event(
             event, payload=payload, metadata=metadata, source=source
         )
-        dispatched_event, records = listeners
-
-        callbacks_to_remove: list[tuple[str, EventCallback]] = []
-        for name, record in records:
-            result = record.callback(dispatched_event)
-            if inspect.isawaitable(result):
-                await result
-            if record.once:
-                callbacks_to_remove.append((name, record.callback))
-
-        for name, callback in callbacks_to_remove:
-            self.remove_event_listener(name, callback)
+        policy = self._resolve_error_policy(error_policy)
+        result = (
+            None
+            if policy is DispatchErrorPolicy.RAISE_FIRST
+            else DispatchResult(event=dispatched_event)
+        )
+        await self._dispatch_into_async(dispatched_event, policy, result)
 
-        # Bubble event to parent if enabled
-        if self._enable_bubbling:
-            parent = self._get_bubbling_parent()
-            if parent:
-                await parent.dispatch_async(dispatched_event)
+        if result is not None and policy is DispatchErrorPolicy.COLLECT:
+            result.raise_for_errors()
 
         return dispatched_event
 
+    async def dispatch_async_with_result(
+        self,
+        event: Event | str,
+        *,
+        payload: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        source: Any | object = _UNSET,
+        error_policy: DispatchErrorPolicy | str | None = None,
+    ) -> DispatchResult:
+        """Asynchronous counterpart of dispatch_with_result."""
+        dispatched_event = self._coerce_event(
+            event, payload=payload, metadata=metadata, source=source
+        )
+        result = DispatchResult(event=dispatched_event)
+        await self._dispatch_into_async(
+            dispatched_event, self._resolve_error_policy(error_policy), result
+        )
+        return result
+
     def dispatch_event(
         self,
         event: Event | str,
@@ -147,33 +528,274 @@ class EventDispatcherMixin:
             event, payload=payload, metadata=metadata, source=source
         )
 
-    def has_event_listeners(self, name: str) -> bool:
-        listeners, lock, _ = self._ensure_dispatcher_state()
+    def dispatch_with_result(
+        self,
+        event: Event | str,
+        *,
+        payload: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        source: Any | object = _UNSET,
+        error_policy: DispatchErrorPolicy | str | None = None,
+    ) -> DispatchResult:
+        """Dispatch an event and return per-listener outcomes and timings.
+
+        Failures are recorded on the result instead of being raised, unless
+        the effective policy is raise_first.
+        """
+        dispatched_event = self._coerce_event(
+            event, payload=payload, metadata=metadata, source=source
+        )
+        result = DispatchResult(event=dispatched_event)
+        self._dispatch_into(
+            dispatched_event, self._resolve_error_policy(error_policy), result
+        )
+        return result
+
+    def enable_dispatch_metrics(
+        self, metrics: DispatchMetrics | None = None
+    ) -> DispatchMetrics:
+        """Record counters and latencies of this dispatcher (see DispatchMetrics).
+
+        Metrics are collected through the tracer hooks, alongside the tracer
+        of this dispatcher; pass one DispatchMetrics to several dispatchers
+        to aggregate them.
+        """
+        if metrics is None:
+            from wexample_event.common.dispatch_metrics import DispatchMetrics
+
+            metrics = DispatchMetrics()
+        self._event_metrics = metrics
+        self._install_tracer()
+        return metrics
+
+    def get_listener_cache_stats(
+        self, name: EventKey | None = None
+    ) -> list[ListenerCacheStats]:
+        """Cache statistics of the memoized listeners (see CachedListener).
+
+        When name is provided, only listeners registered for it are reported.
+        """
+        listeners, _, _ = self._ensure_dispatcher_state()
+        seen: dict[int, CachedListener] = {}
+        for slot, bucket in list(listeners.items()):
+            if name is not None and _base_key(slot) != name:
+                continue
+            for callback in bucket.callbacks:
+                if isinstance(callback, CachedListener):
+                    seen.setdefault(id(callback), callback)
+        return [callback.stats() for callback in seen.values()]
+
+    def get_sticky_events(self, name: EventKey) -> tuple[Event, ...]:
+        """Events kept for a sticky name, oldest first."""
+        events = (self._event_sticky_events or {}).get(name)
+        return () if events is None else tuple(events)
+
+    def has_event_listeners(self, name: EventKey) -> bool:
+        """Whether any listener, capture listeners included, is registered."""
+        listeners, _, _ = self._ensure_dispatcher_state()
+        keys = (name, CaptureKey(name)) if self._event_capture_enabled else (name,)
+        return any(
+            listeners.get(slot)
+            for key in keys
+            for slot in (key, *self._filter_slots(key))
+        )
+
+    def make_sticky(self, name: EventKey, *, history: int = 1) -> None:
+        """Keep the last history events dispatched under name for replay.
+
+        name may be a TypedEvent class, which keeps events of that class and
+        its subclasses.
+        """
+        if history <= 0:
+            raise ValueError("history must be a positive integer")
+
+        _, lock, _ = self._ensure_dispatcher_state()
         with lock:
-            return bool(listeners.get(name))
+            sticky = dict(self._event_sticky_events or {})
+            previous = sticky.get(name, ())
+            sticky[name] = deque(previous, maxlen=history)
+            # Replaced, never mutated, so dispatch can read it without locking.
+            self._event_sticky_events = sticky
 
     def remove_event_listener(
         self,
-        name: str,
+        name: EventKey,
         callback: EventCallback,
+        *,
+        capture: bool = False,
     ) -> bool:
-        """Remove a previously registered callback. Returns True if removed."""
+        """Remove a previously registered callback. Returns True if removed.
+
+        As in the DOM, capture listeners are only removed with capture=True.
+        """
         listeners, lock, _ = self._ensure_dispatcher_state()
+        key = CaptureKey(name) if capture else name
 
         with lock:
-            bucket = listeners.get(name)
-            if not bucket:
-                return False
+            slots = self._filter_slots(key)
+            removed = False
+            for slot in (key, *slots):
+                bucket = listeners.get(slot)
+                if not bucket:
+                    continue
 
-            initial_length = len(bucket)
-            bucket[:] = [
-                record
-                for record in bucket
-                if not (record.callback is callback or record.callback == callback)
-            ]
+                mask = 0
+                for index, candidate in enumerate(bucket.callbacks):
+                    if candidate is callback or candidate == callback:
+                        mask |= 1 << index
+                if mask:
+                    self._publish_bucket(slot, bucket.without(mask))
+                    removed = True
+
+            if removed and slots:
+                self._prune_filter_index(key)
+            return removed
+
+    def set_cascade_graph(self, graph: CascadeGraph | None) -> None:
+        """Record which events this dispatcher's dispatches were triggered by."""
+        self._event_cascade_graph = graph
+
+    def set_dispatch_tracer(self, tracer: DispatchTracer | None) -> None:
+        """Trace this dispatcher with tracer; None restores the global tracer.
+
+        Metrics enabled on this dispatcher keep being collected.
+        """
+        self._event_own_tracer = tracer
+        self._install_tracer()
+
+    @staticmethod
+    def set_global_dispatch_tracer(tracer: DispatchTracer | None) -> None:
+        """Trace every dispatcher without a tracer of its own; None disables."""
+        EventDispatcherMixin._event_tracer = tracer
+
+    def stream(
+        self,
+        name: str,
+        *,
+        maxsize: int = 1024,
+        predicate: Callable[[Event], bool] | None = None,
+        overflow: str = "drop_oldest",
+    ) -> AsyncEventStream:
+        """Subscribe to an event name as a bounded async iterator.
+
+        Must be called from a running event loop. Use it as an async context
+        manager so the underlying listener is removed on exit:
+
+            async with dispatcher.stream("job.done") as events:
+                async for event in events:
+                    ...
+
+        overflow chooses between dropping the oldest buffered event and
+        blocking the producer when the buffer is full (see AsyncEventStream).
+        """
+        from wexample_event.common.async_event_stream import AsyncEventStream
+
+        return AsyncEventStream(
+            self, name, maxsize=maxsize, predicate=predicate, overflow=overflow
+        )
+
+    def subscribe_iter(
+        self,
+        name: str,
+        *,
+        maxsize: int = 1024,
+        block: bool = True,
+        predicate: Callable[[Event], bool] | None = None,
+    ) -> EventIterator:
+        """Subscribe to an event name as a blocking, bounded iterator.
+
+        Consume it from another thread than the dispatching one:
+
+            with dispatcher.subscribe_iter("row.imported", maxsize=10000) as rows:
+                for event in rows:
+                    ...
+        """
+        from wexample_event.common.event_iterator import EventIterator
+
+        return EventIterator(
+            self, name, maxsize=maxsize, block=block, predicate=predicate
+        )
+
+    async def wait_for(
+        self,
+        name: str,
+        predicate: Callable[[Event], bool] | None = None,
+        timeout: float | None = None,
+    ) -> Event:
+        """Wait for the next event matching the name and optional predicate.
+
+        The temporary listener is always removed, including on timeout
+        (which raises asyncio.TimeoutError) and cancellation.
+        """
+        loop = asyncio.get_running_loop()
+        loop_thread = threading.get_ident()
+        future: asyncio.Future[Event] = loop.create_future()
+
+        def resolve(event: Event) -> None:
+            if future.done():
+                return
+            try:
+                matched = predicate is None or predicate(event)
+            except Exception as exc:
+                future.set_exception(exc)
+                return
+            if matched:
+                future.set_result(event)
+
+        def listener(event: Event) -> None:
+            if future.done():
+                return
+            if threading.get_ident() == loop_thread:
+                resolve(event)
+            else:
+                loop.call_soon_threadsafe(resolve, event)
+
+        self.add_event_listener(name, listener)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.remove_event_listener(name, listener)
+
+    def _attach_event_child(self, child: EventDispatcherMixin) -> None:
+        """Account for the listeners of a subtree attached below this node.
+
+        Listener counts are propagated to ancestors as listeners come and go;
+        call this when linking a child that already has listeners (and
+        _detach_event_child when unlinking it) so broadcast does not skip it.
+        """
+        self._update_subtree_counts(dict(child._get_subtree_counts()))
+        if self._enable_ancestor_index:
+            child._invalidate_ancestor_counts()
+
+    def _claim_buckets(
+        self, event: Event, keys: tuple[EventKey, ...]
+    ) -> list[tuple[EventKey, ListenerBucket]]:
+        """Matching buckets of keys, with their once-listeners claimed.
+
+        Listeners whose filter rejects event are left out and keep their
+        place. Caller must hold the lock.
+        """
+        listeners, _, _ = self._ensure_dispatcher_state()
+        claimed = []
+        for key in keys:
+            bucket = listeners.get(key)
             if not bucket:
-                listeners.pop(name, None)
-            return len(bucket) != initial_length
+                continue
+            rejected = bucket.rejected_mask(event)
+            once_mask = bucket.once_mask & ~rejected
+            if once_mask:
+                remaining = bucket.without(once_mask)
+                self._publish_bucket(key, remaining)
+                if not remaining and isinstance(key, tuple):
+                    # Keep the lock-free path once filtered slots are gone.
+                    self._prune_filter_index(key[0])
+                tracer = self._event_tracer
+                if tracer is not None:
+                    tracer.on_once_removed(self, event, once_mask.bit_count())
+            bucket = bucket.without(rejected)
+            if bucket:
+                claimed.append((key, bucket))
+        return claimed
 
     def _coerce_event(
         self,
@@ -191,23 +813,149 @@ class EventDispatcherMixin:
             return event
 
         resolved_source = self if source is self._UNSET else source
-        return Event(
-            name=event, payload=payload, metadata=metadata, source=resolved_source
+        return Event._create(
+            event, metadata=metadata, payload=payload, source=resolved_source
         )
 
+    def _detach_event_child(self, child: EventDispatcherMixin) -> None:
+        """Counterpart of _attach_event_child for an unlinked subtree."""
+        self._update_subtree_counts(
+            {key: -count for key, count in child._get_subtree_counts().items()}
+        )
+        if self._enable_ancestor_index:
+            child._invalidate_ancestor_counts()
+
+    def _dispatch_into(
+        self,
+        event: Event,
+        policy: DispatchErrorPolicy,
+        result: DispatchResult | None,
+    ) -> None:
+        token = self._enter_dispatch(event)
+        tracer = self._event_tracer
+        try:
+            if tracer is not None:
+                tracer.on_dispatch_start(self, event)
+            self._propagate(event, policy, result)
+        finally:
+            if tracer is not None:
+                tracer.on_dispatch_end(self, event)
+            if token is not None:
+                dispatch_frame.reset(token)
+
+    async def _dispatch_into_async(
+        self,
+        event: Event,
+        policy: DispatchErrorPolicy,
+        result: DispatchResult | None,
+    ) -> None:
+        token = self._enter_dispatch(event)
+        tracer = self._event_tracer
+        try:
+            if tracer is not None:
+                tracer.on_dispatch_start(self, event)
+            await self._propagate_async(event, policy, result)
+        finally:
+            if tracer is not None:
+                tracer.on_dispatch_end(self, event)
+            if token is not None:
+                dispatch_frame.reset(token)
+
+    def _enter_dispatch(self, event: Event) -> Token[DispatchFrame | None] | None:
+        """Enter the frame of a new dispatch, checked against the cascade limits.
+
+        Dispatches started from a listener are nested under the dispatch
+        running it (tracked per thread and task, see current_dispatch).
+        _max_dispatch_depth bounds how deep such chains go, and
+        _max_cascade_fanout how many dispatches one dispatch's listeners
+        may start; exceeding either raises EventCascadeError from the
+        nested dispatch call, which the listener's error policy handles.
+
+        Returns the token resetting dispatch_frame, or None when this
+        dispatcher keeps no frames: without limits, cascade graph, tracer
+        or _track_dispatch_frames its dispatches are not tracked at all.
+        """
+        graph = self._event_cascade_graph
+        if (
+            graph is None
+            and self._event_tracer is None
+            and self._max_dispatch_depth is None
+            and self._max_cascade_fanout is None
+            and not self._track_dispatch_frames
+        ):
+            return None
+
+        parent = dispatch_frame.get()
+        if parent is None:
+            frame = DispatchFrame(dispatcher=self, event=event)
+        else:
+            frame = DispatchFrame(
+                dispatcher=self, event=event, depth=parent.depth + 1, parent=parent
+            )
+            max_depth = self._max_dispatch_depth
+            if max_depth is not None and frame.depth > max_depth:
+                raise EventCascadeError(frame, f"Dispatch depth exceeds {max_depth}")
+            parent.fanout += 1
+            max_fanout = self._max_cascade_fanout
+            if max_fanout is not None and parent.fanout > max_fanout:
+                raise EventCascadeError(
+                    frame,
+                    f"Cascade fan-out of '{parent.event.name}' exceeds {max_fanout}",
+                )
+
+        if graph is not None:
+            graph.record(None if parent is None else parent.event.name, event.name)
+        return dispatch_frame.set(frame)
+
     def _ensure_dispatcher_state(
         self,
-    ) -> tuple[dict[str, list[ListenerRecord]], threading.RLock, count]:
-        if not hasattr(self, self._LISTENERS_ATTR):
-            setattr(self, self._LISTENERS_ATTR, {})
-            setattr(self, self._LOCK_ATTR, threading.RLock())
-            setattr(self, self._ORDER_ATTR, count())
+    ) -> tuple[dict[str, ListenerBucket], threading.RLock, count]:
+        listeners = getattr(self, self._LISTENERS_ATTR, None)
+        if listeners is None:
+            with _STATE_LOCK:
+                listeners = getattr(self, self._LISTENERS_ATTR, None)
+                if listeners is None:
+                    setattr(self, self._FILTERS_ATTR, {})
+                    setattr(self, self._LOCK_ATTR, threading.RLock())
+                    setattr(self, self._ORDER_ATTR, count())
+                    listeners = {}
+                    # Published last, so whoever sees it sees the lock too.
+                    setattr(self, self._LISTENERS_ATTR, listeners)
         return (
-            getattr(self, self._LISTENERS_ATTR),
+            listeners,
             getattr(self, self._LOCK_ATTR),
             getattr(self, self._ORDER_ATTR),
         )
 
+    def _filter_slots(self, name: EventKey) -> list[tuple[Any, ...]]:
+        """Keys of the buckets holding the indexed filtered listeners of name."""
+        index = self._get_filter_index().get(name)
+        if not index:
+            return []
+        return [
+            (name, source, field, value)
+            for (source, field), values in index.items()
+            for value in values
+        ]
+
+    def _get_ancestor_counts(self) -> dict[EventKey, int]:
+        """Listeners per key on the dispatchers this one bubbles to.
+
+        Computed from the parent chain the first time they are needed, so
+        nodes linked after their ancestors registered listeners are counted
+        too; kept up to date by registrations from then on.
+        """
+        counts = getattr(self, self._ANCESTOR_ATTR, None)
+        if counts is None:
+            parent = self._get_bubbling_parent() if self._enable_bubbling else None
+            inherited = {} if parent is None else parent._get_inherited_counts()
+            with self._get_counts_lock():
+                counts = getattr(self, self._ANCESTOR_ATTR, None)
+                if counts is None:
+                    counts = inherited
+                    setattr(self, self._ANCESTOR_ATTR, counts)
+        return counts
+
     def _get_bubbling_parent(self) -> EventDispatcherMixin | None:
         """Override this method to return the parent dispatcher for event bubbling.
 
@@ -223,20 +971,594 @@ class EventDispatcherMixin:
         """
         return None
 
-    def _snapshot_listeners(
+    def _get_propagation_path(self, event: Event) -> list[EventDispatcherMixin]:
+        """Dispatchers the event bubbles to, nearest first.
+
+        With _enable_ancestor_index, the path is left empty without walking
+        it when no ancestor has a listener for the event.
+        """
+        if self._enable_ancestor_index:
+            counts = self._get_ancestor_counts()
+            if not counts or not any(
+                counts.get(key) for key in self._routing_keys(event)
+            ):
+                return []
+
+        path = []
+        node = self
+        while node._enable_bubbling:
+            node = node._get_bubbling_parent()
+            if node is None:
+                break
+            path.append(node)
+        return path
+
+    def _get_counts_lock(self) -> threading.Lock:
+        """Lock of this node's subtree and ancestor listener counts.
+
+        Count updates walk a tree one node at a time, never holding two of
+        these locks, so concurrent registrations on different nodes only
+        contend where their paths meet.
+        """
+        lock = getattr(self, self._COUNTS_LOCK_ATTR, None)
+        if lock is None:
+            with _STATE_LOCK:
+                lock = getattr(self, self._COUNTS_LOCK_ATTR, None)
+                if lock is None:
+                    lock = threading.Lock()
+                    setattr(self, self._COUNTS_LOCK_ATTR, lock)
+        return lock
+
+    def _get_event_children(self) -> Iterable[EventDispatcherMixin]:
+        """Override this method to return the child dispatchers of broadcast.
+
+        Children are expected to return this dispatcher from
+        _get_bubbling_parent, which keeps per-subtree listener counts
+        up to date. Counts are only maintained for classes overriding this
+        method or _get_bubbling_parent.
+        """
+        return ()
+
+    def _get_filter_index(
         self,
-        event: Event | str,
+    ) -> dict[EventKey, dict[tuple[str, str], frozenset[Any]]]:
+        """Indexed (source, field) pairs of each key, with their values."""
+        self._ensure_dispatcher_state()
+        return getattr(self, self._FILTERS_ATTR)
+
+    def _get_inherited_counts(self) -> dict[EventKey, int]:
+        """Listeners per key on this dispatcher and its ancestors."""
+        listeners, _, _ = self._ensure_dispatcher_state()
+        counts = dict(self._get_ancestor_counts())
+        for key, bucket in list(listeners.items()):
+            base = _base_key(key)
+            counts[base] = counts.get(base, 0) + len(bucket)
+        return counts
+
+    def _get_subtree_counts(self) -> dict[EventKey, int]:
+        """Listeners registered per key on this dispatcher and below it."""
+        counts = getattr(self, self._SUBTREE_ATTR, None)
+        if counts is None:
+            with self._get_counts_lock():
+                counts = getattr(self, self._SUBTREE_ATTR, None)
+                if counts is None:
+                    counts = {}
+                    setattr(self, self._SUBTREE_ATTR, counts)
+        return counts
+
+    def _handle_listener_error(
+        self,
+        event: Event,
+        callback: EventCallback,
+        error: Exception,
+        policy: DispatchErrorPolicy,
+    ) -> None:
+        if policy is DispatchErrorPolicy.RAISE_FIRST:
+            raise error
+        if policy is DispatchErrorPolicy.LOG_AND_CONTINUE:
+            logger.error(
+                "Listener %r failed while handling event '%s'",
+                callback,
+                event.name,
+                exc_info=error,
+            )
+
+    def _index_listener_filter(
+        self, name: EventKey, event_filter: EventFilter | None, once: bool
+    ) -> tuple[list[Any], EventFilter | None]:
+        """Keys a new listener is stored under, and the filter left to check.
+
+        The indexed condition holds for every event reaching the listener
+        through its keys, so only the other conditions are checked at
+        dispatch. A once-listener is never indexed under several values, as
+        firing it would only claim one of its copies. Caller must hold the
+        lock.
+        """
+        condition = (
+            None
+            if event_filter is None
+            else event_filter.index_condition(allow_in_set=not once)
+        )
+        if condition is None:
+            return [name], event_filter
+
+        filters = self._get_filter_index()
+        field = (condition.source, condition.field)
+        index = dict(filters.get(name, {}))
+        index[field] = index.get(field, frozenset()) | condition.values
+        # Replaced, never mutated, so dispatch can read it without locking.
+        filters[name] = index
+        return (
+            [(name, *field, value) for value in condition.values],
+            event_filter.without_condition(condition),
+        )
+
+    def _install_tracer(self) -> None:
+        """Combine the own tracer and metrics of this dispatcher."""
+        metrics = self._event_metrics
+        tracer = self._event_own_tracer
+        if metrics is None and tracer is None:
+            self.__dict__.pop("_event_tracer", None)
+        elif metrics is None:
+            self._event_tracer = tracer
+        elif tracer is None:
+            self._event_tracer = _MetricsTracerGroup(metrics)
+        else:
+            self._event_tracer = TracerGroup(metrics, tracer)
+
+    def _invalidate_ancestor_counts(self) -> None:
+        """Drop the ancestor counts of this subtree, recomputed when needed."""
+        stack: list[EventDispatcherMixin] = [self]
+        while stack:
+            node = stack.pop()
+            with node._get_counts_lock():
+                setattr(node, self._ANCESTOR_ATTR, None)
+            stack.extend(node._get_event_children())
+
+    def _invoke_phase(
+        self,
+        event: Event,
+        policy: DispatchErrorPolicy,
+        result: DispatchResult | None,
         *,
-        payload: Mapping[str, Any] | None,
-        metadata: Mapping[str, Any] | None,
-        source: Any | object,
-    ) -> tuple[Event, list[tuple[str, ListenerRecord]]]:
-        listeners, lock, _ = self._ensure_dispatcher_state()
-        dispatched_event = self._coerce_event(
-            event, payload=payload, metadata=metadata, source=source
+        capture: bool,
+        target: bool = False,
+    ) -> None:
+        if capture and not self._event_capture_enabled:
+            return
+        if target and self._event_sticky_events:
+            bucket = self._record_sticky_event(event)
+        else:
+            bucket = self._snapshot_event_bucket(event, capture=capture)
+        if bucket:
+            self._invoke_listeners(event, bucket, policy, result)
+
+    async def _invoke_phase_async(
+        self,
+        event: Event,
+        policy: DispatchErrorPolicy,
+        result: DispatchResult | None,
+        *,
+        capture: bool,
+        target: bool = False,
+    ) -> None:
+        if capture and not self._event_capture_enabled:
+            return
+        if target and self._event_sticky_events:
+            bucket = self._record_sticky_event(event)
+        else:
+            bucket = self._snapshot_event_bucket(event, capture=capture)
+        if bucket:
+            await self._invoke_listeners_async(event, bucket, policy, result)
+
+    def _invoke_listeners(
+        self,
+        event: Event,
+        bucket: ListenerBucket,
+        policy: DispatchErrorPolicy,
+        result: DispatchResult | None,
+    ) -> None:
+        tracer = self._event_tracer
+        index = 0
+        try:
+            for index, callback in enumerate(bucket.callbacks):
+                if tracer is not None:
+                    tracer.on_listener_start(self, event, callback)
+                started = perf_counter() if result is not None else 0.0
+                error: Exception | None = None
+                try:
+                    returned = callback(event)
+                    if inspect.isawaitable(returned):
+                        # Not awaited: close it so it is not left pending.
+                        close = getattr(returned, "close", None)
+                        if close is not None:
+                            close()
+                        raise RuntimeError(
+                            "Listener returned an awaitable; use dispatch_async for async listeners"
+                        )
+                except Exception as exc:
+                    error = exc
+
+                if tracer is not None:
+                    tracer.on_listener_end(self, event, callback, error)
+                if result is not None:
+                    result.outcomes.append(
+                        ListenerOutcome(
+                            callback=callback,
+                            duration=perf_counter() - started,
+                            error=error,
+                        )
+                    )
+                if error is not None:
+                    self._handle_listener_error(event, callback, error, policy)
+        except BaseException:
+            if bucket.once_mask >> (index + 1):
+                self._restore_once_records(event.name, bucket, index + 1)
+            raise
+
+    async def _invoke_listeners_async(
+        self,
+        event: Event,
+        bucket: ListenerBucket,
+        policy: DispatchErrorPolicy,
+        result: DispatchResult | None,
+    ) -> None:
+        tracer = self._event_tracer
+        index = 0
+        try:
+            for index, callback in enumerate(bucket.callbacks):
+                if tracer is not None:
+                    tracer.on_listener_start(self, event, callback)
+                started = perf_counter() if result is not None else 0.0
+                error: Exception | None = None
+                try:
+                    returned = callback(event)
+                    if inspect.isawaitable(returned):
+                        await returned
+                except Exception as exc:
+                    error = exc
+
+                if tracer is not None:
+                    tracer.on_listener_end(self, event, callback, error)
+                if result is not None:
+                    result.outcomes.append(
+                        ListenerOutcome(
+                            callback=callback,
+                            duration=perf_counter() - started,
+                            error=error,
+                        )
+                    )
+                if error is not None:
+                    self._handle_listener_error(event, callback, error, policy)
+        except BaseException:
+            if bucket.once_mask >> (index + 1):
+                self._restore_once_records(event.name, bucket, index + 1)
+            raise
+
+    def _kept_sticky_events(
+        self, name: EventKey, event_filter: EventFilter | None, once: bool
+    ) -> list[Event]:
+        """Return the kept events to replay. Caller must hold the lock."""
+        events = [
+            event
+            for event in self.get_sticky_events(name)
+            if event_filter is None or event_filter.matches(event)
+        ]
+        return events[-1:] if once else events
+
+    def _propagate(
+        self,
+        event: Event,
+        policy: DispatchErrorPolicy,
+        result: DispatchResult | None,
+    ) -> None:
+        """Run the capture, target and bubble phases of event.
+
+        The ancestor path is resolved once, then capture listeners run from
+        the root down to the target, the target's own listeners run, and
+        the event bubbles back up. A listener may end the propagation with
+        stop_propagation().
+        """
+        path = self._get_propagation_path(event)
+        if not path:
+            # A nested dispatch must not see, or stop, the propagation
+            # whose listener started it.
+            token = _clear_propagation_state()
+            try:
+                self._invoke_phase(event, policy, result, capture=True)
+                self._invoke_phase(event, policy, result, capture=False, target=True)
+            finally:
+                if token is not None:
+                    propagation_state.reset(token)
+            return
+
+        state = PropagationState(
+            current_target=self, phase=EventPhase.CAPTURE, target=self
+        )
+        token = propagation_state.set(state)
+        tracer = self._event_tracer
+        try:
+            for node in reversed(path):
+                state.current_target = node
+                if tracer is not None:
+                    tracer.on_bubble(node, event, EventPhase.CAPTURE)
+                node._invoke_phase(event, policy, result, capture=True)
+                if state.stopped:
+                    return
+
+            state.current_target = self
+            state.phase = EventPhase.TARGET
+            self._invoke_phase(event, policy, result, capture=True)
+            self._invoke_phase(event, policy, result, capture=False, target=True)
+
+            state.phase = EventPhase.BUBBLE
+            for node in path:
+                if state.stopped:
+                    return
+                state.current_target = node
+                if tracer is not None:
+                    tracer.on_bubble(node, event, EventPhase.BUBBLE)
+                node._invoke_phase(event, policy, result, capture=False)
+        finally:
+            propagation_state.reset(token)
+
+    async def _propagate_async(
+        self,
+        event: Event,
+        policy: DispatchErrorPolicy,
+        result: DispatchResult | None,
+    ) -> None:
+        path = self._get_propagation_path(event)
+        if not path:
+            token = _clear_propagation_state()
+            try:
+                await self._invoke_phase_async(event, policy, result, capture=True)
+                await self._invoke_phase_async(
+                    event, policy, result, capture=False, target=True
+                )
+            finally:
+                if token is not None:
+                    propagation_state.reset(token)
+            return
+
+        state = PropagationState(
+            current_target=self, phase=EventPhase.CAPTURE, target=self
+        )
+        token = propagation_state.set(state)
+        tracer = self._event_tracer
+        try:
+            for node in reversed(path):
+                state.current_target = node
+                if tracer is not None:
+                    tracer.on_bubble(node, event, EventPhase.CAPTURE)
+                await node._invoke_phase_async(event, policy, result, capture=True)
+                if state.stopped:
+                    return
+
+            state.current_target = self
+            state.phase = EventPhase.TARGET
+            await self._invoke_phase_async(event, policy, result, capture=True)
+            await self._invoke_phase_async(
+                event, policy, result, capture=False, target=True
+            )
+
+            state.phase = EventPhase.BUBBLE
+            for node in path:
+                if state.stopped:
+                    return
+                state.current_target = node
+                if tracer is not None:
+                    tracer.on_bubble(node, event, EventPhase.BUBBLE)
+                await node._invoke_phase_async(event, policy, result, capture=False)
+        finally:
+            propagation_state.reset(token)
+
+    def _prune_filter_index(self, name: EventKey) -> None:
+        """Drop indexed values left without listeners. Caller must hold the lock."""
+        listeners, _, _ = self._ensure_dispatcher_state()
+        filters = self._get_filter_index()
+        index = {}
+        for field, values in filters.get(name, {}).items():
+            kept = frozenset(
+                value for value in values if listeners.get((name, *field, value))
+            )
+            if kept:
+                index[field] = kept
+        if index:
+            filters[name] = index
+        else:
+            filters.pop(name, None)
+
+    def _publish_bucket(self, name: EventKey, bucket: ListenerBucket) -> None:
+        """Replace the bucket of an event name. Caller must hold the lock."""
+        listeners, _, _ = self._ensure_dispatcher_state()
+        previous = listeners.get(name)
+        if bucket:
+            listeners[name] = bucket
+        else:
+            listeners.pop(name, None)
+
+        delta = len(bucket) - (len(previous) if previous else 0)
+        if delta and _is_tree_class(type(self)):
+            deltas = {_base_key(name): delta}
+            self._update_subtree_counts(deltas)
+            if self._enable_ancestor_index:
+                # Registration costs grow with the subtree size.
+                for child in self._get_event_children():
+                    self._update_ancestor_counts(child, deltas)
+
+    def _record_sticky_event(self, event: Event) -> ListenerBucket | None:
+        """Keep a sticky event and return the target listeners to call.
+
+        Both happen under the lock add_event_listener registers and reads
+        the kept events with, so a listener registered with replay either
+        receives the event live or finds it kept, never both. Events stopped
+        before reaching the target are not kept: a listener registered
+        earlier would not have received them either.
+        """
+        _, lock, _ = self._ensure_dispatcher_state()
+        with lock:
+            sticky = self._event_sticky_events
+            for key in self._routing_keys(event):
+                events = sticky.get(key)
+                if events is not None:
+                    events.append(event)
+            return self._snapshot_event_bucket(event)
+
+    def _replay_sticky_events(
+        self, callback: EventCallback, events: list[Event]
+    ) -> None:
+        """Deliver kept events to a new listener, oldest first."""
+        bucket = ListenerBucket.from_records(
+            (ListenerRecord(callback=callback, once=False, order=0, priority=0),)
         )
+        policy = self._resolve_error_policy(None)
+        for event in events:
+            result = (
+                None
+                if policy is DispatchErrorPolicy.RAISE_FIRST
+                else DispatchResult(event=event)
+            )
+            self._invoke_listeners(event, bucket, policy, result)
+            if result is not None and policy is DispatchErrorPolicy.COLLECT:
+                result.raise_for_errors()
 
+    def _resolve_error_policy(
+        self, error_policy: DispatchErrorPolicy | str | None
+    ) -> DispatchErrorPolicy:
+        policy = self._event_error_policy if error_policy is None else error_policy
+        if type(policy) is DispatchErrorPolicy:
+            return policy
+        return DispatchErrorPolicy(policy)
+
+    def _restore_once_records(
+        self, name: EventKey, claimed: ListenerBucket, start: int
+    ) -> None:
+        """Give back once-listeners claimed by a dispatch that aborted before them."""
+        unrun: dict[EventKey, list[ListenerRecord]] = {}
+        for index in range(start, len(claimed)):
+            if claimed.is_once(index):
+                key = name if claimed.keys is None else claimed.keys[index]
+                unrun.setdefault(key, []).append(claimed.record(index))
+
+        listeners, lock, _ = self._ensure_dispatcher_state()
         with lock:
-            bucket = listeners.get(dispatched_event.name, [])
-            copied = [(dispatched_event.name, record) for record in list(bucket)]
-        return dispatched_event, copied
+            filters = self._get_filter_index()
+            for key, records in unrun.items():
+                current = listeners.get(key)
+                self._publish_bucket(
+                    key,
+                    ListenerBucket.from_records((*(current or ()), *records)),
+                )
+                if isinstance(key, tuple):
+                    # Claiming may have pruned the slot from the filter index.
+                    name, source, field, value = key
+                    index = dict(filters.get(name, {}))
+                    index[source, field] = index.get(
+                        (source, field), frozenset()
+                    ) | frozenset((value,))
+                    filters[name] = index
+
+    def _routing_keys(self, event: Event) -> tuple[EventKey, ...]:
+        if isinstance(event, TypedEvent):
+            return (*_resolve_routing_keys(type(event)), event.name)
+        return (event.name,)
+
+    def _snapshot_event_bucket(
+        self, event: Event, *, capture: bool = False
+    ) -> ListenerBucket | None:
+        """Return the listeners to call, claiming once-listeners atomically.
+
+        Buckets are immutable and replaced as a whole, so the common case
+        reads the published buckets without locking, filtered listeners
+        included. Once-listeners are detached from their bucket while the lock is held, so concurrent
+        dispatches cannot fire them twice.
+
+        Typed events reach listeners of their class, its Event bases and
+        their name, and filtered listeners are looked up through the filter
+        index of each of these keys; buckets are merged only when several
+        of them match. With capture, the capture listeners of these keys are
+        returned instead.
+        """
+        listeners, lock, _ = self._ensure_dispatcher_state()
+        filters = self._get_filter_index()
+        if not filters and not capture and not isinstance(event, TypedEvent):
+            bucket = listeners.get(event.name)
+            if bucket is None or not (bucket.once_mask or bucket.filters):
+                return bucket
+
+        keys = self._routing_keys(event)
+        if capture:
+            keys = tuple(CaptureKey(key) for key in keys)
+        if filters:
+            keys = (*keys, *_matching_filter_slots(event, keys, filters))
+
+        matched = [
+            (key, bucket)
+            for key, bucket in ((key, listeners.get(key)) for key in keys)
+            if bucket
+        ]
+        if any(bucket.once_mask for _, bucket in matched):
+            with lock:
+                matched = self._claim_buckets(event, keys)
+        elif any(bucket.filters for _, bucket in matched):
+            # Nothing to claim: rejected listeners are skipped without locking.
+            matched = [
+                (key, kept)
+                for key, kept in (
+                    (key, bucket.without(bucket.rejected_mask(event)))
+                    for key, bucket in matched
+                )
+                if kept
+            ]
+
+        if not matched:
+            return None
+        key, bucket = matched[0]
+        if len(matched) == 1 and (key == event.name or not bucket.once_mask):
+            return bucket
+        return ListenerBucket.merge(matched)
+
+    def _subtree_has_listeners(self, keys: tuple[EventKey, ...]) -> bool:
+        if not _is_tree_class(type(self)):
+            # Counts are not maintained outside trees: visit the node.
+            return True
+        counts = self._get_subtree_counts()
+        return any(counts.get(key) for key in keys)
+
+    def _update_ancestor_counts(
+        self, child: EventDispatcherMixin, deltas: dict[EventKey, int]
+    ) -> None:
+        """Apply ancestor listener count changes to a subtree below this node.
+
+        Nodes whose counts were never computed are skipped along with their
+        subtree: they will see the change when computing them.
+        """
+        stack = [child]
+        while stack:
+            node = stack.pop()
+            if _add_counts(node, self._ANCESTOR_ATTR, deltas, create=False):
+                stack.extend(node._get_event_children())
+
+    def _update_subtree_counts(self, deltas: dict[EventKey, int]) -> None:
+        """Apply listener count changes to this dispatcher and its ancestors."""
+        node: EventDispatcherMixin | None = self
+        while node is not None:
+            _add_counts(node, self._SUBTREE_ATTR, deltas)
+            node = node._get_bubbling_parent()
+
+
+class _MetricsTracerGroup(TracerGroup):
+    """Metrics of a dispatcher without a tracer of its own, then the global one.
+
+    The global tracer is looked up as hooks run, so it may be installed or
+    removed after metrics were enabled.
+    """
+
+    def __init__(self, metrics: DispatchMetrics) -> None:
+        self.metrics = metrics
+
+    @property
+    def tracers(self) -> tuple[DispatchTracer, ...]:
+        tracer = EventDispatcherMixin._event_tracer
+        return (self.metrics,) if tracer is None else (self.metrics, tracer)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class DispatchErrorPolicy(str, Enum):
+    """How a dispatcher reacts when a listener raises."""
+
+    COLLECT = "collect"
+    LOG_AND_CONTINUE = "log_and_continue"
+    RAISE_FIRST = "raise_first"
+
+
+DEFAULT_ERROR_POLICY: DispatchErrorPolicy = DispatchErrorPolicy.RAISE_FIRST
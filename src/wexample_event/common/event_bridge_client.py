@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from wexample_event.common.event_bridge_server import bridge_receiving
+from wexample_event.common.event_codec import EventCodec
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.event import Event
+    from wexample_event.dataclass.listener_record import EventKey
+
+logger = logging.getLogger(__name__)
+
+
+class EventBridgeClient:
+    """Forward events of a local dispatcher to a remote EventBridgeServer.
+
+    Events dispatched under the subscribed names are queued (up to
+    ``max_pending``, dropping the oldest beyond) and written in batches of
+    up to ``batch_size`` frames, or whatever is pending after
+    ``flush_interval`` seconds. When the connection fails the unsent batch
+    is requeued and the client reconnects after ``reconnect_delay``.
+    Events that cannot be encoded are logged and counted in ``dropped``.
+    """
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcherMixin,
+        names: Iterable[EventKey],
+        *,
+        path: str | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+        batch_size: int = 256,
+        flush_interval: float = 0.005,
+        reconnect_delay: float = 0.1,
+        max_pending: int = 65536,
+        codec_factory: Callable[[], EventCodec] = EventCodec,
+    ) -> None:
+        if path is None and port is None:
+            raise ValueError("Either path or port must be provided")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        self.batch_size = batch_size
+        self.codec_factory = codec_factory
+        self.dispatcher = dispatcher
+        self.dropped = 0
+        self.flush_interval = flush_interval
+        self.host = host
+        self.max_pending = max_pending
+        self.names = tuple(names)
+        self.path = path
+        self.port = port
+        self.reconnect_delay = reconnect_delay
+        self.sent = 0
+        self._closing = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._pending: deque[Event] = deque()
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    async def close(self) -> None:
+        """Flush pending events, then disconnect and unsubscribe."""
+        for name in self.names:
+            self.dispatcher.remove_event_listener(name, self._on_event)
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    async def start(self) -> None:
+        """Subscribe to the names and start the sender task on the running loop."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        for name in self.names:
+            self.dispatcher.add_event_listener(name, self._on_event)
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _connect(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self.path is not None:
+            return await asyncio.open_unix_connection(self.path)
+        return await asyncio.open_connection(self.host, self.port)
+
+    def _enqueue(self, event: Event) -> None:
+        if len(self._pending) >= self.max_pending:
+            self._pending.popleft()
+            self.dropped += 1
+        self._pending.append(event)
+        # The first event arms the flush_interval timer of an idle sender.
+        if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def _on_event(self, event: Event) -> None:
+        if event is bridge_receiving.get():
+            return
+        if threading.get_ident() == self._loop_thread:
+            self._enqueue(event)
+        else:
+            self._loop.call_soon_threadsafe(self._enqueue, event)
+
+    async def _run(self) -> None:
+        while not (self._closing and not self._pending):
+            try:
+                _, writer = await self._connect()
+            except OSError as exc:
+                if self._closing:
+                    logger.warning(
+                        "Dropping %d bridged events: %s", len(self._pending), exc
+                    )
+                    return
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            batch: list[Event] = []
+            try:
+                await self._send(writer, batch)
+            except OSError:
+                self._pending.extendleft(reversed(batch))
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                writer.close()
+
+    async def _send(self, writer: asyncio.StreamWriter, batch: list[Event]) -> None:
+        # Each connection starts a new stream of interned names.
+        codec = self.codec_factory()
+        while True:
+            await self._wait_for_batch()
+            if not self._pending:
+                return
+
+            batch.clear()
+            buffer = bytearray()
+            while self._pending and len(batch) < self.batch_size:
+                event = self._pending.popleft()
+                try:
+                    codec.encode_into(event, buffer)
+                except Exception:
+                    # encode_into leaves buffer and codec as they were.
+                    logger.exception("Dropping unencodable event '%s'", event.name)
+                    self.dropped += 1
+                    continue
+                batch.append(event)
+            if not batch:
+                continue
+
+            writer.write(buffer)
+            await writer.drain()
+            self.sent += len(batch)
+            batch.clear()
+
+    async def _wait_for_batch(self) -> None:
+        if self._closing:
+            return
+        if not self._pending:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        if len(self._pending) < self.batch_size and not self._closing:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextvars import ContextVar
+from struct import Struct
+from typing import TYPE_CHECKING
+
+from wexample_event.common.error_policy import DispatchErrorPolicy
+from wexample_event.common.event_codec import EventCodec
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.event import Event
+
+logger = logging.getLogger(__name__)
+
+# The bridged event being re-dispatched, so bridge clients on the same
+# dispatcher don't send it back where it came from; events its listeners
+# dispatch are forwarded as usual.
+bridge_receiving: ContextVar[Event | None] = ContextVar(
+    "bridge_receiving", default=None
+)
+
+_LENGTH = Struct(">I")
+
+
+class EventBridgeServer:
+    """Receive events from EventBridgeClient peers and dispatch them locally.
+
+    Listens on a Unix domain socket or a local TCP port. Each connection
+    carries a stream of EventCodec frames and gets its own codec, so
+    interned names are scoped to the connection.
+    """
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcherMixin,
+        *,
+        codec_factory: Callable[[], EventCodec] = EventCodec,
+    ) -> None:
+        self.codec_factory = codec_factory
+        self.dispatcher = dispatcher
+        self.received = 0
+        self._connections: set[asyncio.Task[None]] = set()
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def port(self) -> int | None:
+        """Bound TCP port, useful when started on port 0."""
+        if self._server is None or not self._server.sockets:
+            return None
+        address = self._server.sockets[0].getsockname()
+        return address[1] if isinstance(address, tuple) else None
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = await asyncio.start_server(self._handle, host, port)
+
+    async def start_unix(self, path: str) -> None:
+        self._server = await asyncio.start_unix_server(self._handle, path)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        codec = self.codec_factory()
+        try:
+            while True:
+                header = await reader.readexactly(_LENGTH.size)
+                body = await reader.readexactly(_LENGTH.unpack(header)[0])
+                event = codec.decode(header + body)
+                self.received += 1
+
+                token = bridge_receiving.set(event)
+                try:
+                    await self.dispatcher.dispatch_async(
+                        event, error_policy=DispatchErrorPolicy.LOG_AND_CONTINUE
+                    )
+                finally:
+                    bridge_receiving.reset(token)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError:
+            logger.exception("Closing bridge connection after an invalid frame")
+        finally:
+            self._connections.discard(task)
+            writer.close()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+from struct import Struct
+from typing import Any
+
+from wexample_event.common.value_packer import PackDefault, pack_value, unpack_value
+from wexample_event.dataclass.event import Event
+from wexample_event.dataclass.typed_event import TypedEvent
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_FRAME_HEADER = Struct(">IB")
+_TYPED_BASE_FIELDS = frozenset(item.name for item in fields(TypedEvent))
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Integer nanoseconds since the Unix epoch, as stored in frames."""
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def ns_to_datetime(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value // 1000)
+
+
+class EventCodec:
+    """Compact, versioned binary codec for Event objects.
+
+    Each event is written as a frame: a 4-byte big-endian body length, a
+    version byte, then a MessagePack array holding the name, the timestamp
+    as integer nanoseconds, payload, metadata and a source reference. Typed
+    events additionally carry their registered type and their fields.
+
+    With ``intern_names`` enabled, names repeated within a stream are sent
+    as small integers. Encoder and decoder tables then evolve frame by frame:
+    frames must be decoded in the order they were encoded, by a codec that
+    saw every previous frame of the stream (see ``reset``).
+
+    ``source`` objects are never serialized; ``source_ref`` maps them to a
+    reference ID and ``resolve_source`` maps IDs back on decode.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        *,
+        intern_names: bool = True,
+        source_ref: Callable[[Any], Any] | None = None,
+        resolve_source: Callable[[Any], Any] | None = None,
+        event_types: Iterable[type[TypedEvent]] = (),
+        default: PackDefault | None = None,
+    ) -> None:
+        self.default = default
+        self.intern_names = intern_names
+        self.resolve_source = resolve_source
+        self.source_ref = source_ref
+        self._decode_names: list[str] = []
+        self._encode_names: dict[str, int] = {}
+        self._event_types: dict[str, type[TypedEvent]] = {}
+
+        for event_type in event_types:
+            self.register_event_type(event_type)
+
+    @staticmethod
+    def type_key(event_type: type[Event]) -> str:
+        return f"{event_type.__module__}:{event_type.__qualname__}"
+
+    def decode(self, data: bytes | bytearray | memoryview) -> Event:
+        """Decode a single frame."""
+        event, _ = self.decode_from(data)
+        return event
+
+    def decode_from(
+        self, data: bytes | bytearray | memoryview, offset: int = 0
+    ) -> tuple[Event, int]:
+        """Decode the frame starting at offset; return it and the next offset."""
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        length, version = _FRAME_HEADER.unpack_from(view, offset)
+        if version != self.VERSION:
+            raise ValueError(f"Unsupported event frame version {version}")
+
+        end = offset + 4 + length
+        fields_, _ = unpack_value(view[:end], offset + _FRAME_HEADER.size)
+        return self._build_event(fields_), end
+
+    def encode(self, event: Event) -> bytes:
+        buffer = bytearray()
+        self.encode_into(event, buffer)
+        return bytes(buffer)
+
+    def encode_into(self, event: Event, buffer: bytearray) -> int:
+        """Append the frame of event to buffer; return the number of bytes written.
+
+        If event cannot be encoded, buffer and the interned names are left as
+        they were, so the stream stays decodable.
+        """
+        start = len(buffer)
+        interned = len(self._encode_names)
+        try:
+            buffer += _FRAME_HEADER.pack(0, self.VERSION)
+
+            source = event.source
+            fields_: list[Any] = [
+                self._encode_name(event.name),
+                datetime_to_ns(event.timestamp),
+                event.payload,
+                event.metadata,
+                (
+                    None
+                    if source is None or self.source_ref is None
+                    else self.source_ref(source)
+                ),
+            ]
+            if isinstance(event, TypedEvent):
+                fields_.append(self._encode_name(self.type_key(type(event))))
+                fields_.append(
+                    {
+                        item.name: getattr(event, item.name)
+                        for item in fields(event)
+                        if item.name not in _TYPED_BASE_FIELDS
+                    }
+                )
+            pack_value(fields_, buffer, self.default)
+        except BaseException:
+            del buffer[start:]
+            # Names are interned in insertion order: drop the ones added here.
+            while len(self._encode_names) > interned:
+                self._encode_names.popitem()
+            raise
+
+        written = len(buffer) - start
+        _FRAME_HEADER.pack_into(buffer, start, written - 4, self.VERSION)
+        return written
+
+    def iter_decode(
+        self, data: bytes | bytearray | memoryview, offset: int = 0
+    ) -> Iterator[Event]:
+        """Decode consecutive frames until the end of data."""
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        size = len(view)
+        while offset < size:
+            event, offset = self.decode_from(view, offset)
+            yield event
+
+    def register_event_type(self, event_type: type[TypedEvent]) -> None:
+        if not issubclass(event_type, TypedEvent):
+            raise TypeError("event_type must be a TypedEvent subclass")
+        self._event_types[self.type_key(event_type)] = event_type
+
+    def reset(self) -> None:
+        """Forget interned names, e.g. when starting a new stream or segment."""
+        self._decode_names.clear()
+        self._encode_names.clear()
+
+    def _build_event(self, fields_: list[Any]) -> Event:
+        name = self._decode_name(fields_[0])
+        timestamp = ns_to_datetime(fields_[1])
+        source = fields_[4]
+        if source is not None and self.resolve_source is not None:
+            source = self.resolve_source(source)
+
+        if len(fields_) == 5:
+            return Event._create(
+                name,
+                metadata=fields_[3],
+                payload=fields_[2],
+                source=source,
+                timestamp=timestamp,
+            )
+
+        type_key = self._decode_name(fields_[5])
+        event_type = self._event_types.get(type_key)
+        if event_type is None:
+            raise ValueError(f"Unknown typed event '{type_key}'")
+        return event_type(
+            name=name,
+            metadata=fields_[3],
+            payload=fields_[2],
+            source=source,
+            timestamp=timestamp,
+            **fields_[6],
+        )
+
+    def _decode_name(self, value: str | int) -> str:
+        if isinstance(value, int):
+            return self._decode_names[value]
+        if self.intern_names:
+            self._decode_names.append(value)
+        return value
+
+    def _encode_name(self, name: str) -> str | int:
+        if not self.intern_names:
+            return name
+        index = self._encode_names.get(name)
+        if index is not None:
+            return index
+        self._encode_names[name] = len(self._encode_names)
+        return name
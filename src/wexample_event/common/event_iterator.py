@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.event import Event
+
+
+class EventIterator:
+    """Blocking iterator over dispatched events, backed by a ring buffer.
+
+    Meant to be consumed from a different thread than the one dispatching.
+    When the buffer is full and ``block`` is true, the dispatching thread
+    waits for the consumer (backpressure); otherwise the oldest event is
+    overwritten and counted in ``dropped``. Iteration ends once the
+    iterator is closed and the buffer is drained.
+    """
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcherMixin,
+        name: str,
+        *,
+        maxsize: int = 1024,
+        block: bool = True,
+        predicate: Callable[[Event], bool] | None = None,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.block = block
+        self.dispatcher = dispatcher
+        self.dropped = 0
+        self.maxsize = maxsize
+        self.name = name
+        self.predicate = predicate
+        self._buffer: list[Event | None] = [None] * maxsize
+        self._closed = False
+        self._condition = threading.Condition()
+        self._head = 0
+        self._size = 0
+
+        dispatcher.add_event_listener(name, self._on_event)
+
+    def __enter__(self) -> EventIterator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __iter__(self) -> EventIterator:
+        return self
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __next__(self) -> Event:
+        event = self.get()
+        if event is None:
+            raise StopIteration
+        return event
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Unsubscribe and wake any waiting producer or consumer."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self.dispatcher.remove_event_listener(self.name, self._on_event)
+
+    def get(self, timeout: float | None = None) -> Event | None:
+        """Pop the next event, waiting for one if needed.
+
+        Returns None when closed and drained, or when the timeout expires.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._size or self._closed, timeout
+            ):
+                return None
+            if not self._size:
+                return None
+
+            event = self._buffer[self._head]
+            self._buffer[self._head] = None
+            self._head = (self._head + 1) % self.maxsize
+            self._size -= 1
+            self._condition.notify_all()
+            return event
+
+    def _on_event(self, event: Event) -> None:
+        if self.predicate is not None and not self.predicate(event):
+            return
+
+        with self._condition:
+            if self.block:
+                self._condition.wait_for(
+                    lambda: self._size < self.maxsize or self._closed
+                )
+            if self._closed:
+                return
+
+            if self._size == self.maxsize:
+                # Overwrite the oldest slot.
+                self._head = (self._head + 1) % self.maxsize
+                self._size -= 1
+                self.dropped += 1
+
+            self._buffer[(self._head + self._size) % self.maxsize] = event
+            self._size += 1
+            self._condition.notify_all()
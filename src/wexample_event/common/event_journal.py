@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from struct import Struct
+from time import monotonic
+from typing import IO, TYPE_CHECKING
+
+from wexample_event.common.event_codec import EventCodec
+from wexample_event.common.journal_sync_policy import (
+    DEFAULT_JOURNAL_SYNC_POLICY,
+    JournalSyncPolicy,
+)
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.event import Event
+    from wexample_event.dataclass.listener_record import EventKey
+
+SEGMENT_HEADER = Struct(">4sB3x")
+SEGMENT_MAGIC = b"WEVJ"
+SEGMENT_SUFFIX = ".evj"
+SEGMENT_VERSION = 1
+
+
+def segment_path(directory: Path, index: int) -> Path:
+    return directory / f"{index:012d}{SEGMENT_SUFFIX}"
+
+
+class EventJournal:
+    """Append-only, segmented journal of dispatched events.
+
+    Use it as a listener (``attach`` or ``record``). Events are appended as
+    EventCodec frames to the current segment, and a new segment starts once
+    ``segment_size`` bytes are reached; each segment is a standalone codec
+    stream. With the batch sync policy, data is fsynced every
+    ``sync_every`` events or ``sync_interval`` seconds, whichever comes first;
+    a timer syncs the last batch once appends stop.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        segment_size: int = 64 << 20,
+        sync_policy: JournalSyncPolicy | str = DEFAULT_JOURNAL_SYNC_POLICY,
+        sync_every: int = 1024,
+        sync_interval: float = 1.0,
+        codec_factory: Callable[[], EventCodec] = EventCodec,
+    ) -> None:
+        self.codec_factory = codec_factory
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.sync_policy = JournalSyncPolicy(sync_policy)
+        self._attached: list[tuple[EventDispatcherMixin, EventKey]] = []
+        self._buffer = bytearray()
+        self._codec: EventCodec | None = None
+        self._file: IO[bytes] | None = None
+        self._last_sync = monotonic()
+        self._lock = threading.Lock()
+        self._segment_index = -1
+        self._segment_offset = 0
+        self._sync_timer: threading.Timer | None = None
+        self._unsynced = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> EventJournal:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def attach(
+        self, dispatcher: EventDispatcherMixin, names: Iterable[EventKey]
+    ) -> None:
+        """Record every event dispatched under the given names."""
+        for name in names:
+            dispatcher.add_event_listener(name, self.record)
+            self._attached.append((dispatcher, name))
+
+    def close(self) -> None:
+        """Detach, sync and close the current segment."""
+        for dispatcher, name in self._attached:
+            dispatcher.remove_event_listener(name, self.record)
+        self._attached.clear()
+
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._file is not None:
+                self._close_segment()
+
+    def flush(self) -> None:
+        """Push buffered writes to the OS and fsync them."""
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+
+    def record(self, event: Event) -> None:
+        """Append one event; usable directly as a listener callback.
+
+        An event that cannot be encoded raises without writing anything, so
+        the segment stays readable.
+        """
+        with self._lock:
+            if self._file is None or self._segment_offset >= self.segment_size:
+                self._open_next_segment()
+
+            buffer = self._buffer
+            buffer.clear()
+            written = self._codec.encode_into(event, buffer)
+            self._file.write(buffer)
+            self._on_appended(event, self._segment_offset)
+            self._segment_offset += written
+            self._unsynced += 1
+
+            if self.sync_policy is JournalSyncPolicy.ALWAYS:
+                self._sync()
+            elif self.sync_policy is JournalSyncPolicy.BATCH:
+                if (
+                    self._unsynced >= self.sync_every
+                    or monotonic() - self._last_sync >= self.sync_interval
+                ):
+                    self._sync()
+                elif self._sync_timer is None:
+                    self._sync_timer = threading.Timer(
+                        self.sync_interval, self._sync_pending
+                    )
+                    self._sync_timer.daemon = True
+                    self._sync_timer.start()
+
+    def _close_segment(self) -> None:
+        self._sync()
+        self._file.close()
+        self._file = None
+
+    def _on_appended(self, event: Event, offset: int) -> None:
+        """Hook called under the lock for every appended frame."""
+
+    def _open_next_segment(self) -> None:
+        if self._file is not None:
+            self._close_segment()
+        if self._segment_index < 0:
+            existing = sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+            self._segment_index = int(existing[-1].stem) if existing else -1
+
+        self._segment_index += 1
+        self._file = open(segment_path(self.directory, self._segment_index), "xb")
+        self._file.write(SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION))
+        self._segment_offset = SEGMENT_HEADER.size
+        self._codec = self.codec_factory()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        if self.sync_policy is not JournalSyncPolicy.NEVER:
+            os.fsync(self._file.fileno())
+        self._last_sync = monotonic()
+        self._unsynced = 0
+
+    def _sync_pending(self) -> None:
+        """Timer callback syncing a batch left behind by the last append."""
+        with self._lock:
+            self._sync_timer = None
+            if self._file is not None and self._unsynced:
+                self._sync()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wexample_event.common.event_codec import EventCodec
+from wexample_event.common.event_journal import (
+    SEGMENT_HEADER,
+    SEGMENT_MAGIC,
+    SEGMENT_SUFFIX,
+    SEGMENT_VERSION,
+)
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.event import Event
+
+_FRAME_LENGTH_SIZE = 4
+
+
+class EventJournalReader:
+    """Read and replay the segments written by an EventJournal.
+
+    Segments are memory-mapped and decoded in place. A frame cut short by a
+    crash at the end of a segment is ignored.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        codec_factory: Callable[[], EventCodec] = EventCodec,
+    ) -> None:
+        self.codec_factory = codec_factory
+        self.directory = Path(directory)
+
+    def iter_events(
+        self,
+        names: Iterable[str] | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[Event]:
+        """Yield journaled events in order, optionally filtered.
+
+        ``since`` is inclusive and ``until`` exclusive.
+        """
+        wanted = None if names is None else frozenset(names)
+        for path in self.segments():
+            for event in self._iter_segment(path):
+                if wanted is not None and event.name not in wanted:
+                    continue
+                if since is not None and event.timestamp < since:
+                    continue
+                if until is not None and event.timestamp >= until:
+                    continue
+                yield event
+
+    def replay(
+        self,
+        dispatcher: EventDispatcherMixin,
+        names: Iterable[str] | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> int:
+        """Dispatch journaled events on dispatcher; return how many were replayed."""
+        count = 0
+        for event in self.iter_events(names, since=since, until=until):
+            dispatcher.dispatch(event)
+            count += 1
+        return count
+
+    def segments(self) -> list[Path]:
+        return sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def _iter_frames(
+        self, view: memoryview, codec: EventCodec, offset: int
+    ) -> Iterator[Event]:
+        size = len(view)
+        while offset + _FRAME_LENGTH_SIZE <= size:
+            end = (
+                offset
+                + _FRAME_LENGTH_SIZE
+                + int.from_bytes(view[offset : offset + _FRAME_LENGTH_SIZE], "big")
+            )
+            if end > size:
+                # Torn write at the tail of the segment.
+                return
+            event, offset = codec.decode_from(view, offset)
+            yield event
+
+    def _iter_segment(self, path: Path) -> Iterator[Event]:
+        with self._open_segment(path) as view:
+            if view is not None:
+                yield from self._iter_frames(
+                    view, self.codec_factory(), SEGMENT_HEADER.size
+                )
+
+    @contextmanager
+    def _open_segment(self, path: Path) -> Iterator[memoryview | None]:
+        """Memory-map a segment, yielding None when it holds no frame."""
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size <= SEGMENT_HEADER.size:
+                yield None
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    magic, version = SEGMENT_HEADER.unpack_from(view, 0)
+                    if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+                        raise ValueError(f"'{path}' is not an event journal segment")
+                    yield view
+                finally:
+                    view.release()
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class EventPhase(IntEnum):
+    """Phases of an event travelling through a dispatcher tree."""
+
+    CAPTURE = 1
+    TARGET = 2
+    BUBBLE = 3
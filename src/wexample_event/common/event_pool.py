@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from wexample_event.dataclass.event import Event
+
+
+class EventPool:
+    """Free-list of Event objects for tight dispatch loops.
+
+    Released events are recycled by the next acquire, so callers must only
+    release events that no listener kept a reference to. Acquire and release
+    rely on list.append/list.pop being atomic and may be shared by threads.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+
+        self.maxsize = maxsize
+        self._free: list[Event] = []
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(
+        self,
+        name: str,
+        *,
+        payload: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        source: Any | None = None,
+        timestamp: datetime | None = None,
+    ) -> Event:
+        """Return a recycled (or new) event initialised with the given fields."""
+        try:
+            instance = self._free.pop()
+        except IndexError:
+            instance = None
+        return Event._create(
+            name,
+            metadata=metadata,
+            payload=payload,
+            source=source,
+            timestamp=timestamp,
+            instance=instance,
+        )
+
+    def clear(self) -> None:
+        self._free.clear()
+
+    def release(self, event: Event) -> None:
+        """Hand an event back to the pool. Subclasses of Event are not pooled."""
+        if type(event) is not Event or len(self._free) >= self.maxsize:
+            return
+        # Drop references so pooled events don't keep payloads or sources alive.
+        Event._create("", instance=event, timestamp=event.timestamp)
+        self._free.append(event)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from contextvars import ContextVar
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from wexample_event.common.dispatch_tracer import DispatchTracer
+from wexample_event.common.propagation import current_propagation
+from wexample_event.dataclass.trace_span import TraceSpan
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.common.event_phase import EventPhase
+    from wexample_event.dataclass.event import Event
+    from wexample_event.dataclass.listener_record import EventCallback
+
+
+def _callback_name(callback: EventCallback) -> str:
+    callback = getattr(callback, "__wrapped__", callback)
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+class InMemoryTracer(DispatchTracer):
+    """Tracer recording nested dispatch and listener spans in memory.
+
+    Every dispatch becomes a span whose children are the listener calls it
+    made; a dispatch started from inside a listener is nested under that
+    listener's span, so ``roots`` holds one tree per top-level dispatch.
+    Nesting follows the running context, hence threads and asyncio tasks
+    each build their own branch.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = perf_counter) -> None:
+        self.clock = clock
+        self.roots: list[TraceSpan] = []
+        self._current: ContextVar[TraceSpan | None] = ContextVar(
+            f"in_memory_tracer_{id(self)}", default=None
+        )
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.roots = []
+
+    def on_bubble(
+        self, dispatcher: EventDispatcherMixin, event: Event, phase: EventPhase
+    ) -> None:
+        span = self._current.get()
+        if span is not None:
+            span.hops.append((phase, dispatcher))
+
+    def on_dispatch_end(self, dispatcher: EventDispatcherMixin, event: Event) -> None:
+        self._pop("dispatch")
+
+    def on_dispatch_start(self, dispatcher: EventDispatcherMixin, event: Event) -> None:
+        self._push(
+            TraceSpan(
+                dispatcher=dispatcher,
+                kind="dispatch",
+                name=event.name,
+                started=self.clock(),
+            )
+        )
+
+    def on_listener_end(
+        self,
+        dispatcher: EventDispatcherMixin,
+        event: Event,
+        callback: EventCallback,
+        error: Exception | None,
+    ) -> None:
+        span = self._pop("listener")
+        if span is not None:
+            span.error = error
+
+    def on_listener_start(
+        self, dispatcher: EventDispatcherMixin, event: Event, callback: EventCallback
+    ) -> None:
+        state = current_propagation()
+        self._push(
+            TraceSpan(
+                callback=callback,
+                dispatcher=dispatcher,
+                kind="listener",
+                name=_callback_name(callback),
+                phase=None if state is None else state.phase,
+                started=self.clock(),
+            )
+        )
+
+    def render(self) -> str:
+        """Indented text view of the recorded spans, with durations in ms."""
+        lines = []
+        for root in list(self.roots):
+            for depth, span in root.walk():
+                duration = span.duration
+                timing = "running" if duration is None else f"{duration * 1000:.3f}ms"
+                failed = "" if span.error is None else f" !{type(span.error).__name__}"
+                lines.append(f"{'  ' * depth}{span.kind} {span.name} {timing}{failed}")
+        return "\n".join(lines)
+
+    def _pop(self, kind: str) -> TraceSpan | None:
+        # Close spans left open by a listener interrupted by a BaseException.
+        span = self._current.get()
+        ended = self.clock()
+        while span is not None and span.kind != kind:
+            span.ended = ended
+            span = span.parent
+        if span is not None:
+            span.ended = ended
+            self._current.set(span.parent)
+        return span
+
+    def _push(self, span: TraceSpan) -> None:
+        parent = self._current.get()
+        span.parent = parent
+        if parent is None:
+            with self._lock:
+                self.roots.append(span)
+        else:
+            parent.children.append(span)
+        self._current.set(span)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from wexample_event.common.event_codec import EventCodec, datetime_to_ns
+from wexample_event.common.event_journal import EventJournal, segment_path
+from wexample_event.dataclass.journal_segment_index import JournalSegmentIndex
+
+if TYPE_CHECKING:
+    from wexample_event.dataclass.event import Event
+
+INDEX_SUFFIX = ".evx"
+
+
+def index_path(segment: Path) -> Path:
+    return segment.with_suffix(INDEX_SUFFIX)
+
+
+def uninterned_codec() -> EventCodec:
+    # Indexed frames are decoded by seeking straight to their offset, so
+    # they cannot depend on names interned by earlier frames.
+    return EventCodec(intern_names=False)
+
+
+class IndexedEventJournal(EventJournal):
+    """EventJournal maintaining a sparse JournalSegmentIndex per segment.
+
+    The index is updated on every append and saved next to the segment when
+    it is closed, on flush() and on close(). Frames appended after the last
+    save are still found by readers, which scan past the indexed end.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        bucket_seconds: float = 60.0,
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("codec_factory", uninterned_codec)
+        super().__init__(directory, **kwargs)
+        self.bucket_ns = int(bucket_seconds * 10**9)
+        self._index: JournalSegmentIndex | None = None
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._save_index()
+
+    def _close_segment(self) -> None:
+        super()._close_segment()
+        self._save_index()
+
+    def _on_appended(self, event: Event, offset: int) -> None:
+        self._index.add(event.name, datetime_to_ns(event.timestamp), offset)
+
+    def _open_next_segment(self) -> None:
+        super()._open_next_segment()
+        self._index = JournalSegmentIndex(bucket_ns=self.bucket_ns)
+
+    def _save_index(self) -> None:
+        index = self._index
+        index.end_offset = self._segment_offset
+        path = index_path(segment_path(self.directory, self._segment_index))
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(index.to_bytes())
+        os.replace(temporary, path)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wexample_event.common.event_codec import EventCodec, datetime_to_ns
+from wexample_event.common.event_journal import SEGMENT_HEADER
+from wexample_event.common.event_journal_reader import EventJournalReader
+from wexample_event.common.indexed_event_journal import (
+    index_path,
+    uninterned_codec,
+)
+from wexample_event.dataclass.journal_segment_index import JournalSegmentIndex
+
+if TYPE_CHECKING:
+    from wexample_event.dataclass.event import Event
+
+
+class IndexedEventJournalReader(EventJournalReader):
+    """Query the segments of an IndexedEventJournal through their indexes.
+
+    Names are glob patterns (``order.*``). Segments whose index lies outside
+    the requested time range are skipped without being opened, and only the
+    candidate frames listed by the index are decoded. Segments without an
+    index, and frames appended after it was saved, are scanned.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        codec_factory: Callable[[], EventCodec] = uninterned_codec,
+    ) -> None:
+        super().__init__(directory, codec_factory=codec_factory)
+
+    def iter_events(
+        self,
+        names: Iterable[str] | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[Event]:
+        patterns = None if names is None else frozenset(names)
+        since_ns = None if since is None else datetime_to_ns(since)
+        until_ns = None if until is None else datetime_to_ns(until)
+
+        for path in self.segments():
+            index = self.load_index(path)
+            if index is None:
+                candidates = self._iter_segment(path)
+            elif index.end_offset >= path.stat().st_size and not index.overlaps(
+                since_ns, until_ns
+            ):
+                continue
+            else:
+                candidates = self._iter_indexed(
+                    path, index, index.offsets(patterns, since_ns, until_ns)
+                )
+
+            for event in candidates:
+                if _matches(event, patterns, since, until):
+                    yield event
+
+    def load_index(self, segment: Path) -> JournalSegmentIndex | None:
+        """Index saved for the segment, or None when it has none."""
+        try:
+            data = index_path(segment).read_bytes()
+        except FileNotFoundError:
+            return None
+        return JournalSegmentIndex.from_bytes(data)
+
+    def _iter_indexed(
+        self, path: Path, index: JournalSegmentIndex, offsets: list[int]
+    ) -> Iterator[Event]:
+        with self._open_segment(path) as view:
+            if view is None:
+                return
+            codec = self.codec_factory()
+            for offset in offsets:
+                event, _ = codec.decode_from(view, offset)
+                yield event
+            yield from self._iter_frames(
+                view, codec, max(index.end_offset, SEGMENT_HEADER.size)
+            )
+
+
+def _matches(
+    event: Event,
+    patterns: frozenset[str] | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> bool:
+    if since is not None and event.timestamp < since:
+        return False
+    if until is not None and event.timestamp >= until:
+        return False
+    if patterns is None or event.name in patterns:
+        return True
+    return any(fnmatchcase(event.name, pattern) for pattern in patterns)
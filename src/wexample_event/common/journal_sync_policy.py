@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class JournalSyncPolicy(str, Enum):
+    """When an event journal forces appended data to disk."""
+
+    ALWAYS = "always"
+    BATCH = "batch"
+    NEVER = "never"
+
+
+DEFAULT_JOURNAL_SYNC_POLICY: JournalSyncPolicy = JournalSyncPolicy.BATCH
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
 from typing import Any
 
+from wexample_event.common.cached_listener import DEFAULT_CACHE_SIZE, CachedListener
 from wexample_event.common.dispatcher import EventDispatcherMixin
 from wexample_event.common.listener_state import ListenerState
 from wexample_event.common.priority import DEFAULT_PRIORITY, EventPriority
-from wexample_event.dataclass.listener_record import EventCallback
+from wexample_event.dataclass.event import Event
+from wexample_event.dataclass.event_filter import EventFilter
+from wexample_event.dataclass.listener_record import EventCallback, EventKey
 from wexample_event.dataclass.listener_spec import ListenerSpec
 
 
@@ -19,17 +22,43 @@ class EventListenerMixin:
     @classmethod
     def on(
         cls,
-        event_name: str,
+        event_name: EventKey,
         *,
         priority: int | EventPriority = DEFAULT_PRIORITY,
         once: bool = False,
+        where: Mapping[str, Any] | None = None,
+        capture: bool = False,
+        replay: bool = False,
+        cache_key: Callable[[Event], Hashable] | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        cache_ttl: float | None = None,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-        """Decorator to declare a method as an event listener."""
+        """Decorator to declare a method as an event listener.
+
+        event_name may also be a TypedEvent subclass to listen by class;
+        where, capture and replay behave as for add_event_listener.
+
+        With cache_key, results are memoized per bound instance in an LRU
+        cache of cache_size entries expiring after cache_ttl seconds (see
+        CachedListener); its statistics are reported by the dispatcher's
+        get_listener_cache_stats.
+        """
+        event_filter = None if where is None else EventFilter.from_mapping(where)
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             specs = list(getattr(func, cls._LISTENER_MARK_ATTR, ()))
             specs.append(
-                ListenerSpec(name=event_name, priority=int(priority), once=once)
+                ListenerSpec(
+                    name=event_name,
+                    priority=int(priority),
+                    once=once,
+                    filter=event_filter,
+                    capture=capture,
+                    replay=replay,
+                    cache_key=cache_key,
+                    cache_size=cache_size,
+                    cache_ttl=cache_ttl,
+                )
             )
             setattr(func, cls._LISTENER_MARK_ATTR, tuple(specs))
             return func
@@ -50,17 +79,30 @@ class EventListenerMixin:
             self.unbind_from_dispatcher()
             state = self._ensure_listener_state()
 
-        bindings: list[tuple[str, EventCallback]] = []
+        bindings: list[tuple[EventKey, EventCallback, bool]] = []
         for method_name, specs in self._iter_declared_listener_specs():
             bound_callback = getattr(self, method_name)
             for spec in specs:
+                callback = (
+                    bound_callback
+                    if spec.cache_key is None
+                    else CachedListener(
+                        bound_callback,
+                        spec.cache_key,
+                        maxsize=spec.cache_size,
+                        ttl=spec.cache_ttl,
+                    )
+                )
                 dispatcher.add_event_listener(
                     spec.name,
-                    bound_callback,
+                    callback,
                     once=spec.once,
                     priority=spec.priority,
+                    where=spec.filter,
+                    capture=spec.capture,
+                    replay=spec.replay,
                 )
-                bindings.append((spec.name, bound_callback))
+                bindings.append((spec.name, callback, spec.capture))
 
         state.dispatcher = dispatcher
         state.bindings = bindings
@@ -77,8 +119,8 @@ class EventListenerMixin:
         if dispatcher is None:
             return
 
-        for name, callback in state.bindings:
-            dispatcher.remove_event_listener(name, callback)
+        for name, callback, capture in state.bindings:
+            dispatcher.remove_event_listener(name, callback, capture=capture)
 
         state.dispatcher = None
         state.bindings = []
@@ -3,11 +3,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from wexample_event.dataclass.listener_record import EventCallback
+    from wexample_event.dataclass.listener_record import EventCallback, EventKey
 
 
 class ListenerState:
-    bindings: list[tuple[str, EventCallback]]
+    # (name, callback, capture) of every registered listener.
+    bindings: list[tuple[EventKey, EventCallback, bool]]
     dispatcher: EventDispatcherMixin | None  # type: ignore[name-defined]
 
     def __init__(self) -> None:
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+from collections.abc import Iterable
+from multiprocessing import resource_tracker, shared_memory
+from struct import Struct
+from typing import TYPE_CHECKING, Any
+
+from wexample_event.common.error_policy import DispatchErrorPolicy
+from wexample_event.common.event_codec import EventCodec
+from wexample_event.dataclass.event import Event
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.listener_record import EventKey
+
+_HEADER = Struct(">4sBxxxQQ")
+_HEADER_SIZE = 64
+_MAGIC = b"WEVB"
+_RECORD = Struct(">IQ")
+_POSITION = Struct(">Q")
+# Published end of the last complete record.
+_WRITE_POSITION_OFFSET = 16
+# End of the record being written, set before its bytes are copied.
+_WRITE_RESERVED_OFFSET = 24
+
+logger = logging.getLogger(__name__)
+
+# Segments created by this process, which its resource tracker must keep.
+_CREATED_NAMES: set[str] = set()
+
+
+class MultiprocessEventBus:
+    """Fan events out to dispatchers living in other processes.
+
+    Events are encoded once by the publisher into a broadcast ring buffer
+    held in ``multiprocessing.shared_memory``; every attached bus keeps its
+    own read position, decodes new records and dispatches them on its local
+    dispatchers. Nothing goes through pickle.
+
+    Publishers from several processes must share the ``lock`` given at
+    creation (pass the bus itself as a Process argument, it carries the
+    lock along). A subscriber lapped by writers skips the overwritten
+    records and counts them in ``dropped``, as well as records it cannot
+    decode and forwarded events it cannot publish (unencodable, or larger
+    than the ring). Failing local listeners are logged and do not stop
+    polling.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        memory: shared_memory.SharedMemory,
+        *,
+        lock: Any | None = None,
+        codec: EventCodec | None = None,
+        owner: bool = False,
+    ) -> None:
+        magic, version, capacity, _ = _HEADER.unpack_from(memory.buf, 0)
+        if magic != _MAGIC or version != self.VERSION:
+            raise ValueError(f"Shared memory '{memory.name}' is not an event bus")
+
+        self.capacity = capacity
+        self.codec = codec or EventCodec(intern_names=False)
+        self.dropped = 0
+        self.lock = lock
+        self.memory = memory
+        self._dispatchers: list[tuple[EventDispatcherMixin, frozenset[str] | None]] = []
+        self._forwarded: list[tuple[EventDispatcherMixin, EventKey]] = []
+        self._local = threading.local()
+        self._owner = owner
+        self._read_lock = threading.Lock()
+        self._read_position = self._write_position()
+        self._stop: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def attach(
+        cls, name: str, *, lock: Any | None = None, codec: EventCodec | None = None
+    ) -> MultiprocessEventBus:
+        """Attach to a bus created by another process."""
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            # The creating process owns the segment; don't let this process'
+            # resource tracker unlink it on exit.
+            if name not in _CREATED_NAMES:
+                resource_tracker.unregister(
+                    memory._name, "shared_memory"  # type: ignore[attr-defined]
+                )
+        return cls(memory, lock=lock, codec=codec)
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        capacity: int = 1 << 20,
+        name: str | None = None,
+        lock: Any | None = None,
+        codec: EventCodec | None = None,
+    ) -> MultiprocessEventBus:
+        """Create a new shared ring buffer of the given capacity in bytes."""
+        if capacity <= _RECORD.size:
+            raise ValueError("capacity is too small")
+        if lock is None:
+            import multiprocessing
+
+            lock = multiprocessing.Lock()
+
+        memory = shared_memory.SharedMemory(
+            name=name, create=True, size=_HEADER_SIZE + capacity
+        )
+        _HEADER.pack_into(memory.buf, 0, _MAGIC, cls.VERSION, capacity, 0)
+        _CREATED_NAMES.add(memory.name)
+        return cls(memory, lock=lock, codec=codec, owner=True)
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        return _attach_bus, (self.name, self.lock)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    @property
+    def publisher_id(self) -> int:
+        # Derived from the pid so a forked copy of this bus gets its own id.
+        return (os.getpid() << 32) | (id(self) & 0xFFFFFFFF)
+
+    def attach_dispatcher(
+        self, dispatcher: EventDispatcherMixin, names: Iterable[str] | None = None
+    ) -> None:
+        """Dispatch received events (optionally only some names) on dispatcher."""
+        self._dispatchers.append(
+            (dispatcher, None if names is None else frozenset(names))
+        )
+
+    def close(self) -> None:
+        """Stop polling, detach forwarders and release the mapping."""
+        self.stop()
+        for dispatcher, name in self._forwarded:
+            dispatcher.remove_event_listener(name, self._forward)
+        self._forwarded.clear()
+        self._dispatchers.clear()
+        self.memory.close()
+
+    def forward(
+        self, dispatcher: EventDispatcherMixin, names: Iterable[EventKey]
+    ) -> None:
+        """Publish every event dispatched under the given names on dispatcher."""
+        for name in names:
+            dispatcher.add_event_listener(name, self._forward)
+            self._forwarded.append((dispatcher, name))
+
+    def poll(self) -> int:
+        """Dispatch records published since the last poll; return their number."""
+        received = 0
+        own_id = self.publisher_id
+        with self._read_lock:
+            while True:
+                position = self._read_position
+                write_position = self._write_position()
+                if position >= write_position:
+                    return received
+                if self._write_reserved() - position > self.capacity:
+                    # Lapped, or about to be by a write in progress.
+                    self.dropped += 1
+                    self._read_position = write_position
+                    continue
+
+                header = self._read(position, _RECORD.size)
+                size, publisher_id = _RECORD.unpack(header)
+                frame = (
+                    self._read(position + _RECORD.size, size)
+                    if size <= self.capacity
+                    else b""
+                )
+                if self._write_reserved() - position > self.capacity:
+                    # A writer reserved bytes we were reading: they may be
+                    # torn, resync on the next pass.
+                    continue
+                if size > self.capacity:
+                    self.dropped += 1
+                    self._read_position = write_position
+                    continue
+                self._read_position = position + _RECORD.size + size
+
+                if publisher_id == own_id:
+                    continue
+                try:
+                    event = self.codec.decode(frame)
+                except Exception:
+                    logger.exception(
+                        "Dropping undecodable record on bus '%s'", self.name
+                    )
+                    self.dropped += 1
+                    continue
+                self._deliver(event)
+                received += 1
+
+    def publish(self, event: Event) -> None:
+        """Encode event once and append it to the ring."""
+        buffer = bytearray(_RECORD.size)
+        self.codec.encode_into(event, buffer)
+        size = len(buffer) - _RECORD.size
+        if len(buffer) > self.capacity:
+            raise ValueError("Encoded event is larger than the ring capacity")
+        _RECORD.pack_into(buffer, 0, size, self.publisher_id)
+
+        if self.lock is None:
+            self._append(buffer)
+        else:
+            with self.lock:
+                self._append(buffer)
+
+    def start(self, poll_interval: float = 0.001) -> None:
+        """Poll in a background thread until stop() is called."""
+        if self._thread is not None:
+            return
+        self._stop = threading.Event()
+        stop = self._stop
+
+        def run() -> None:
+            while not stop.is_set():
+                try:
+                    received = self.poll()
+                except Exception:
+                    logger.exception("Polling bus '%s' failed", self.name)
+                    received = 0
+                if not received:
+                    stop.wait(poll_interval)
+
+        self._thread = threading.Thread(
+            target=run, name=f"event-bus-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._stop = None
+
+    def unlink(self) -> None:
+        """Destroy the shared memory segment (creating process only)."""
+        if self._owner:
+            self.memory.unlink()
+            _CREATED_NAMES.discard(self.memory.name)
+
+    def _append(self, record: bytearray) -> None:
+        position = self._write_position()
+        offset = position % self.capacity
+        first = min(len(record), self.capacity - offset)
+        buf = self.memory.buf
+        end = position + len(record)
+        # Reserve first, so readers of the bytes about to be overwritten can
+        # tell their copy may be torn.
+        _POSITION.pack_into(buf, _WRITE_RESERVED_OFFSET, end)
+        buf[_HEADER_SIZE + offset : _HEADER_SIZE + offset + first] = record[:first]
+        if first < len(record):
+            rest = len(record) - first
+            buf[_HEADER_SIZE : _HEADER_SIZE + rest] = record[first:]
+        # Publish the record only once its bytes are in place.
+        _POSITION.pack_into(buf, _WRITE_POSITION_OFFSET, end)
+
+    def _deliver(self, event: Event) -> None:
+        previous = getattr(self._local, "receiving", None)
+        self._local.receiving = event
+        try:
+            for dispatcher, names in self._dispatchers:
+                if names is None or event.name in names:
+                    dispatcher.dispatch(
+                        event, error_policy=DispatchErrorPolicy.LOG_AND_CONTINUE
+                    )
+        finally:
+            self._local.receiving = previous
+
+    def _forward(self, event: Event) -> None:
+        # The event we are re-dispatching locally came from the bus already;
+        # events its listeners dispatch did not.
+        if event is getattr(self._local, "receiving", None):
+            return
+        try:
+            self.publish(event)
+        except Exception:
+            logger.exception(
+                "Dropping event '%s' not publishable on bus '%s'", event.name, self.name
+            )
+            self.dropped += 1
+
+    def _read(self, position: int, size: int) -> bytes:
+        offset = position % self.capacity
+        start = _HEADER_SIZE + offset
+        buf = self.memory.buf
+        if offset + size <= self.capacity:
+            return bytes(buf[start : start + size])
+        first = self.capacity - offset
+        return bytes(buf[start : start + first]) + bytes(
+            buf[_HEADER_SIZE : _HEADER_SIZE + size - first]
+        )
+
+    def _write_position(self) -> int:
+        return _POSITION.unpack_from(self.memory.buf, _WRITE_POSITION_OFFSET)[0]
+
+    def _write_reserved(self) -> int:
+        return _POSITION.unpack_from(self.memory.buf, _WRITE_RESERVED_OFFSET)[0]
+
+
+def _attach_bus(name: str, lock: Any | None) -> MultiprocessEventBus:
+    return MultiprocessEventBus.attach(name, lock=lock)
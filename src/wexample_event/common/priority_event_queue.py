@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Mapping
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from wexample_event.common.error_policy import DispatchErrorPolicy
+from wexample_event.common.priority import DEFAULT_PRIORITY, EventPriority
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.dataclass.event import Event
+
+_UNSET = object()
+
+
+class PriorityEventQueue:
+    """Queue events for deferred dispatch, most urgent first.
+
+    Events wait in one FIFO level per priority. The next event dispatched is
+    the level head with the highest effective priority: its priority plus
+    ``aging_rate`` for every second it has been waiting, so a backlog of
+    ``LOW`` events still drains under a steady flow of ``HIGH`` ones. With
+    ``aging_rate=0`` priorities are strict.
+
+    Drain it explicitly with ``drain`` or in a background thread with
+    ``start``. Listener failures are handled with ``error_policy`` (logged
+    by default, since nobody waits on a queued dispatch).
+    """
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcherMixin,
+        *,
+        aging_rate: float = 10.0,
+        error_policy: DispatchErrorPolicy | str = DispatchErrorPolicy.LOG_AND_CONTINUE,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if aging_rate < 0:
+            raise ValueError("aging_rate must not be negative")
+
+        self.aging_rate = aging_rate
+        self.clock = clock
+        self.dispatcher = dispatcher
+        self.dispatched = 0
+        self.error_policy = DispatchErrorPolicy(error_policy)
+        self._condition = threading.Condition()
+        self._levels: dict[int, deque[tuple[float, Event]]] = {}
+        self._size = 0
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        """Drop every queued event."""
+        with self._condition:
+            self._levels.clear()
+            self._size = 0
+
+    def drain(self, max_events: int | None = None) -> int:
+        """Dispatch queued events in the current thread; return their number."""
+        count = 0
+        while max_events is None or count < max_events:
+            event = self.get(timeout=0)
+            if event is None:
+                break
+            self._dispatch(event)
+            count += 1
+        return count
+
+    def get(self, timeout: float | None = None) -> Event | None:
+        """Pop the next event to dispatch, waiting up to timeout for one.
+
+        Returns None on timeout or once the queue is stopping and empty.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._size or self._stopping, timeout
+            ):
+                return None
+            if not self._size:
+                return None
+            return self._pop()
+
+    def put(
+        self,
+        event: Event | str,
+        *,
+        priority: int | EventPriority = DEFAULT_PRIORITY,
+        payload: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        source: Any | object = _UNSET,
+    ) -> Event:
+        """Queue an event (built like dispatch() does) for later dispatch."""
+        queued = self.dispatcher._coerce_event(
+            event,
+            payload=payload,
+            metadata=metadata,
+            source=self.dispatcher._UNSET if source is _UNSET else source,
+        )
+
+        with self._condition:
+            level = self._levels.get(int(priority))
+            if level is None:
+                level = self._levels[int(priority)] = deque()
+            level.append((self.clock(), queued))
+            self._size += 1
+            self._condition.notify()
+        return queued
+
+    def start(self) -> None:
+        """Dispatch queued events in a background thread until stop()."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="priority-event-queue", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, *, drain: bool = True) -> None:
+        """Stop the background thread, first dispatching what is queued."""
+        if self._thread is None:
+            return
+        if not drain:
+            self.clear()
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._thread = None
+
+    def _dispatch(self, event: Event) -> None:
+        self.dispatcher.dispatch(event, error_policy=self.error_policy)
+        self.dispatched += 1
+
+    def _pop(self) -> Event:
+        # Levels are FIFO, so each head has waited longest in its level and
+        # only heads need comparing.
+        now = self.clock()
+        aging_rate = self.aging_rate
+        best: deque[tuple[float, Event]] | None = None
+        best_score = 0.0
+        for priority, level in self._levels.items():
+            if not level:
+                continue
+            score = priority + (now - level[0][0]) * aging_rate
+            if best is None or score > best_score:
+                best = level
+                best_score = score
+
+        self._size -= 1
+        return best.popleft()[1]
+
+    def _run(self) -> None:
+        while True:
+            event = self.get()
+            if event is None:
+                return
+            self._dispatch(event)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+from wexample_event.dataclass.propagation_state import PropagationState
+
+# State of the tree dispatch whose listeners are currently running.
+propagation_state: ContextVar[PropagationState | None] = ContextVar(
+    "event_propagation_state", default=None
+)
+
+
+def current_propagation() -> PropagationState | None:
+    """Phase and current target of the running tree dispatch, if any.
+
+    Only set while an event propagates through several dispatchers.
+    """
+    return propagation_state.get()
+
+
+def stop_propagation() -> None:
+    """Stop the running tree dispatch after the current dispatcher's listeners.
+
+    Like the DOM, listeners of the current dispatcher still run; a no-op
+    outside of a tree dispatch.
+    """
+    state = propagation_state.get()
+    if state is not None:
+        state.stopped = True
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any, ClassVar
+
+from wexample_event.common.dispatcher import EventDispatcherMixin
+from wexample_event.common.error_policy import DispatchErrorPolicy
+from wexample_event.dataclass.event import Event
+
+logger = logging.getLogger(__name__)
+
+PartitionKey = Callable[[Event], Hashable]
+
+_STOP = object()
+
+
+class ShardedDispatcher(EventDispatcherMixin):
+    """Dispatcher running listeners on N worker threads, partitioned by key.
+
+    ``dispatch`` computes the partition key of the event and hands it to the
+    worker owning that key, then returns. Events sharing a key are handled
+    in dispatch order by the same worker while other keys run in parallel.
+    ``partition_key`` is either a payload field name or a callable taking
+    the event; events without a key are partitioned by name.
+
+    Workers read the same immutable listener snapshots, so no table is
+    copied per shard. Listener failures are logged by default since the
+    caller has already returned; ``dispatch_with_result`` and the async
+    variants still run in the calling thread.
+    """
+
+    _event_error_policy: ClassVar[DispatchErrorPolicy] = (
+        DispatchErrorPolicy.LOG_AND_CONTINUE
+    )
+
+    def __init__(
+        self,
+        shards: int | None = None,
+        *,
+        partition_key: str | PartitionKey | None = None,
+        max_pending: int = 0,
+    ) -> None:
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if shards <= 0:
+            raise ValueError("shards must be a positive integer")
+
+        if isinstance(partition_key, str):
+            field = partition_key
+
+            def partition_key(event: Event) -> Hashable:
+                return None if event.payload is None else event.payload.get(field)
+
+        self.partition_key = partition_key
+        self._closed = False
+        self._queues: list[queue.Queue[Any]] = [
+            queue.Queue(max_pending) for _ in range(shards)
+        ]
+        self._workers = [
+            threading.Thread(
+                target=self._run,
+                args=(shard_queue,),
+                name=f"event-shard-{index}",
+                daemon=True,
+            )
+            for index, shard_queue in enumerate(self._queues)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> ShardedDispatcher:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> int:
+        return len(self._queues)
+
+    def close(self) -> None:
+        """Dispatch what is queued, then stop the workers."""
+        if self._closed:
+            return
+        self._closed = True
+        for shard_queue in self._queues:
+            shard_queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+
+    def dispatch(
+        self,
+        event: Event | str,
+        *,
+        payload: Mapping[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
+        source: Any | object = EventDispatcherMixin._UNSET,
+        error_policy: DispatchErrorPolicy | str | None = None,
+    ) -> Event:
+        """Queue the event on the worker owning its partition key."""
+        if self._closed:
+            raise RuntimeError("ShardedDispatcher is closed")
+        dispatched_event = self._coerce_event(
+            event, payload=payload, metadata=metadata, source=source
+        )
+        self._queues[self.shard_for(dispatched_event)].put(
+            (dispatched_event, self._resolve_error_policy(error_policy))
+        )
+        return dispatched_event
+
+    def join(self) -> None:
+        """Block until every queued event has been dispatched."""
+        for shard_queue in self._queues:
+            shard_queue.join()
+
+    def shard_for(self, event: Event) -> int:
+        key = None if self.partition_key is None else self.partition_key(event)
+        return hash(event.name if key is None else key) % len(self._queues)
+
+    def _run(self, shard_queue: queue.Queue[Any]) -> None:
+        while True:
+            item = shard_queue.get()
+            try:
+                if item is _STOP:
+                    return
+                event, policy = item
+                try:
+                    super().dispatch(event, error_policy=policy)
+                except Exception:
+                    logger.exception(
+                        "Sharded dispatch of event '%s' failed", event.name
+                    )
+            finally:
+                shard_queue.task_done()
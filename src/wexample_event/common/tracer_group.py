@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_event.common.dispatch_tracer import DispatchTracer
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.common.event_phase import EventPhase
+    from wexample_event.dataclass.event import Event
+    from wexample_event.dataclass.listener_record import EventCallback
+
+
+class TracerGroup(DispatchTracer):
+    """Tracer forwarding every hook to several tracers, in order.
+
+    Lets a dispatcher report to a tracer and to DispatchMetrics at once.
+    """
+
+    def __init__(self, *tracers: DispatchTracer) -> None:
+        self.tracers = tracers
+
+    def on_bubble(
+        self, dispatcher: EventDispatcherMixin, event: Event, phase: EventPhase
+    ) -> None:
+        for tracer in self.tracers:
+            tracer.on_bubble(dispatcher, event, phase)
+
+    def on_dispatch_end(self, dispatcher: EventDispatcherMixin, event: Event) -> None:
+        for tracer in self.tracers:
+            tracer.on_dispatch_end(dispatcher, event)
+
+    def on_dispatch_start(self, dispatcher: EventDispatcherMixin, event: Event) -> None:
+        for tracer in self.tracers:
+            tracer.on_dispatch_start(dispatcher, event)
+
+    def on_listener_end(
+        self,
+        dispatcher: EventDispatcherMixin,
+        event: Event,
+        callback: EventCallback,
+        error: Exception | None,
+    ) -> None:
+        for tracer in self.tracers:
+            tracer.on_listener_end(dispatcher, event, callback, error)
+
+    def on_listener_start(
+        self, dispatcher: EventDispatcherMixin, event: Event, callback: EventCallback
+    ) -> None:
+        for tracer in self.tracers:
+            tracer.on_listener_start(dispatcher, event, callback)
+
+    def on_once_removed(
+        self, dispatcher: EventDispatcherMixin, event: Event, count: int
+    ) -> None:
+        for tracer in self.tracers:
+            tracer.on_once_removed(dispatcher, event, count)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from struct import Struct
+from typing import Any
+
+# Subset of the MessagePack wire format: nil, booleans, integers up to 64
+# bits, float64, str, bin, array and map. Encoding is canonical MessagePack,
+# so payloads remain readable by any msgpack implementation.
+
+_U8 = Struct(">B")
+_U16 = Struct(">H")
+_U32 = Struct(">I")
+_U64 = Struct(">Q")
+_I8 = Struct(">b")
+_I16 = Struct(">h")
+_I32 = Struct(">i")
+_I64 = Struct(">q")
+_F64 = Struct(">d")
+
+PackDefault = Callable[[Any], Any]
+
+
+def pack_value(
+    value: Any, buffer: bytearray, default: PackDefault | None = None
+) -> None:
+    """Append the packed form of value to buffer.
+
+    Unsupported values are passed through default, which must return a
+    supported value; without it a TypeError is raised.
+    """
+    if value is None:
+        buffer.append(0xC0)
+    elif value is True:
+        buffer.append(0xC3)
+    elif value is False:
+        buffer.append(0xC2)
+    elif isinstance(value, int):
+        _pack_int(value, buffer)
+    elif isinstance(value, float):
+        buffer.append(0xCB)
+        buffer += _F64.pack(value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        size = len(encoded)
+        if size < 32:
+            buffer.append(0xA0 | size)
+        elif size < 0x100:
+            buffer.append(0xD9)
+            buffer.append(size)
+        elif size < 0x10000:
+            buffer.append(0xDA)
+            buffer += _U16.pack(size)
+        else:
+            buffer.append(0xDB)
+            buffer += _U32.pack(size)
+        buffer += encoded
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        size = len(value)
+        if size < 0x100:
+            buffer.append(0xC4)
+            buffer.append(size)
+        elif size < 0x10000:
+            buffer.append(0xC5)
+            buffer += _U16.pack(size)
+        else:
+            buffer.append(0xC6)
+            buffer += _U32.pack(size)
+        buffer += value
+    elif isinstance(value, (list, tuple)):
+        _pack_header(len(value), 0x90, 0xDC, buffer)
+        for item in value:
+            pack_value(item, buffer, default)
+    elif isinstance(value, Mapping):
+        _pack_header(len(value), 0x80, 0xDE, buffer)
+        for key, item in value.items():
+            pack_value(key, buffer, default)
+            pack_value(item, buffer, default)
+    elif default is not None:
+        pack_value(default(value), buffer, None)
+    else:
+        raise TypeError(f"Cannot pack value of type {type(value).__name__}")
+
+
+def unpack_value(data: bytes | memoryview, offset: int = 0) -> tuple[Any, int]:
+    """Read one packed value from data at offset; return it and the next offset."""
+    code = data[offset]
+    offset += 1
+
+    if code <= 0x7F:
+        return code, offset
+    if code >= 0xE0:
+        return code - 0x100, offset
+    if 0xA0 <= code <= 0xBF:
+        return _read_str(data, offset, code & 0x1F)
+    if 0x90 <= code <= 0x9F:
+        return _read_array(data, offset, code & 0x0F)
+    if 0x80 <= code <= 0x8F:
+        return _read_map(data, offset, code & 0x0F)
+    if code == 0xC0:
+        return None, offset
+    if code == 0xC2:
+        return False, offset
+    if code == 0xC3:
+        return True, offset
+
+    reader = _FIXED_READERS.get(code)
+    if reader is not None:
+        return reader.unpack_from(data, offset)[0], offset + reader.size
+
+    if code in (0xD9, 0xDA, 0xDB):
+        size, offset = _read_size(data, offset, code - 0xD9)
+        return _read_str(data, offset, size)
+    if code in (0xC4, 0xC5, 0xC6):
+        size, offset = _read_size(data, offset, code - 0xC4)
+        return bytes(data[offset : offset + size]), offset + size
+    if code in (0xDC, 0xDD):
+        size, offset = _read_size(data, offset, code - 0xDB)
+        return _read_array(data, offset, size)
+    if code in (0xDE, 0xDF):
+        size, offset = _read_size(data, offset, code - 0xDD)
+        return _read_map(data, offset, size)
+
+    raise ValueError(f"Unsupported packed type code 0x{code:02x}")
+
+
+_FIXED_READERS: dict[int, Struct] = {
+    0xCB: _F64,
+    0xCC: _U8,
+    0xCD: _U16,
+    0xCE: _U32,
+    0xCF: _U64,
+    0xD0: _I8,
+    0xD1: _I16,
+    0xD2: _I32,
+    0xD3: _I64,
+}
+_SIZE_READERS: tuple[Struct, ...] = (_U8, _U16, _U32)
+
+
+def _pack_header(size: int, fix_code: int, code16: int, buffer: bytearray) -> None:
+    if size < 16:
+        buffer.append(fix_code | size)
+    elif size < 0x10000:
+        buffer.append(code16)
+        buffer += _U16.pack(size)
+    else:
+        buffer.append(code16 + 1)
+        buffer += _U32.pack(size)
+
+
+def _pack_int(value: int, buffer: bytearray) -> None:
+    if 0 <= value <= 0x7F:
+        buffer.append(value)
+    elif -32 <= value < 0:
+        buffer.append(value & 0xFF)
+    elif 0 <= value <= 0xFFFFFFFFFFFFFFFF:
+        if value <= 0xFF:
+            buffer.append(0xCC)
+            buffer.append(value)
+        elif value <= 0xFFFF:
+            buffer.append(0xCD)
+            buffer += _U16.pack(value)
+        elif value <= 0xFFFFFFFF:
+            buffer.append(0xCE)
+            buffer += _U32.pack(value)
+        else:
+            buffer.append(0xCF)
+            buffer += _U64.pack(value)
+    elif -(1 << 63) <= value < 0:
+        if value >= -0x80:
+            buffer.append(0xD0)
+            buffer += _I8.pack(value)
+        elif value >= -0x8000:
+            buffer.append(0xD1)
+            buffer += _I16.pack(value)
+        elif value >= -0x80000000:
+            buffer.append(0xD2)
+            buffer += _I32.pack(value)
+        else:
+            buffer.append(0xD3)
+            buffer += _I64.pack(value)
+    else:
+        raise OverflowError("Integer does not fit in 64 bits")
+
+
+def _read_array(data: bytes | memoryview, offset: int, size: int) -> tuple[list, int]:
+    items = []
+    for _ in range(size):
+        item, offset = unpack_value(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _read_map(data: bytes | memoryview, offset: int, size: int) -> tuple[dict, int]:
+    items = {}
+    for _ in range(size):
+        key, offset = unpack_value(data, offset)
+        items[key], offset = unpack_value(data, offset)
+    return items, offset
+
+
+def _read_size(data: bytes | memoryview, offset: int, width: int) -> tuple[int, int]:
+    reader = _SIZE_READERS[width]
+    return reader.unpack_from(data, offset)[0], offset + reader.size
+
+
+def _read_str(data: bytes | memoryview, offset: int, size: int) -> tuple[str, int]:
+    end = offset + size
+    return str(data[offset:end], "utf-8"), end
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .event import Event
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+
+
+@dataclass(slots=True, eq=False)
+class DispatchFrame:
+    """One dispatch in progress, linked to the dispatch that triggered it.
+
+    ``depth`` is 1 for a dispatch started outside any listener, and
+    ``fanout`` counts the dispatches started by this one's listeners.
+    """
+
+    dispatcher: EventDispatcherMixin
+    event: Event
+    depth: int = 1
+    fanout: int = 0
+    parent: DispatchFrame | None = field(default=None, repr=False)
+
+    def chain(self) -> list[str]:
+        """Event names from the outermost dispatch down to this one."""
+        names = []
+        frame: DispatchFrame | None = self
+        while frame is not None:
+            names.append(frame.event.name)
+            frame = frame.parent
+        names.reverse()
+        return names
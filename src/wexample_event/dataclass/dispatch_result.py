@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .event import Event
+from .listener_outcome import ListenerOutcome
+
+
+@dataclass(slots=True)
+class DispatchResult:
+    """Per-listener outcomes collected while dispatching one event."""
+
+    event: Event
+
+    outcomes: list[ListenerOutcome] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return sum(outcome.duration for outcome in self.outcomes)
+
+    @property
+    def errors(self) -> list[Exception]:
+        return [outcome.error for outcome in self.outcomes if outcome.error is not None]
+
+    @property
+    def failed(self) -> list[ListenerOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.error is not None]
+
+    @property
+    def ok(self) -> bool:
+        return all(outcome.error is None for outcome in self.outcomes)
+
+    def raise_for_errors(self) -> None:
+        """Raise an EventDispatchError when at least one listener failed."""
+        if not self.ok:
+            from wexample_event.exception.event_dispatch_error import (
+                EventDispatchError,
+            )
+
+            raise EventDispatchError(self) from self.errors[0]
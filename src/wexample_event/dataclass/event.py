@@ -1,28 +1,140 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass, field, replace
+from copy import deepcopy
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any
 
+_set_field = object.__setattr__
+
+
+def _unwrap(value: Any) -> Any:
+    return dict(value) if isinstance(value, MappingProxyType) else value
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def as_mapping_view(mapping: Mapping[str, Any] | None) -> Mapping[str, Any] | None:
+    """Wrap a mutable mapping in a read-only view without copying it."""
+    if mapping is None or isinstance(mapping, MappingProxyType):
+        return mapping
+    return MappingProxyType(mapping)
+
 
 @dataclass(frozen=True, slots=True)
 class Event:
-    """Immutable event payload shared between dispatchers and listeners."""
+    """Immutable event payload shared between dispatchers and listeners.
+
+    Payload and metadata are the mappings given by the caller, not copies.
+    Copies made by derive and with_update expose them as read-only views
+    instead, so a derived event cannot alter the one it came from; use
+    to_dict to serialize those.
+    """
 
     name: str
 
     metadata: Mapping[str, Any] | None = None
     payload: Mapping[str, Any] | None = None
     source: Any | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utc_now)
+
+    def __getstate__(self) -> list[Any]:
+        # Views cannot be pickled, ship plain dicts instead.
+        return [_unwrap(getattr(self, item.name)) for item in fields(self)]
+
+    def __setstate__(self, state: list[Any]) -> None:
+        for item, value in zip(fields(self), state):
+            _set_field(self, item.name, value)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Event:
+        # Views cannot be deep-copied: copy the mappings they wrap.
+        return replace(
+            self,
+            **{
+                item.name: deepcopy(_unwrap(getattr(self, item.name)), memo)
+                for item in fields(self)
+                if item.init
+            },
+        )
 
     def derive(self, name: str | None = None, **changes: Any) -> Event:
         """Copy the event, optionally overriding the name and additional fields."""
         if name is not None:
             changes.setdefault("name", name)
-        return self.with_update(**changes)
+        return self._copy_with(changes)
 
     def with_update(self, **changes: Any) -> Event:
-        """Return a copy of the event with the provided field updates applied."""
-        return replace(self, **changes)
+        """Return a copy of the event with the provided field updates applied.
+
+        Unchanged fields, including payload and metadata views, are shared
+        with the original event; payload and metadata become read-only views.
+        """
+        return self._copy_with(changes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Fields of the event, with payload and metadata as plain dicts.
+
+        Derived events hold read-only views, which json and dataclasses.asdict
+        cannot handle; this gives a serializable snapshot of any event.
+        """
+        return {item.name: _unwrap(getattr(self, item.name)) for item in fields(self)}
+
+    def _copy_with(self, changes: dict[str, Any]) -> Event:
+        if type(self) is not Event:
+            event = replace(self, **changes)
+            _set_field(event, "metadata", as_mapping_view(event.metadata))
+            _set_field(event, "payload", as_mapping_view(event.payload))
+            return event
+
+        for key in changes:
+            if key not in _EVENT_FIELDS:
+                raise TypeError(
+                    f"Event.__init__() got an unexpected keyword argument '{key}'"
+                )
+
+        event = object.__new__(Event)
+        _set_field(event, "name", changes.get("name", self.name))
+        _set_field(
+            event,
+            "metadata",
+            as_mapping_view(changes.get("metadata", self.metadata)),
+        )
+        _set_field(
+            event,
+            "payload",
+            as_mapping_view(changes.get("payload", self.payload)),
+        )
+        _set_field(event, "source", changes.get("source", self.source))
+        _set_field(event, "timestamp", changes.get("timestamp", self.timestamp))
+        return event
+
+    @classmethod
+    def _create(
+        cls,
+        name: str,
+        metadata: Mapping[str, Any] | None = None,
+        payload: Mapping[str, Any] | None = None,
+        source: Any | None = None,
+        timestamp: datetime | None = None,
+        *,
+        instance: Event | None = None,
+    ) -> Event:
+        """Build an event without going through the dataclass __init__.
+
+        When an instance is given (see EventPool) its slots are overwritten
+        in place instead of allocating a new object.
+        """
+        event = object.__new__(cls) if instance is None else instance
+        _set_field(event, "name", name)
+        _set_field(event, "metadata", metadata)
+        _set_field(event, "payload", payload)
+        _set_field(event, "source", source)
+        _set_field(event, "timestamp", _utc_now() if timestamp is None else timestamp)
+        return event
+
+
+_EVENT_FIELDS = frozenset(item.name for item in fields(Event))
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .event import Event
+from .filter_condition import FILTER_SOURCES, FilterCondition
+
+_IN_SET_TYPES = (set, frozenset, list, tuple)
+
+
+@dataclass(frozen=True, slots=True)
+class EventFilter:
+    """Conjunction of conditions a listener declares on the events it wants.
+
+    Built from a ``where`` mapping: keys name a payload field, or a
+    ``metadata.`` / ``payload.`` prefixed field; values are matched by
+    equality, or by membership when given as a set, list or tuple.
+    """
+
+    conditions: tuple[FilterCondition, ...]
+
+    @classmethod
+    def from_mapping(cls, where: Mapping[str, Any]) -> EventFilter:
+        if not where:
+            raise ValueError("where must declare at least one condition")
+
+        conditions = []
+        for key, expected in where.items():
+            source, _, field = key.partition(".")
+            if not field or source not in FILTER_SOURCES:
+                source, field = "payload", key
+            values = (
+                frozenset(expected)
+                if isinstance(expected, _IN_SET_TYPES)
+                else frozenset((expected,))
+            )
+            conditions.append(
+                FilterCondition(field=field, source=source, values=values)
+            )
+        return cls(conditions=tuple(conditions))
+
+    def index_condition(self, *, allow_in_set: bool = True) -> FilterCondition | None:
+        """The condition the dispatcher indexes the listener under.
+
+        Equality conditions are preferred; an in-set condition indexes the
+        listener once per value.
+        """
+        for condition in self.conditions:
+            if condition.is_equality:
+                return condition
+        return self.conditions[0] if allow_in_set else None
+
+    def matches(self, event: Event) -> bool:
+        return all(condition.matches(event) for condition in self.conditions)
+
+    def without_condition(self, condition: FilterCondition) -> EventFilter | None:
+        """This filter minus condition, or None when nothing is left."""
+        conditions = tuple(item for item in self.conditions if item != condition)
+        return EventFilter(conditions=conditions) if conditions else None
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from .event import Event
+
+FILTER_SOURCES = ("payload", "metadata")
+
+# Returned by filter_value when the event lacks the field.
+MISSING: Any = object()
+
+
+def filter_value(event: Event, source: str, field: str) -> Any:
+    """Value of a payload or metadata field of event, or MISSING."""
+    mapping = event.payload if source == "payload" else event.metadata
+    if mapping is None:
+        return MISSING
+    return mapping.get(field, MISSING)
+
+
+@dataclass(frozen=True, slots=True)
+class FilterCondition:
+    """One declarative condition: ``event.<source>[field]`` is in ``values``."""
+
+    field: str
+    source: str
+    values: frozenset[Any]
+
+    @property
+    def is_equality(self) -> bool:
+        return len(self.values) == 1
+
+    def matches(self, event: Event) -> bool:
+        try:
+            return filter_value(event, self.source, self.field) in self.values
+        except TypeError:
+            # Unhashable values never equal a declared (hashable) one.
+            return False
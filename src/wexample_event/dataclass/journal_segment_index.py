@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+
+from wexample_event.common.value_packer import pack_value, unpack_value
+
+
+@dataclass(slots=True)
+class JournalSegmentIndex:
+    """Sparse index of one journal segment.
+
+    Maps each event name to the offsets of its frames, and each time bucket
+    (``bucket_ns`` wide) to the offsets of the frames whose timestamp falls
+    in it. Offsets are kept in append order, so both lists are sorted.
+    ``end_offset`` is the segment size covered by the index; frames past it
+    were appended after the index was last saved.
+    """
+
+    VERSION = 1
+
+    bucket_ns: int = 60 * 10**9
+    buckets: dict[int, list[int]] = field(default_factory=dict)
+    count: int = 0
+    end_offset: int = 0
+    max_timestamp_ns: int | None = None
+    min_timestamp_ns: int | None = None
+    names: dict[str, list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> JournalSegmentIndex:
+        fields_, _ = unpack_value(data)
+        if fields_[0] != cls.VERSION:
+            raise ValueError(f"Unsupported journal index version {fields_[0]}")
+        _, bucket_ns, count, end_offset, min_ns, max_ns, names, buckets = fields_
+        return cls(
+            bucket_ns=bucket_ns,
+            buckets=buckets,
+            count=count,
+            end_offset=end_offset,
+            max_timestamp_ns=max_ns,
+            min_timestamp_ns=min_ns,
+            names=names,
+        )
+
+    def add(self, name: str, timestamp_ns: int, offset: int) -> None:
+        self.names.setdefault(name, []).append(offset)
+        self.buckets.setdefault(timestamp_ns // self.bucket_ns, []).append(offset)
+        if self.min_timestamp_ns is None or timestamp_ns < self.min_timestamp_ns:
+            self.min_timestamp_ns = timestamp_ns
+        if self.max_timestamp_ns is None or timestamp_ns > self.max_timestamp_ns:
+            self.max_timestamp_ns = timestamp_ns
+        self.count += 1
+
+    def matching_names(self, patterns: frozenset[str] | None) -> list[str]:
+        """Indexed names matching any of the glob patterns (all when None)."""
+        if patterns is None:
+            return list(self.names)
+        return [
+            name
+            for name in self.names
+            if name in patterns
+            or any(fnmatchcase(name, pattern) for pattern in patterns)
+        ]
+
+    def offsets(
+        self,
+        patterns: frozenset[str] | None = None,
+        since_ns: int | None = None,
+        until_ns: int | None = None,
+    ) -> list[int]:
+        """Sorted offsets of the frames that may match.
+
+        Buckets are coarse, so timestamps still need an exact check.
+        """
+        if self.count == 0 or not self.overlaps(since_ns, until_ns):
+            return []
+
+        candidates: set[int] | None = None
+        if patterns is not None:
+            candidates = {
+                offset
+                for name in self.matching_names(patterns)
+                for offset in self.names[name]
+            }
+        if since_ns is not None or until_ns is not None:
+            first = None if since_ns is None else since_ns // self.bucket_ns
+            last = None if until_ns is None else (until_ns - 1) // self.bucket_ns
+            in_range = {
+                offset
+                for bucket, offsets in self.buckets.items()
+                if (first is None or bucket >= first)
+                and (last is None or bucket <= last)
+                for offset in offsets
+            }
+            candidates = in_range if candidates is None else candidates & in_range
+        if candidates is None:
+            candidates = {
+                offset for offsets in self.names.values() for offset in offsets
+            }
+        return sorted(candidates)
+
+    def overlaps(self, since_ns: int | None, until_ns: int | None) -> bool:
+        if not self.count:
+            return False
+        if since_ns is not None and self.max_timestamp_ns < since_ns:
+            return False
+        if until_ns is not None and self.min_timestamp_ns >= until_ns:
+            return False
+        return True
+
+    def to_bytes(self) -> bytes:
+        buffer = bytearray()
+        pack_value(
+            [
+                self.VERSION,
+                self.bucket_ns,
+                self.count,
+                self.end_offset,
+                self.min_timestamp_ns,
+                self.max_timestamp_ns,
+                self.names,
+                self.buckets,
+            ],
+            buffer,
+        )
+        return bytes(buffer)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from .event import Event
+from .event_filter import EventFilter
+from .listener_record import EventCallback, EventKey, ListenerRecord
+
+
+def _empty_column() -> array:
+    return array("q")
+
+
+def _filters_column(
+    filters: Iterable[EventFilter | None],
+) -> tuple[EventFilter | None, ...] | None:
+    column = tuple(filters)
+    return column if any(item is not None for item in column) else None
+
+
+@dataclass(frozen=True, slots=True)
+class ListenerBucket:
+    """Columnar, immutable storage for the listeners of one event name.
+
+    Listeners are kept sorted by descending priority then registration order,
+    in parallel columns instead of one record object per listener. Bit ``i``
+    of ``once_mask`` is set when listener ``i`` is a once-listener. Every
+    mutation returns a new bucket so published buckets can be read without
+    copying.
+
+    Buckets merged from several keys (see ``merge``) also carry the key each
+    listener was registered under in ``keys``; published buckets leave it
+    unset. ``filters`` holds the EventFilter of each listener, and is unset
+    when none of them declares one.
+    """
+
+    callbacks: tuple[EventCallback, ...] = ()
+    filters: tuple[EventFilter | None, ...] | None = None
+    keys: tuple[EventKey, ...] | None = None
+    once_mask: int = 0
+    orders: array = field(default_factory=_empty_column)
+    priorities: array = field(default_factory=_empty_column)
+
+    @classmethod
+    def from_records(cls, records: Iterable[ListenerRecord]) -> ListenerBucket:
+        ordered = sorted(records, key=lambda item: (-item.priority, item.order))
+        once_mask = 0
+        for index, record in enumerate(ordered):
+            if record.once:
+                once_mask |= 1 << index
+        return cls(
+            callbacks=tuple(record.callback for record in ordered),
+            filters=_filters_column(record.filter for record in ordered),
+            once_mask=once_mask,
+            orders=array("q", (record.order for record in ordered)),
+            priorities=array("q", (record.priority for record in ordered)),
+        )
+
+    @classmethod
+    def merge(
+        cls, buckets: Iterable[tuple[EventKey, ListenerBucket]]
+    ) -> ListenerBucket:
+        """Interleave several buckets into one, by priority then order."""
+        entries = sorted(
+            (
+                (-bucket.priorities[index], bucket.orders[index], key, bucket, index)
+                for key, bucket in buckets
+                for index in range(len(bucket))
+            ),
+            key=lambda entry: entry[:2],
+        )
+        once_mask = 0
+        for position, (_, _, _, bucket, index) in enumerate(entries):
+            if bucket.is_once(index):
+                once_mask |= 1 << position
+        return cls(
+            callbacks=tuple(bucket.callbacks[index] for *_, bucket, index in entries),
+            filters=_filters_column(
+                bucket.filter_of(index) for *_, bucket, index in entries
+            ),
+            keys=tuple(entry[2] for entry in entries),
+            once_mask=once_mask,
+            orders=array("q", (entry[1] for entry in entries)),
+            priorities=array("q", (-entry[0] for entry in entries)),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.callbacks)
+
+    def __iter__(self) -> Iterator[ListenerRecord]:
+        return (self.record(index) for index in range(len(self.callbacks)))
+
+    def __len__(self) -> int:
+        return len(self.callbacks)
+
+    def filter_of(self, index: int) -> EventFilter | None:
+        return None if self.filters is None else self.filters[index]
+
+    def inserted(self, record: ListenerRecord) -> ListenerBucket:
+        """Return a copy including the record at its sorted position."""
+        # Priorities are stored descending; records sharing a priority keep
+        # registration order, so a new record goes after its equals.
+        index = bisect_right(self.priorities, -record.priority, key=lambda p: -p)
+        if (
+            index
+            and self.priorities[index - 1] == record.priority
+            and self.orders[index - 1] > record.order
+        ):
+            # Restored records may be older than their equal-priority peers.
+            return ListenerBucket.from_records((*self, record))
+
+        filters = self.filters
+        if filters is not None or record.filter is not None:
+            filters = filters or (None,) * len(self)
+            filters = (*filters[:index], record.filter, *filters[index:])
+
+        low_mask = self.once_mask & ((1 << index) - 1)
+        high_mask = (self.once_mask >> index) << (index + 1)
+        return ListenerBucket(
+            callbacks=(
+                *self.callbacks[:index],
+                record.callback,
+                *self.callbacks[index:],
+            ),
+            filters=filters,
+            once_mask=low_mask | high_mask | (int(record.once) << index),
+            orders=self.orders[:index]
+            + array("q", (record.order,))
+            + self.orders[index:],
+            priorities=self.priorities[:index]
+            + array("q", (record.priority,))
+            + self.priorities[index:],
+        )
+
+    def is_once(self, index: int) -> bool:
+        return bool(self.once_mask >> index & 1)
+
+    def record(self, index: int) -> ListenerRecord:
+        """Materialize a ListenerRecord view of one listener."""
+        return ListenerRecord(
+            callback=self.callbacks[index],
+            once=self.is_once(index),
+            order=self.orders[index],
+            priority=self.priorities[index],
+            filter=self.filter_of(index),
+        )
+
+    def rejected_mask(self, event: Event) -> int:
+        """Mask of the listeners whose filter does not match event."""
+        mask = 0
+        if self.filters is not None:
+            for index, event_filter in enumerate(self.filters):
+                if event_filter is not None and not event_filter.matches(event):
+                    mask |= 1 << index
+        return mask
+
+    def without(self, mask: int) -> ListenerBucket:
+        """Return a copy without the listeners whose bit is set in mask."""
+        if not mask:
+            return self
+
+        kept = [index for index in range(len(self.callbacks)) if not mask >> index & 1]
+        once_mask = 0
+        for position, index in enumerate(kept):
+            if self.once_mask >> index & 1:
+                once_mask |= 1 << position
+        return ListenerBucket(
+            callbacks=tuple(self.callbacks[index] for index in kept),
+            filters=_filters_column(self.filter_of(index) for index in kept),
+            keys=None if self.keys is None else tuple(self.keys[i] for i in kept),
+            once_mask=once_mask,
+            orders=array("q", (self.orders[index] for index in kept)),
+            priorities=array("q", (self.priorities[index] for index in kept)),
+        )
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .listener_record import EventCallback
+
+
+@dataclass(frozen=True, slots=True)
+class ListenerCacheStats:
+    """Counters of a memoized listener at the time they were read."""
+
+    callback: EventCallback
+    evictions: int
+    hits: int
+    maxsize: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
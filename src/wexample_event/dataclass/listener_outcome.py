@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .listener_record import EventCallback
+
+
+@dataclass(frozen=True, slots=True)
+class ListenerOutcome:
+    """Result of invoking a single listener during a dispatch."""
+
+    callback: EventCallback
+    duration: float
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
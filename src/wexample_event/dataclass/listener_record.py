@@ -4,8 +4,18 @@ from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 from .event import Event
+from .event_filter import EventFilter
 
 EventCallback = Callable[[Event], Awaitable[None] | None]
+# Listeners are keyed by event name, or by event class for typed events.
+EventKey = str | type[Event]
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureKey:
+    """Key of the capture-phase listeners registered under ``key``."""
+
+    key: EventKey
 
 
 @dataclass(slots=True)
@@ -14,3 +24,4 @@ class ListenerRecord:
     once: bool
     order: int
     priority: int
+    filter: EventFilter | None = None
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
 
+from .event import Event
+from .event_filter import EventFilter
+from .listener_record import EventKey
+
 
 @dataclass(frozen=True, slots=True)
 class ListenerSpec:
-    name: str
+    name: EventKey
     once: bool
     priority: int
+    filter: EventFilter | None = None
+    capture: bool = False
+    replay: bool = False
+    cache_key: Callable[[Event], Hashable] | None = None
+    cache_size: int = 128
+    cache_ttl: float | None = None
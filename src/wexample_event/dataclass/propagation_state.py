@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+    from wexample_event.common.event_phase import EventPhase
+
+
+@dataclass(slots=True)
+class PropagationState:
+    """Progress of one event through the capture, target and bubble phases."""
+
+    current_target: EventDispatcherMixin
+    phase: EventPhase
+    target: EventDispatcherMixin
+    stopped: bool = False
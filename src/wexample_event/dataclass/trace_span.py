@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wexample_event.common.event_phase import EventPhase
+
+
+@dataclass(slots=True, eq=False)
+class TraceSpan:
+    """One dispatch or listener call recorded by an InMemoryTracer.
+
+    Dispatch spans hold the listener spans they ran, which in turn hold the
+    dispatches their listener triggered. ``ended`` stays None while the span
+    is running.
+    """
+
+    dispatcher: Any
+    kind: str
+    name: str
+    started: float
+    callback: Any = None
+    children: list[TraceSpan] = field(default_factory=list)
+    ended: float | None = None
+    error: Exception | None = None
+    hops: list[tuple[EventPhase, Any]] = field(default_factory=list)
+    parent: TraceSpan | None = field(default=None, repr=False)
+    phase: EventPhase | None = None
+
+    @property
+    def duration(self) -> float | None:
+        return None if self.ended is None else self.ended - self.started
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, TraceSpan]]:
+        """Yield this span then its descendants, depth first, with their depth."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+from .event import Event, _set_field
+
+
+@dataclass(frozen=True, slots=True)
+class TypedEvent(Event):
+    """Event whose own dataclass fields carry the data instead of payload.
+
+    Subclasses are declared as keyword-only slotted dataclasses and are routed
+    by class: listeners registered for a class also receive its subclasses.
+    The event name defaults to ``event_name`` or the class name.
+
+        @dataclass(frozen=True, slots=True, kw_only=True)
+        class UserCreated(TypedEvent):
+            user_id: int
+    """
+
+    event_name: ClassVar[str | None] = None
+
+    name: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            cls = type(self)
+            _set_field(self, "name", cls.event_name or cls.__name__)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_event.exception.event_dispatch_error import EventDispatchError
+
+if TYPE_CHECKING:
+    from wexample_event.dataclass.dispatch_result import DispatchResult
+
+
+class DeferredDispatchError(EventDispatchError):
+    """Raised once a deferred block flushed all its events, if listeners failed.
+
+    ``result`` is the first failed dispatch; ``results`` holds every one.
+    """
+
+    def __init__(self, results: list[DispatchResult]) -> None:
+        self.result = results[0]
+        self.results = results
+        Exception.__init__(
+            self,
+            f"{len(self.errors)} listener(s) failed while flushing deferred "
+            "events: "
+            + "; ".join(
+                f"'{result.event.name}' {type(error).__name__}: {error}"
+                for result in results
+                for error in result.errors
+            ),
+        )
+
+    @property
+    def errors(self) -> list[Exception]:
+        return [error for result in self.results for error in result.errors]
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_event.dataclass.dispatch_frame import DispatchFrame
+
+
+class EventCascadeError(RuntimeError):
+    """Raised when a dispatch would exceed the cascade depth or fan-out limit."""
+
+    def __init__(self, frame: DispatchFrame, reason: str) -> None:
+        self.frame = frame
+        super().__init__(f"{reason}: {' -> '.join(frame.chain())}")
+
+    @property
+    def chain(self) -> list[str]:
+        return self.frame.chain()
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_event.dataclass.dispatch_result import DispatchResult
+
+
+class EventDispatchError(Exception):
+    """Raised when listeners failed under the collect error policy."""
+
+    def __init__(self, result: DispatchResult) -> None:
+        self.result = result
+        errors = result.errors
+        super().__init__(
+            f"{len(errors)} listener(s) failed while dispatching "
+            f"'{result.event.name}': "
+            + "; ".join(f"{type(error).__name__}: {error}" for error in errors)
+        )
+
+    @property
+    def errors(self) -> list[Exception]:
+        return self.result.errors
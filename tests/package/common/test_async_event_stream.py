@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestAsyncEventStream(AbstractTestHelpers):
+    def test_stream_block_overflow(self) -> None:
+        """Test that a blocking stream holds back async and threaded producers."""
+        import threading
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        async def produce() -> None:
+            for index in range(5):
+                await dispatcher.dispatch_async("tick", payload={"index": index})
+
+        async def run_test() -> list[int]:
+            received = []
+            async with dispatcher.stream("tick", maxsize=2, overflow="block") as events:
+                producer = asyncio.create_task(produce())
+                await asyncio.sleep(0.01)
+                assert not producer.done()
+
+                thread = threading.Thread(
+                    target=lambda: dispatcher.dispatch("tick", payload={"index": 5})
+                )
+                async for event in events:
+                    received.append(event.payload["index"])
+                    if len(received) == 5:
+                        await producer
+                        thread.start()
+                    elif len(received) == 6:
+                        break
+                await asyncio.to_thread(thread.join)
+                assert events.dropped == 0
+            return received
+
+        async def open_invalid() -> None:
+            dispatcher.stream("tick", overflow="wait")
+
+        assert asyncio.run(run_test()) == [0, 1, 2, 3, 4, 5]
+        with pytest.raises(ValueError):
+            asyncio.run(open_invalid())
+
+    def test_stream_block_overflow_sync_dispatch(self) -> None:
+        """Test a plain dispatch on the loop thread into a full blocking stream."""
+        import warnings
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        async def run_test() -> tuple[int, int]:
+            async with dispatcher.stream("tick", maxsize=1, overflow="block") as events:
+                dispatcher.dispatch("tick")
+                result = dispatcher.dispatch_with_result("tick", error_policy="collect")
+                with pytest.raises(RuntimeError):
+                    dispatcher.dispatch("tick")
+                assert isinstance(result.errors[0], RuntimeError)
+                return len(events._buffer), events.dropped
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert asyncio.run(run_test()) == (1, 2)
+
+    def test_stream_bounded_drops_oldest(self) -> None:
+        """Test that a full buffer drops the oldest events."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        async def run_test() -> list[int]:
+            async with dispatcher.stream("tick", maxsize=2) as events:
+                for index in range(5):
+                    dispatcher.dispatch("tick", payload={"index": index})
+                events.close()
+                received = [event.payload["index"] async for event in events]
+                assert events.dropped == 3
+                return received
+
+        assert asyncio.run(run_test()) == [3, 4]
+
+    def test_stream_from_other_thread(self) -> None:
+        """Test that events dispatched from another thread reach the stream."""
+        import threading
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        async def run_test() -> list[int]:
+            received = []
+            async with dispatcher.stream("tick") as events:
+                thread = threading.Thread(
+                    target=lambda: [
+                        dispatcher.dispatch("tick", payload={"index": index})
+                        for index in range(3)
+                    ]
+                )
+                thread.start()
+                async for event in events:
+                    received.append(event.payload["index"])
+                    if len(received) == 3:
+                        break
+                thread.join()
+            return received
+
+        assert asyncio.run(run_test()) == [0, 1, 2]
+
+    def test_stream_predicate_and_unsubscribe(self) -> None:
+        """Test predicate filtering and listener removal on exit."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        async def run_test() -> int:
+            async with dispatcher.stream(
+                "tick", predicate=lambda event: event.payload["index"] % 2 == 0
+            ) as events:
+                assert dispatcher.has_event_listeners("tick")
+                for index in range(4):
+                    dispatcher.dispatch("tick", payload={"index": index})
+                async for event in events:
+                    if event.payload["index"] == 2:
+                        return event.payload["index"]
+            return -1
+
+        assert asyncio.run(run_test()) == 2
+        assert not dispatcher.has_event_listeners("tick")
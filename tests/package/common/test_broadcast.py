@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+def _build_tree():
+    from wexample_event.common.dispatcher import EventDispatcherMixin
+
+    class Node(EventDispatcherMixin):
+        def __init__(self, label: str, parent=None) -> None:
+            self.children = []
+            self.label = label
+            self.parent = parent
+            self.visits = 0
+            if parent is not None:
+                parent.children.append(self)
+
+        def _get_bubbling_parent(self):
+            return self.parent
+
+        def _get_event_children(self):
+            self.visits += 1
+            return self.children
+
+    root = Node("root")
+    branches = [Node(f"b{index}", parent=root) for index in range(3)]
+    leaves = [
+        Node(f"{branch.label}.l{index}", parent=branch)
+        for branch in branches
+        for index in range(2)
+    ]
+    return root, branches, leaves
+
+
+class TestBroadcast(AbstractTestHelpers):
+    def test_broadcast_async_concurrent(self) -> None:
+        """Test that siblings run concurrently, level by level."""
+        root, branches, leaves = _build_tree()
+        running = []
+        peak = []
+
+        async def listener(event) -> None:
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        for node in leaves:
+            node.add_event_listener("config.reloaded", listener)
+
+        asyncio.run(root.broadcast_async("config.reloaded", concurrent=True))
+
+        assert len(peak) == 6
+        assert max(peak) == 6
+
+    def test_broadcast_attach_child(self) -> None:
+        """Test counting listeners of a subtree attached later."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        root, branches, leaves = _build_tree()
+        received = []
+
+        class Orphan(EventDispatcherMixin):
+            parent = None
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+        orphan = Orphan()
+        orphan.add_event_listener("ping", lambda event: received.append("orphan"))
+        orphan.parent = branches[0]
+        branches[0].children.append(orphan)
+
+        root.broadcast("ping")
+        branches[0]._attach_event_child(orphan)
+        root.broadcast("ping")
+        branches[0]._detach_event_child(orphan)
+
+        assert received == ["orphan"]
+        assert not root._get_subtree_counts()
+
+    def test_broadcast_cascade_and_tracer(self) -> None:
+        """Test that broadcasts are traced and bounded like dispatches."""
+        import pytest
+
+        from wexample_event.common.in_memory_tracer import InMemoryTracer
+        from wexample_event.exception.event_cascade_error import EventCascadeError
+
+        root, branches, leaves = _build_tree()
+        type(root)._max_dispatch_depth = 5
+        tracer = InMemoryTracer()
+        root.set_dispatch_tracer(tracer)
+        leaves[0].add_event_listener("loop", lambda event: root.broadcast("loop"))
+
+        with pytest.raises(EventCascadeError) as error:
+            root.broadcast("loop")
+        with pytest.raises(EventCascadeError):
+            asyncio.run(root.broadcast_async("loop"))
+
+        assert error.value.chain == ["loop"] * 6
+        assert [(depth, span.kind) for depth, span in tracer.roots[0].walk()] == [
+            (depth, "dispatch") for depth in range(5)
+        ]
+        assert all(span.ended is not None for _, span in tracer.roots[1].walk())
+
+    def test_broadcast_flat_dispatcher(self) -> None:
+        """Test that dispatchers outside a tree keep no subtree counts."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+        dispatcher.add_event_listener("ping", lambda event: received.append("ping"))
+        dispatcher.broadcast("ping")
+
+        assert received == ["ping"]
+        assert not hasattr(dispatcher, "_event_subtree_counts")
+
+    def test_broadcast_order_and_counts(self) -> None:
+        """Test order of delivery and maintained subtree counts."""
+        root, branches, leaves = _build_tree()
+        received = []
+
+        for node in (root, branches[1], leaves[0], leaves[3]):
+            node.add_event_listener(
+                "config.reloaded", lambda event, node=node: received.append(node.label)
+            )
+        once_node = leaves[5]
+        once_node.add_event_listener(
+            "config.reloaded", lambda event: received.append("once"), once=True
+        )
+
+        root.broadcast("config.reloaded")
+
+        assert received == ["root", "b0.l0", "b1", "b1.l1", "once"]
+        assert [branch.visits for branch in branches] == [1, 1, 1]
+        assert root._get_subtree_counts() == {"config.reloaded": 4}
+
+        received.clear()
+        for branch in branches:
+            branch.visits = 0
+        root.broadcast("config.reloaded")
+
+        assert received == ["root", "b0.l0", "b1", "b1.l1"]
+        assert branches[2].visits == 0
+
+        for node in (root, branches[1], leaves[0], leaves[3]):
+            node.clear_event_listeners()
+        assert root._get_subtree_counts() == {}
@@ -4,6 +4,94 @@ from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
 
 
 class TestEventBubbling(AbstractTestHelpers):
+    def test_bubbling_ancestor_index(self) -> None:
+        """Test that bubbling is skipped when no ancestor listens."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+
+        class Node(EventDispatcherMixin):
+            _enable_ancestor_index = True
+            _enable_bubbling = True
+
+            def __init__(self, parent=None) -> None:
+                self.children = []
+                self.parent = parent
+                self.parent_lookups = 0
+                if parent is not None:
+                    parent.children.append(self)
+
+            def _get_bubbling_parent(self):
+                self.parent_lookups += 1
+                return self.parent
+
+            def _get_event_children(self):
+                return self.children
+
+        root = Node()
+        middle = Node(parent=root)
+        leaf = Node(parent=middle)
+        received = []
+
+        def listener(event: Event) -> None:
+            received.append(event.name)
+
+        leaf.add_event_listener("test", listener)
+        leaf.parent_lookups = 0
+        leaf.dispatch("test")
+        # The first dispatch walks the chain once to compute the counts.
+        assert leaf.parent_lookups == 1
+        leaf.dispatch("test")
+        assert leaf.parent_lookups == 1
+
+        root.add_event_listener("test", listener, capture=True)
+        leaf.dispatch("test")
+        assert leaf.parent_lookups == 2
+        assert received == ["test"] * 4
+
+        root.remove_event_listener("test", listener, capture=True)
+        assert not leaf._event_ancestor_counts
+
+        orphan = Node()
+        orphan.add_event_listener("test", listener)
+        orphan.parent = leaf
+        leaf.children.append(orphan)
+        leaf._attach_event_child(orphan)
+        assert orphan._get_ancestor_counts() == {"test": 1}
+        assert root._get_subtree_counts() == {"test": 2}
+
+        leaf._detach_event_child(orphan)
+        orphan.parent = None
+        assert not orphan._get_ancestor_counts()
+
+    def test_bubbling_ancestor_index_late_child(self) -> None:
+        """Test a child linked after its ancestor registered a listener."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class Node(EventDispatcherMixin):
+            _enable_ancestor_index = True
+            _enable_bubbling = True
+
+            def __init__(self, parent=None) -> None:
+                self.children = []
+                self.parent = parent
+                if parent is not None:
+                    parent.children.append(self)
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+            def _get_event_children(self):
+                return self.children
+
+        root = Node()
+        received = []
+        root.add_event_listener("x", lambda event: received.append("root"))
+        Node(parent=Node(parent=root)).dispatch("x")
+        root.add_event_listener("x", lambda event: received.append("again"))
+        Node(parent=root).dispatch("x")
+
+        assert received == ["root", "root", "again"]
+
     def test_bubbling_async(self) -> None:
         """Test that bubbling works with async dispatch."""
         import asyncio
@@ -38,6 +126,98 @@ class TestEventBubbling(AbstractTestHelpers):
         assert len(parent_events) == 1
         assert parent_events[0] == "test"
 
+    def test_bubbling_capture_async(self) -> None:
+        """Test capture and bubble phases with async dispatch."""
+        import asyncio
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+
+        class Node(EventDispatcherMixin):
+            _enable_bubbling = True
+
+            def __init__(self, parent=None) -> None:
+                self.parent = parent
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+        root = Node()
+        child = Node(parent=root)
+        calls = []
+
+        async def capture(event: Event) -> None:
+            calls.append("capture")
+
+        async def bubble(event: Event) -> None:
+            calls.append("bubble")
+
+        root.add_event_listener("test", capture, capture=True)
+        root.add_event_listener("test", bubble)
+        child.add_event_listener("test", lambda event: calls.append("target"))
+
+        asyncio.run(child.dispatch_async("test"))
+
+        assert calls == ["capture", "target", "bubble"]
+
+    def test_bubbling_capture_phases(self) -> None:
+        """Test DOM-style capture, target and bubble ordering."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_phase import EventPhase
+        from wexample_event.common.listener import EventListenerMixin
+        from wexample_event.common.propagation import current_propagation
+        from wexample_event.dataclass.event import Event
+
+        class Node(EventDispatcherMixin):
+            _enable_bubbling = True
+
+            def __init__(self, label: str, parent=None) -> None:
+                self.label = label
+                self.parent = parent
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+        root = Node("root")
+        middle = Node("middle", parent=root)
+        leaf = Node("leaf", parent=middle)
+        calls = []
+
+        def recorder(tag: str):
+            def listener(event: Event) -> None:
+                state = current_propagation()
+                calls.append((tag, state.current_target.label, state.phase))
+
+            return listener
+
+        class Auditor(EventListenerMixin):
+            @EventListenerMixin.on("test", capture=True)
+            def audit(self, event: Event) -> None:
+                calls.append(("auditor", None, None))
+
+        for node in (root, middle, leaf):
+            node.add_event_listener("test", recorder("capture"), capture=True)
+            node.add_event_listener("test", recorder("bubble"))
+        auditor = Auditor()
+        auditor.bind_to_dispatcher(root)
+
+        leaf.dispatch("test")
+
+        assert calls == [
+            ("capture", "root", EventPhase.CAPTURE),
+            ("auditor", None, None),
+            ("capture", "middle", EventPhase.CAPTURE),
+            ("capture", "leaf", EventPhase.TARGET),
+            ("bubble", "leaf", EventPhase.TARGET),
+            ("bubble", "middle", EventPhase.BUBBLE),
+            ("bubble", "root", EventPhase.BUBBLE),
+        ]
+        assert current_propagation() is None
+
+        auditor.unbind_from_dispatcher()
+        assert root.has_event_listeners("test")
+        assert not root.remove_event_listener("test", auditor.audit)
+
     def test_bubbling_disabled_by_default(self) -> None:
         """Test that bubbling is disabled by default."""
         from wexample_event.common.dispatcher import EventDispatcherMixin
@@ -134,6 +314,91 @@ class TestEventBubbling(AbstractTestHelpers):
         assert len(middle.received_events) == 1
         assert len(root.received_events) == 1
 
+    def test_bubbling_nested_dispatch_keeps_propagation(self) -> None:
+        """Test that a nested dispatch cannot stop the propagation running it."""
+        import asyncio
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.propagation import (
+            current_propagation,
+            stop_propagation,
+        )
+
+        class Node(EventDispatcherMixin):
+            _enable_bubbling = True
+
+            def __init__(self, parent=None) -> None:
+                self.parent = parent
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+        class Audit(EventDispatcherMixin):
+            pass
+
+        root = Node()
+        child = Node(root)
+        audit = Audit()
+        received = []
+        states = []
+
+        def on_audit(event) -> None:
+            states.append(current_propagation())
+            stop_propagation()
+
+        async def on_save_async(event) -> None:
+            await audit.dispatch_async("audit")
+
+        audit.add_event_listener("audit", on_audit)
+        child.add_event_listener("save", lambda event: audit.dispatch("audit"))
+        child.add_event_listener("save", lambda event: audit.broadcast("audit"))
+        child.add_event_listener("save_async", on_save_async)
+        root.add_event_listener("save", lambda event: received.append(event.name))
+        root.add_event_listener("save_async", lambda event: received.append(event.name))
+
+        child.dispatch("save")
+        asyncio.run(child.dispatch_async("save_async"))
+
+        assert received == ["save", "save_async"]
+        assert states == [None, None, None]
+
+    def test_bubbling_stop_propagation(self) -> None:
+        """Test that an ancestor intercepts an event during capture."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.propagation import stop_propagation
+        from wexample_event.dataclass.event import Event
+
+        class Node(EventDispatcherMixin):
+            _enable_bubbling = True
+
+            def __init__(self, parent=None) -> None:
+                self.parent = parent
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+        root = Node()
+        child = Node(parent=root)
+        calls = []
+
+        def guard(event: Event) -> None:
+            calls.append("guard")
+            if event.payload["blocked"]:
+                stop_propagation()
+
+        root.add_event_listener("test", guard, capture=True)
+        root.add_event_listener(
+            "test", lambda event: calls.append("sibling"), capture=True
+        )
+        child.add_event_listener("test", lambda event: calls.append("target"))
+        root.add_event_listener("test", lambda event: calls.append("bubble"))
+
+        child.dispatch("test", payload={"blocked": True})
+        child.dispatch("test", payload={"blocked": False})
+        stop_propagation()
+
+        assert calls == ["guard", "sibling", "guard", "sibling", "target", "bubble"]
+
     def test_bubbling_stops_at_no_parent(self) -> None:
         """Test that bubbling stops when no parent exists."""
         from wexample_event.common.dispatcher import EventDispatcherMixin
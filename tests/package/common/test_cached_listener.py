@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestCachedListener(AbstractTestHelpers):
+    def test_cached_listener_async(self) -> None:
+        """Test that async results are cached once awaited."""
+        from wexample_event.common.cached_listener import cached_listener
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        calls = []
+
+        @cached_listener(lambda event: event.payload["id"])
+        async def listener(event) -> int:
+            calls.append(event.payload["id"])
+            return len(calls)
+
+        dispatcher = TestDispatcher()
+        dispatcher.add_event_listener("job", listener)
+        for _ in range(3):
+            asyncio.run(dispatcher.dispatch_async("job", payload={"id": 1}))
+
+        assert calls == [1]
+        assert listener.stats().hits == 2
+
+    def test_cached_listener_eviction(self) -> None:
+        """Test LRU eviction, TTL expiry and keys bypassing the cache."""
+        from wexample_event.common.cached_listener import CachedListener
+        from wexample_event.dataclass.event import Event
+
+        now = [0.0]
+        calls = []
+        listener = CachedListener(
+            lambda event: calls.append(event.name),
+            lambda event: None if event.name == "raw" else event.name,
+            maxsize=2,
+            ttl=10,
+            clock=lambda: now[0],
+        )
+
+        for name in ("a", "b", "a", "c", "b", "raw", "raw"):
+            listener(Event(name=name))
+        assert calls == ["a", "b", "c", "b", "raw", "raw"]
+
+        now[0] = 20.0
+        listener(Event(name="b"))
+        stats = listener.stats()
+
+        assert calls[-1] == "b"
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 5, 3, 2)
+        with pytest.raises(ValueError):
+            CachedListener(print, hash, maxsize=0)
+
+    def test_cached_listener_on(self) -> None:
+        """Test the on() cache option and dispatcher statistics."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.listener import EventListenerMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        class TestListener(EventListenerMixin):
+            def __init__(self) -> None:
+                self.computed = 0
+
+            @EventListenerMixin.on(
+                "price", cache_key=lambda event: event.payload["sku"], cache_size=8
+            )
+            def handle_price(self, event) -> int:
+                self.computed += 1
+                if event.payload["sku"] == "bad":
+                    raise RuntimeError("boom")
+                return self.computed
+
+        dispatcher = TestDispatcher()
+        listener = TestListener()
+        listener.bind_to_dispatcher(dispatcher)
+        for sku in ("x", "y", "x", "x", "bad", "bad"):
+            dispatcher.dispatch(
+                "price", payload={"sku": sku}, error_policy="log_and_continue"
+            )
+
+        (stats,) = dispatcher.get_listener_cache_stats("price")
+        assert listener.computed == 4
+        assert (stats.hits, stats.misses, stats.size) == (2, 4, 2)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+        assert stats.callback == listener.handle_price
+        assert dispatcher.get_listener_cache_stats("other") == []
+
+        listener.unbind_from_dispatcher()
+        assert not dispatcher.has_event_listeners("price")
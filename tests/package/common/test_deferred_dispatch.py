@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestDeferredDispatch(AbstractTestHelpers):
+    def test_deferred_dispatch_dedup(self) -> None:
+        """Test buffering until exit and deduplication by key."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+        dispatcher.add_event_listener(
+            "entity.updated",
+            lambda event: received.append(
+                (event.payload["id"], event.payload["version"])
+            ),
+        )
+        dispatcher.add_event_listener("ping", lambda event: received.append("ping"))
+
+        with dispatcher.deferred(
+            key=lambda event: (
+                (event.name, event.payload["id"]) if event.payload else None
+            )
+        ) as deferred:
+            for version in range(50):
+                for entity_id in (1, 2):
+                    dispatcher.dispatch(
+                        "entity.updated",
+                        payload={"id": entity_id, "version": version},
+                    )
+            dispatcher.dispatch("ping")
+            dispatcher.dispatch("ping")
+            assert received == []
+            assert len(deferred) == 4
+
+        assert received == [(1, 49), (2, 49), "ping", "ping"]
+
+        received.clear()
+        with dispatcher.deferred(key=lambda event: event.name, keep="first"):
+            for version in range(3):
+                dispatcher.dispatch(
+                    "entity.updated", payload={"id": 1, "version": version}
+                )
+        assert received == [(1, 0)]
+
+        with pytest.raises(ValueError):
+            dispatcher.deferred(keep="middle")
+
+    def test_deferred_dispatch_listener_error(self) -> None:
+        """Test that a failing listener does not drop later events."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.exception.deferred_dispatch_error import (
+            DeferredDispatchError,
+        )
+        from wexample_event.exception.event_dispatch_error import EventDispatchError
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+
+        def fail(event) -> None:
+            raise RuntimeError(event.name)
+
+        dispatcher.add_event_listener("a", fail, priority=1)
+        dispatcher.add_event_listener("a", lambda event: received.append("a"))
+        dispatcher.add_event_listener("b", lambda event: received.append("b"))
+        dispatcher.add_event_listener("c", fail)
+
+        with pytest.raises(DeferredDispatchError) as error:
+            with dispatcher.deferred():
+                dispatcher.dispatch("a")
+                dispatcher.dispatch("b")
+                dispatcher.dispatch("c")
+
+        assert received == ["a", "b"]
+        assert isinstance(error.value, EventDispatchError)
+        assert [str(error) for error in error.value.errors] == ["a", "c"]
+        assert error.value.result.event.name == "a"
+
+        with dispatcher.deferred(error_policy="log_and_continue"):
+            dispatcher.dispatch("c")
+            dispatcher.dispatch("b")
+        assert received == ["a", "b", "b"]
+
+    def test_deferred_dispatch_nested(self) -> None:
+        """Test nested blocks and that other threads dispatch right away."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+        dispatcher.add_event_listener("job", lambda event: received.append(event))
+
+        with dispatcher.deferred() as outer:
+            with dispatcher.deferred():
+                dispatcher.dispatch("job")
+            assert received == []
+            assert len(outer) == 1
+
+            thread = threading.Thread(target=dispatcher.dispatch, args=("job",))
+            thread.start()
+            thread.join()
+            assert len(received) == 1
+
+        assert len(received) == 2
+
+    def test_deferred_dispatch_rollback(self) -> None:
+        """Test that events are dropped when the block raises."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+        dispatcher.add_event_listener("job", lambda event: received.append(event))
+
+        with pytest.raises(RuntimeError):
+            with dispatcher.deferred():
+                dispatcher.dispatch("job")
+                raise RuntimeError("rollback")
+
+        with dispatcher.deferred() as deferred:
+            dispatcher.dispatch("job")
+            deferred.rollback()
+
+        assert received == []
+        dispatcher.dispatch("job")
+        assert len(received) == 1
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestDispatchCascade(AbstractTestHelpers):
+    def test_dispatch_cascade_context(self) -> None:
+        """Test the dispatch frames seen by nested sync and async listeners."""
+        from wexample_event.common.dispatch_context import current_dispatch
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            _track_dispatch_frames = True
+
+        class UntrackedDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        untracked = UntrackedDispatcher()
+        seen = []
+
+        def on_outer(event) -> None:
+            dispatcher.dispatch("inner")
+
+        def on_inner(event) -> None:
+            frame = current_dispatch()
+            seen.append((frame.depth, frame.chain()))
+
+        async def on_async(event) -> None:
+            await asyncio.sleep(0)
+            seen.append(current_dispatch().chain())
+
+        dispatcher.add_event_listener("outer", on_outer)
+        dispatcher.add_event_listener("inner", on_inner)
+        dispatcher.add_event_listener("async", on_async)
+        untracked.add_event_listener(
+            "outer", lambda event: seen.append(current_dispatch())
+        )
+        untracked.dispatch("outer")
+        dispatcher.dispatch("outer")
+        asyncio.run(dispatcher.dispatch_async("async"))
+
+        assert seen == [None, (2, ["outer", "inner"]), ["async"]]
+        assert current_dispatch() is None
+
+    def test_dispatch_cascade_graph(self) -> None:
+        """Test recording the cascade graph and finding its cycles."""
+        from wexample_event.common.cascade_graph import CascadeGraph
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            _max_dispatch_depth = 5
+
+        dispatcher = TestDispatcher()
+        graph = CascadeGraph()
+        dispatcher.set_cascade_graph(graph)
+        dispatcher.add_event_listener("a", lambda event: dispatcher.dispatch("b"))
+        dispatcher.add_event_listener("b", lambda event: dispatcher.dispatch("a"))
+        dispatcher.add_event_listener("c", lambda event: dispatcher.dispatch("c"))
+        dispatcher.dispatch("a", error_policy="log_and_continue")
+        dispatcher.dispatch("c", error_policy="log_and_continue")
+
+        assert graph.roots == {"a": 1, "c": 1}
+        assert graph.edges == {("a", "b"): 2, ("b", "a"): 2, ("c", "c"): 4}
+        assert graph.cycles() == [["a", "b"], ["c"]]
+        assert '"a" -> "b" [label="2"];' in graph.to_dot()
+
+    def test_dispatch_cascade_limits(self) -> None:
+        """Test that runaway loops and fan-out are cut by the limits."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.exception.event_cascade_error import EventCascadeError
+
+        class TestDispatcher(EventDispatcherMixin):
+            _max_cascade_fanout = 3
+            _max_dispatch_depth = 8
+
+        dispatcher = TestDispatcher()
+        received = []
+
+        def on_ping(event) -> None:
+            received.append(event.name)
+            dispatcher.dispatch("pong")
+
+        def on_pong(event) -> None:
+            dispatcher.dispatch("ping")
+
+        def on_burst(event) -> None:
+            for _ in range(5):
+                dispatcher.dispatch("noop")
+
+        dispatcher.add_event_listener("ping", on_ping)
+        dispatcher.add_event_listener("pong", on_pong)
+        dispatcher.add_event_listener("burst", on_burst)
+
+        with pytest.raises(EventCascadeError) as depth_error:
+            dispatcher.dispatch("ping")
+        with pytest.raises(EventCascadeError) as fanout_error:
+            dispatcher.dispatch("burst")
+
+        assert len(received) == 4
+        assert depth_error.value.chain == ["ping", "pong"] * 4 + ["ping"]
+        assert "fan-out of 'burst' exceeds 3" in str(fanout_error.value)
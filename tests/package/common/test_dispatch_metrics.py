@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import urllib.request
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestDispatchMetrics(AbstractTestHelpers):
+    def test_dispatch_metrics_counters(self) -> None:
+        """Test counters recorded from several threads and a dispatcher tree."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class Node(EventDispatcherMixin):
+            _enable_bubbling = True
+
+            def __init__(self, parent=None) -> None:
+                self.parent = parent
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+        root = Node()
+        child = Node(root)
+        metrics = child.enable_dispatch_metrics()
+        root.enable_dispatch_metrics(metrics)
+
+        def fail(event) -> None:
+            raise RuntimeError("boom")
+
+        root.add_event_listener("job", lambda event: None)
+        child.add_event_listener("job", fail, once=True)
+
+        def worker() -> None:
+            for _ in range(50):
+                child.dispatch("job", error_policy="log_and_continue")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        counters = metrics.counters()
+        job = (("event", "job"),)
+        assert counters["dispatched_total", job] == 200
+        assert counters["listener_invocations_total", job] == 201
+        assert counters["listener_errors_total", job] == 1
+        assert counters["once_removed_total", job] == 1
+        assert counters["bubble_hops_total", (*job, ("phase", "bubble"))] == 200
+        assert set(metrics.latency_quantiles()["job"]) == {0.5, 0.9, 0.99}
+
+        metrics.reset()
+        assert metrics.counters() == {}
+
+    def test_dispatch_metrics_prometheus(self, tmp_path) -> None:
+        """Test the Prometheus text export to a file and over HTTP."""
+        from wexample_event.common.dispatch_metrics import DispatchMetrics
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.priority_event_queue import PriorityEventQueue
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        metrics = dispatcher.enable_dispatch_metrics(DispatchMetrics(namespace="app"))
+        queue = PriorityEventQueue(dispatcher)
+        metrics.add_gauge("queue_depth", lambda: len(queue), "Queued events.")
+        dispatcher.add_event_listener('say "hi"', lambda event: None)
+        dispatcher.dispatch('say "hi"')
+        queue.put("later")
+
+        text = metrics.render_prometheus()
+        assert 'app_dispatched_total{event="say \\"hi\\""} 1' in text
+        assert "# TYPE app_listener_latency_seconds summary" in text
+        assert 'app_listener_latency_seconds_count{event="say \\"hi\\""} 1' in text
+        assert "app_queue_depth 1" in text
+
+        path = tmp_path / "metrics.prom"
+        metrics.write_prometheus(path)
+        assert path.read_text() == text
+
+        server = metrics.serve_prometheus()
+        try:
+            host, port = server.server_address[:2]
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+                assert response.read().decode() == text
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        with pytest.raises(ValueError):
+            DispatchMetrics(window=0)
+
+    def test_dispatch_metrics_with_tracer(self) -> None:
+        """Test that metrics keep being collected next to tracers."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.in_memory_tracer import InMemoryTracer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        metrics = dispatcher.enable_dispatch_metrics()
+        tracer = InMemoryTracer()
+        global_tracer = InMemoryTracer()
+        dispatcher.add_event_listener("ping", lambda event: None)
+
+        dispatcher.set_dispatch_tracer(tracer)
+        dispatcher.dispatch("ping")
+        dispatcher.set_dispatch_tracer(None)
+        EventDispatcherMixin.set_global_dispatch_tracer(global_tracer)
+        try:
+            dispatcher.dispatch("ping")
+        finally:
+            EventDispatcherMixin.set_global_dispatch_tracer(None)
+        dispatcher.dispatch("ping")
+
+        assert metrics.counters()["dispatched_total", (("event", "ping"),)] == 3
+        assert len(tracer.roots) == 1
+        assert len(global_tracer.roots) == 1
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestDispatchTracer(AbstractTestHelpers):
+    def test_dispatch_tracer_bubbling(self) -> None:
+        """Test bubble hops and listener phases of a tree dispatch."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_phase import EventPhase
+        from wexample_event.common.in_memory_tracer import InMemoryTracer
+
+        class Node(EventDispatcherMixin):
+            _enable_bubbling = True
+
+            def __init__(self, parent=None) -> None:
+                self.parent = parent
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+        root = Node()
+        child = Node(root)
+        tracer = InMemoryTracer()
+        EventDispatcherMixin.set_global_dispatch_tracer(tracer)
+        try:
+            root.add_event_listener("click", lambda event: None)
+            child.dispatch("click")
+        finally:
+            EventDispatcherMixin.set_global_dispatch_tracer(None)
+        child.dispatch("click")
+
+        (span,) = tracer.roots
+        assert span.hops == [(EventPhase.CAPTURE, root), (EventPhase.BUBBLE, root)]
+        (listener,) = span.children
+        assert (listener.dispatcher, listener.phase) == (root, EventPhase.BUBBLE)
+
+    def test_dispatch_tracer_disabled(self) -> None:
+        """Test that dispatchers are untraced by default."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.in_memory_tracer import InMemoryTracer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        tracer = InMemoryTracer()
+        traced = TestDispatcher()
+        untraced = TestDispatcher()
+        traced.set_dispatch_tracer(tracer)
+        for dispatcher in (traced, untraced):
+            dispatcher.add_event_listener("ping", lambda event: None)
+            dispatcher.dispatch("ping")
+        traced.set_dispatch_tracer(None)
+        traced.dispatch("ping")
+
+        assert untraced._event_tracer is None
+        assert [span.name for span in tracer.roots] == ["ping"]
+
+    def test_dispatch_tracer_nested(self) -> None:
+        """Test that dispatches from listeners nest under the listener span."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.in_memory_tracer import InMemoryTracer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        tracer = InMemoryTracer()
+        dispatcher.set_dispatch_tracer(tracer)
+
+        def on_order(event) -> None:
+            dispatcher.dispatch("invoice")
+
+        def on_invoice(event) -> None:
+            raise RuntimeError("boom")
+
+        async def on_async(event) -> None:
+            await asyncio.sleep(0)
+
+        dispatcher.add_event_listener("order", on_order)
+        dispatcher.add_event_listener("invoice", on_invoice)
+        dispatcher.add_event_listener("async", on_async)
+        dispatcher.dispatch("order", error_policy="log_and_continue")
+        asyncio.run(dispatcher.dispatch_async("async"))
+
+        assert [
+            (depth, span.kind, span.name)
+            for root in tracer.roots
+            for depth, span in root.walk()
+        ] == [
+            (0, "dispatch", "order"),
+            (1, "listener", on_order.__qualname__),
+            (2, "dispatch", "invoice"),
+            (3, "listener", on_invoice.__qualname__),
+            (0, "dispatch", "async"),
+            (1, "listener", on_async.__qualname__),
+        ]
+        invoice = tracer.roots[0].children[0].children[0]
+        assert isinstance(invoice.children[0].error, RuntimeError)
+        assert all(span.ended is not None for _, span in tracer.roots[0].walk())
+        assert "!RuntimeError" in tracer.render()
+
+        tracer.clear()
+        assert tracer.roots == []
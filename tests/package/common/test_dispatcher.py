@@ -131,6 +131,34 @@ class TestEventDispatcherMixin(AbstractTestHelpers):
         assert len(call_count) == 1
         assert call_count[0] == "test2"
 
+    def test_dispatcher_concurrent_registration(self) -> None:
+        """Test lazy state creation and registration racing across threads."""
+        import threading
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            for _ in range(100):
+                dispatcher.add_event_listener("test", lambda event: None)
+                dispatcher.dispatch("test")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        bucket = dispatcher._event_listeners["test"]
+        assert len(bucket) == 800
+        assert len(set(bucket.orders)) == 800
+
     def test_dispatcher_default_source_is_dispatcher(self) -> None:
         """Test that default source is the dispatcher itself."""
         from wexample_event.common.dispatcher import EventDispatcherMixin
@@ -315,6 +343,91 @@ class TestEventDispatcherMixin(AbstractTestHelpers):
         dispatcher.dispatch("test")
         assert len(call_count) == 1  # Should not increase
 
+    def test_dispatcher_once_listener_concurrent(self) -> None:
+        """Test that a once-listener fires exactly once across threads."""
+        import threading
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        call_count = []
+        barrier = threading.Barrier(8)
+
+        def listener(event: Event) -> None:
+            call_count.append(1)
+
+        dispatcher.add_event_listener("test", listener, once=True)
+
+        def worker() -> None:
+            barrier.wait()
+            dispatcher.dispatch("test")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(call_count) == 1
+        assert not dispatcher.has_event_listeners("test")
+
+    def test_dispatcher_once_listener_duplicate_callback(self) -> None:
+        """Test that once removal only drops the fired record, not other copies."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        call_count = []
+
+        def listener(event: Event) -> None:
+            call_count.append(1)
+
+        dispatcher.add_event_listener("test", listener)
+        dispatcher.add_event_listener("test", listener, once=True)
+
+        dispatcher.dispatch("test")
+        dispatcher.dispatch("test")
+
+        assert len(call_count) == 3
+
+    def test_dispatcher_once_listener_restored_when_not_reached(self) -> None:
+        """Test that claimed once-listeners survive a dispatch aborted before them."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.priority import EventPriority
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        call_count = []
+        failures = [ValueError("boom")]
+
+        def failing(event: Event) -> None:
+            if failures:
+                raise failures.pop()
+
+        def listener(event: Event) -> None:
+            call_count.append(1)
+
+        dispatcher.add_event_listener("test", failing, priority=EventPriority.HIGH)
+        dispatcher.add_event_listener("test", listener, once=True)
+
+        with pytest.raises(ValueError):
+            dispatcher.dispatch("test")
+
+        dispatcher.dispatch("test")
+        dispatcher.dispatch("test")
+
+        assert len(call_count) == 1
+
     def test_dispatcher_priority_ordering(self) -> None:
         """Test that listeners are called in priority order."""
         from wexample_event.common.dispatcher import EventDispatcherMixin
@@ -435,6 +548,47 @@ class TestEventDispatcherMixin(AbstractTestHelpers):
 
         assert len(call_count) == 50
 
+    def test_dispatcher_wait_for(self) -> None:
+        """Test awaiting the next event matching a predicate."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        async def run_test():
+            async def produce() -> None:
+                for index in range(3):
+                    await asyncio.sleep(0)
+                    dispatcher.dispatch("tick", payload={"index": index})
+
+            producer = asyncio.ensure_future(produce())
+            event = await dispatcher.wait_for(
+                "tick", predicate=lambda event: event.payload["index"] == 1
+            )
+            await producer
+            return event
+
+        event = asyncio.run(run_test())
+
+        assert event.payload["index"] == 1
+        assert not dispatcher.has_event_listeners("tick")
+
+    def test_dispatcher_wait_for_timeout(self) -> None:
+        """Test that wait_for times out and unsubscribes."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(dispatcher.wait_for("never", timeout=0.01))
+
+        assert not dispatcher.has_event_listeners("never")
+
     def test_dispatcher_with_event_object(self) -> None:
         """Test dispatching with an Event object."""
         from wexample_event.common.dispatcher import EventDispatcherMixin
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestDispatchErrorPolicy(AbstractTestHelpers):
+    def test_error_policy_async_collect(self) -> None:
+        """Test that async dispatch runs every listener under collect."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        calls = []
+
+        async def failing(event: Event) -> None:
+            raise ValueError("boom")
+
+        async def working(event: Event) -> None:
+            calls.append(event.name)
+
+        dispatcher.add_event_listener("test", failing)
+        dispatcher.add_event_listener("test", working)
+
+        result = asyncio.run(
+            dispatcher.dispatch_async_with_result("test", error_policy="collect")
+        )
+
+        assert calls == ["test"]
+        assert len(result.outcomes) == 2
+        assert isinstance(result.errors[0], ValueError)
+
+    def test_error_policy_class_default(self) -> None:
+        """Test that the policy can be configured on the dispatcher class."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.error_policy import DispatchErrorPolicy
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            _event_error_policy = DispatchErrorPolicy.LOG_AND_CONTINUE
+
+        dispatcher = TestDispatcher()
+        calls = []
+
+        def failing(event: Event) -> None:
+            raise ValueError("boom")
+
+        dispatcher.add_event_listener("test", failing)
+        dispatcher.add_event_listener("test", lambda event: calls.append(1))
+
+        dispatcher.dispatch("test")
+
+        assert calls == [1]
+
+    def test_error_policy_collect_raises_aggregate(self) -> None:
+        """Test that collect runs all listeners then raises one aggregated error."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+        from wexample_event.exception.event_dispatch_error import EventDispatchError
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        calls = []
+
+        def first(event: Event) -> None:
+            raise ValueError("first")
+
+        def second(event: Event) -> None:
+            calls.append("second")
+
+        def third(event: Event) -> None:
+            raise KeyError("third")
+
+        dispatcher.add_event_listener("test", first)
+        dispatcher.add_event_listener("test", second)
+        dispatcher.add_event_listener("test", third)
+
+        with pytest.raises(EventDispatchError) as info:
+            dispatcher.dispatch("test", error_policy="collect")
+
+        assert calls == ["second"]
+        assert len(info.value.errors) == 2
+        assert isinstance(info.value.__cause__, ValueError)
+
+    def test_error_policy_log_and_continue(self, caplog) -> None:
+        """Test that log_and_continue logs failures without raising."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.error_policy import DispatchErrorPolicy
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        calls = []
+
+        def failing(event: Event) -> None:
+            raise ValueError("boom")
+
+        dispatcher.add_event_listener("test", failing)
+        dispatcher.add_event_listener("test", lambda event: calls.append(1))
+
+        with caplog.at_level("ERROR"):
+            dispatcher.dispatch(
+                "test", error_policy=DispatchErrorPolicy.LOG_AND_CONTINUE
+            )
+
+        assert calls == [1]
+        assert "boom" in caplog.text
+
+    def test_error_policy_once_removed_on_failure(self) -> None:
+        """Test that once-listeners already called are removed when a later one raises."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.priority import EventPriority
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        calls = []
+
+        def once_listener(event: Event) -> None:
+            calls.append("once")
+
+        def failing(event: Event) -> None:
+            raise ValueError("boom")
+
+        dispatcher.add_event_listener(
+            "test", once_listener, once=True, priority=EventPriority.HIGH
+        )
+        dispatcher.add_event_listener("test", failing)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                dispatcher.dispatch("test")
+
+        assert calls == ["once"]
+
+    def test_error_policy_raise_first_is_default(self) -> None:
+        """Test that the first failure aborts dispatch by default."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        calls = []
+
+        def failing(event: Event) -> None:
+            raise ValueError("boom")
+
+        dispatcher.add_event_listener("test", failing)
+        dispatcher.add_event_listener("test", lambda event: calls.append(1))
+
+        with pytest.raises(ValueError):
+            dispatcher.dispatch("test")
+
+        assert calls == []
+
+    def test_error_policy_result_includes_bubbling(self) -> None:
+        """Test that dispatch_with_result records outcomes along the bubbling chain."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.event import Event
+
+        class Node(EventDispatcherMixin):
+            _enable_bubbling = True
+
+            def __init__(self, parent=None) -> None:
+                self.parent = parent
+
+            def _get_bubbling_parent(self):
+                return self.parent
+
+        parent = Node()
+        child = Node(parent=parent)
+
+        def failing(event: Event) -> None:
+            raise ValueError("boom")
+
+        child.add_event_listener("test", failing)
+        parent.add_event_listener("test", lambda event: None)
+
+        result = child.dispatch_with_result("test", error_policy="collect")
+
+        assert len(result.outcomes) == 2
+        assert not result.ok
+        assert result.outcomes[1].ok
+        assert result.duration >= 0
+
+    def test_types(self) -> None:
+        """Test type validation for DispatchErrorPolicy."""
+        from wexample_event.common.error_policy import (
+            DEFAULT_ERROR_POLICY,
+            DispatchErrorPolicy,
+        )
+
+        assert DEFAULT_ERROR_POLICY is DispatchErrorPolicy.RAISE_FIRST
+        self._test_type_validate_or_fail(
+            success_cases=[(DispatchErrorPolicy.COLLECT, DispatchErrorPolicy)]
+        )
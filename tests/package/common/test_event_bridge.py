@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestEventBridge(AbstractTestHelpers):
+    def test_bridge_batches_over_tcp(self) -> None:
+        """Test batching and that bridged events are not sent back."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_bridge_client import EventBridgeClient
+        from wexample_event.common.event_bridge_server import EventBridgeServer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        local = TestDispatcher()
+        remote = TestDispatcher()
+        received = []
+        remote.add_event_listener(
+            "row", lambda event: received.append(event.payload["index"])
+        )
+
+        async def run_test() -> tuple[int, int]:
+            server = EventBridgeServer(remote)
+            await server.start_tcp()
+            client = EventBridgeClient(local, ["row"], port=server.port, batch_size=8)
+            # A bridge back from remote to local must not echo events.
+            echo = EventBridgeClient(remote, ["row"], port=server.port)
+            await client.start()
+            await echo.start()
+            for index in range(50):
+                local.dispatch("row", payload={"index": index})
+            await client.close()
+            await echo.close()
+            await asyncio.sleep(0.05)
+            await server.close()
+            return client.sent, echo.sent
+
+        sent, echoed = asyncio.run(run_test())
+
+        assert sent == 50
+        assert echoed == 0
+        assert received == list(range(50))
+
+    def test_bridge_drops_unencodable_events(self) -> None:
+        """Test that an event that cannot be encoded does not stop the sender."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_bridge_client import EventBridgeClient
+        from wexample_event.common.event_bridge_server import EventBridgeServer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        local = TestDispatcher()
+        remote = TestDispatcher()
+        received = []
+        remote.add_event_listener("row", lambda event: received.append(event.payload))
+
+        async def run_test() -> EventBridgeClient:
+            server = EventBridgeServer(remote)
+            await server.start_tcp()
+            client = EventBridgeClient(local, ["row"], port=server.port)
+            await client.start()
+            local.dispatch("row", payload={"index": 0})
+            local.dispatch("row", payload={"bad": object()})
+            local.dispatch("row", payload={"index": 1})
+            await asyncio.sleep(0.05)
+            local.dispatch("row", payload={"index": 2})
+            await client.close()
+            await asyncio.sleep(0.05)
+            await server.close()
+            return client
+
+        client = asyncio.run(run_test())
+
+        assert (client.sent, client.dropped) == (3, 1)
+        assert received == [{"index": 0}, {"index": 1}, {"index": 2}]
+
+    def test_bridge_flushes_idle_client(self) -> None:
+        """Test that a single event is sent after flush_interval, without close."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_bridge_client import EventBridgeClient
+        from wexample_event.common.event_bridge_server import EventBridgeServer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        local = TestDispatcher()
+        remote = TestDispatcher()
+        received = []
+        remote.add_event_listener("row", lambda event: received.append(event.name))
+
+        async def run_test() -> list[str]:
+            server = EventBridgeServer(remote)
+            await server.start_tcp()
+            client = EventBridgeClient(local, ["row"], port=server.port)
+            await client.start()
+            await asyncio.sleep(0.05)
+            local.dispatch("row")
+            await asyncio.sleep(0.1)
+            delivered = list(received)
+            await client.close()
+            await server.close()
+            return delivered
+
+        assert asyncio.run(run_test()) == ["row"]
+
+    def test_bridge_forwards_listener_events(self) -> None:
+        """Test that events dispatched by listeners of bridged events are sent."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_bridge_client import EventBridgeClient
+        from wexample_event.common.event_bridge_server import EventBridgeServer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        local = TestDispatcher()
+        remote = TestDispatcher()
+        received = []
+        local.add_event_listener("ack", lambda event: received.append(event.name))
+        remote.add_event_listener("row", lambda event: remote.dispatch("ack"))
+
+        async def run_test() -> None:
+            remote_server = EventBridgeServer(remote)
+            local_server = EventBridgeServer(local)
+            await remote_server.start_tcp()
+            await local_server.start_tcp()
+            client = EventBridgeClient(local, ["row"], port=remote_server.port)
+            reply = EventBridgeClient(remote, ["row", "ack"], port=local_server.port)
+            await client.start()
+            await reply.start()
+            local.dispatch("row")
+            await client.close()
+            await asyncio.sleep(0.05)
+            await reply.close()
+            await asyncio.sleep(0.05)
+            await remote_server.close()
+            await local_server.close()
+            assert (client.sent, reply.sent) == (1, 1)
+
+        asyncio.run(run_test())
+
+        assert received == ["ack"]
+
+    def test_bridge_reconnects(self) -> None:
+        """Test that a client started before the server delivers once it is up."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_bridge_client import EventBridgeClient
+        from wexample_event.common.event_bridge_server import EventBridgeServer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        local = TestDispatcher()
+        remote = TestDispatcher()
+        received = []
+        remote.add_event_listener("ping", received.append)
+
+        async def run_test() -> None:
+            probe = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+            port = probe.sockets[0].getsockname()[1]
+            probe.close()
+            await probe.wait_closed()
+
+            client = EventBridgeClient(local, ["ping"], port=port, reconnect_delay=0.01)
+            await client.start()
+            local.dispatch("ping")
+            await asyncio.sleep(0.05)
+
+            server = EventBridgeServer(remote)
+            await server.start_tcp(port=port)
+            await client.close()
+            await asyncio.sleep(0.05)
+            await server.close()
+
+        asyncio.run(run_test())
+
+        assert len(received) == 1
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets only")
+    def test_bridge_unix_socket(self, tmp_path) -> None:
+        """Test bridging over a Unix domain socket."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_bridge_client import EventBridgeClient
+        from wexample_event.common.event_bridge_server import EventBridgeServer
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        local = TestDispatcher()
+        remote = TestDispatcher()
+        received = []
+        remote.add_event_listener("a", lambda event: received.append(event.name))
+        path = str(tmp_path / "bridge.sock")
+
+        async def run_test() -> None:
+            server = EventBridgeServer(remote)
+            await server.start_unix(path)
+            client = EventBridgeClient(local, ["a"], path=path)
+            await client.start()
+            local.dispatch("a")
+            local.dispatch("b")
+            await client.close()
+            await asyncio.sleep(0.05)
+            await server.close()
+
+        asyncio.run(run_test())
+
+        assert received == ["a"]
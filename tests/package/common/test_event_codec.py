@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+from wexample_event.dataclass.typed_event import TypedEvent
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OrderPlaced(TypedEvent):
+    order_id: int
+    lines: list
+
+
+class TestEventCodec(AbstractTestHelpers):
+    def test_event_codec_encode_failure(self) -> None:
+        """Test that a failed encode leaves buffer and name table untouched."""
+        from wexample_event.common.event_codec import EventCodec
+        from wexample_event.dataclass.event import Event
+
+        encoder = EventCodec()
+        decoder = EventCodec()
+        buffer = bytearray(encoder.encode(Event(name="ok")))
+        size = len(buffer)
+
+        with pytest.raises(TypeError):
+            encoder.encode_into(Event(name="a", payload={"x": object()}), buffer)
+        assert len(buffer) == size
+
+        encoder.encode_into(Event(name="a"), buffer)
+        encoder.encode_into(Event(name="a"), buffer)
+        assert [event.name for event in decoder.iter_decode(buffer)] == [
+            "ok",
+            "a",
+            "a",
+        ]
+
+    def test_event_codec_interned_names(self) -> None:
+        """Test that repeated names are interned within a stream."""
+        from wexample_event.common.event_codec import EventCodec
+        from wexample_event.dataclass.event import Event
+
+        encoder = EventCodec()
+        first = encoder.encode(Event(name="a.rather.long.event.name"))
+        second = encoder.encode(Event(name="a.rather.long.event.name"))
+
+        assert len(second) < len(first)
+
+        decoder = EventCodec()
+        assert [event.name for event in decoder.iter_decode(first + second)] == [
+            "a.rather.long.event.name",
+            "a.rather.long.event.name",
+        ]
+
+    def test_event_codec_roundtrip(self) -> None:
+        """Test that a plain event survives encoding."""
+        from wexample_event.common.event_codec import EventCodec
+        from wexample_event.dataclass.event import Event
+
+        timestamp = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+        event = Event(
+            name="user.created",
+            payload={"id": 1, "tags": ["a", "b"]},
+            metadata={"trace": "abc"},
+            timestamp=timestamp,
+        )
+        codec = EventCodec()
+
+        decoded = codec.decode(codec.encode(event))
+
+        assert decoded == event
+        assert decoded.timestamp == timestamp
+
+    def test_event_codec_source_reference(self) -> None:
+        """Test that sources are replaced by reference IDs."""
+        from wexample_event.common.event_codec import EventCodec
+        from wexample_event.dataclass.event import Event
+
+        class Component:
+            def __init__(self, key: str) -> None:
+                self.key = key
+
+        component = Component("button-1")
+        registry = {"button-1": component}
+        codec = EventCodec(
+            source_ref=lambda source: source.key, resolve_source=registry.get
+        )
+
+        decoded = codec.decode(codec.encode(Event(name="click", source=component)))
+
+        assert decoded.source is component
+        assert (
+            EventCodec()
+            .decode(EventCodec().encode(Event(name="x", source=component)))
+            .source
+            is None
+        )
+
+    def test_event_codec_stream_into_buffer(self) -> None:
+        """Test streaming several frames into one buffer and a memoryview."""
+        from wexample_event.common.event_codec import EventCodec
+        from wexample_event.dataclass.event import Event
+
+        codec = EventCodec(intern_names=False)
+        buffer = bytearray()
+        sizes = [
+            codec.encode_into(
+                Event(name=f"event.{index}", payload={"i": index}), buffer
+            )
+            for index in range(3)
+        ]
+
+        assert sum(sizes) == len(buffer)
+
+        view = memoryview(buffer)
+        event, offset = codec.decode_from(view, sizes[0])
+        assert event.payload == {"i": 1}
+        assert offset == sizes[0] + sizes[1]
+
+    def test_event_codec_typed_event(self) -> None:
+        """Test that typed events keep their class and fields."""
+        from wexample_event.common.event_codec import EventCodec
+
+        event = OrderPlaced(order_id=5, lines=[1, 2])
+        encoded = EventCodec().encode(event)
+
+        decoded = EventCodec(event_types=[OrderPlaced]).decode(encoded)
+
+        assert type(decoded) is OrderPlaced
+        assert decoded == event
+
+        with pytest.raises(ValueError):
+            EventCodec().decode(encoded)
+
+    def test_event_codec_version_mismatch(self) -> None:
+        """Test that frames with an unknown version are rejected."""
+        from wexample_event.common.event_codec import EventCodec
+        from wexample_event.dataclass.event import Event
+
+        frame = bytearray(EventCodec().encode(Event(name="x")))
+        frame[4] = 99
+
+        with pytest.raises(ValueError):
+            EventCodec().decode(frame)
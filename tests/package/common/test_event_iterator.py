@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestEventIterator(AbstractTestHelpers):
+    def test_event_iterator_backpressure(self) -> None:
+        """Test that a full buffer blocks the producer until consumed."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+
+        with dispatcher.subscribe_iter("row", maxsize=2) as rows:
+
+            def produce() -> None:
+                for index in range(50):
+                    dispatcher.dispatch("row", payload={"index": index})
+                rows.close()
+
+            producer = threading.Thread(target=produce)
+            producer.start()
+            for event in rows:
+                assert len(rows) <= 2
+                received.append(event.payload["index"])
+            producer.join()
+
+        assert received == list(range(50))
+        assert rows.dropped == 0
+        assert not dispatcher.has_event_listeners("row")
+
+    def test_event_iterator_get_timeout(self) -> None:
+        """Test that get returns None once the timeout expires."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        with dispatcher.subscribe_iter("row") as rows:
+            assert rows.get(timeout=0.01) is None
+
+    def test_event_iterator_non_blocking_overwrites(self) -> None:
+        """Test that non-blocking mode overwrites the oldest events."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+
+        with dispatcher.subscribe_iter("row", maxsize=3, block=False) as rows:
+            for index in range(5):
+                dispatcher.dispatch("row", payload={"index": index})
+            rows.close()
+            received = [event.payload["index"] for event in rows]
+
+        assert received == [2, 3, 4]
+        assert rows.dropped == 2
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestEventJournal(AbstractTestHelpers):
+    def test_event_journal_batch_sync_interval(self, tmp_path) -> None:
+        """Test that the last batch is synced once appends stop."""
+        import time
+
+        from wexample_event.common.event_journal import EventJournal
+        from wexample_event.common.event_journal_reader import EventJournalReader
+        from wexample_event.dataclass.event import Event
+
+        journal = EventJournal(tmp_path, sync_policy="batch", sync_interval=0.02)
+        try:
+            journal.record(Event(name="a"))
+            deadline = time.monotonic() + 2
+            while journal._unsynced and time.monotonic() < deadline:
+                time.sleep(0.01)
+            names = [event.name for event in EventJournalReader(tmp_path).iter_events()]
+        finally:
+            journal.close()
+
+        assert names == ["a"]
+
+    def test_event_journal_ignores_torn_tail(self, tmp_path) -> None:
+        """Test that a partially written last frame is skipped."""
+        from wexample_event.common.event_journal import EventJournal
+        from wexample_event.common.event_journal_reader import EventJournalReader
+        from wexample_event.dataclass.event import Event
+
+        with EventJournal(tmp_path) as journal:
+            journal.record(Event(name="a"))
+            journal.record(Event(name="b", payload={"large": "x" * 100}))
+
+        segment = EventJournalReader(tmp_path).segments()[0]
+        segment.write_bytes(segment.read_bytes()[:-10])
+
+        names = [event.name for event in EventJournalReader(tmp_path).iter_events()]
+
+        assert names == ["a"]
+
+    def test_event_journal_record_and_replay(self, tmp_path) -> None:
+        """Test recording dispatched events and replaying them elsewhere."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_journal import EventJournal
+        from wexample_event.common.event_journal_reader import EventJournalReader
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        source = TestDispatcher()
+        journal = EventJournal(tmp_path, sync_policy="always")
+        journal.attach(source, ["order.created", "order.paid"])
+
+        for index in range(5):
+            source.dispatch("order.created", payload={"index": index})
+        source.dispatch("order.paid", payload={"index": 0})
+        source.dispatch("ignored")
+        journal.close()
+
+        target = TestDispatcher()
+        replayed = []
+        target.add_event_listener(
+            "order.created", lambda event: replayed.append(event.payload["index"])
+        )
+
+        count = EventJournalReader(tmp_path).replay(target, names=["order.created"])
+
+        assert count == 5
+        assert replayed == [0, 1, 2, 3, 4]
+        assert not source.has_event_listeners("order.created")
+
+    def test_event_journal_segments_and_time_range(self, tmp_path) -> None:
+        """Test segment rotation, restarts and time range filtering."""
+        from wexample_event.common.event_journal import EventJournal
+        from wexample_event.common.event_journal_reader import EventJournalReader
+        from wexample_event.dataclass.event import Event
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        with EventJournal(tmp_path, segment_size=64, sync_policy="never") as journal:
+            for index in range(10):
+                journal.record(
+                    Event(name="tick", timestamp=start + timedelta(minutes=index))
+                )
+        with EventJournal(tmp_path) as journal:
+            journal.record(Event(name="tick", timestamp=start + timedelta(hours=1)))
+
+        reader = EventJournalReader(tmp_path)
+        events = list(
+            reader.iter_events(
+                since=start + timedelta(minutes=3), until=start + timedelta(minutes=6)
+            )
+        )
+
+        assert len(reader.segments()) > 2
+        assert len(list(reader.iter_events())) == 11
+        assert [event.timestamp.minute for event in events] == [3, 4, 5]
+
+    def test_event_journal_rejects_foreign_files(self, tmp_path) -> None:
+        """Test that files without the segment header are rejected."""
+        from wexample_event.common.event_journal_reader import EventJournalReader
+
+        (tmp_path / "000000000000.evj").write_bytes(b"not a journal segment")
+
+        with pytest.raises(ValueError):
+            list(EventJournalReader(tmp_path).iter_events())
+
+    def test_event_journal_unencodable_event(self, tmp_path) -> None:
+        """Test that an event that cannot be encoded leaves the segment readable."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.event_journal import EventJournal
+        from wexample_event.common.event_journal_reader import EventJournalReader
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        source = TestDispatcher()
+        with EventJournal(tmp_path) as journal:
+            journal.attach(source, ["ok", "a"])
+            source.dispatch("ok")
+            result = source.dispatch_with_result(
+                "a", payload={"bad": object()}, error_policy="log_and_continue"
+            )
+            source.dispatch("a")
+
+        names = [event.name for event in EventJournalReader(tmp_path).iter_events()]
+
+        assert isinstance(result.errors[0], TypeError)
+        assert names == ["ok", "a"]
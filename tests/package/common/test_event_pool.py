@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestEventPool(AbstractTestHelpers):
+    def test_event_pool_acquire_new(self) -> None:
+        """Test acquiring from an empty pool builds a new event."""
+        from wexample_event.common.event_pool import EventPool
+
+        pool = EventPool()
+        event = pool.acquire("test", payload={"key": "value"})
+
+        assert event.name == "test"
+        assert event.payload == {"key": "value"}
+        assert event.timestamp is not None
+
+    def test_event_pool_maxsize(self) -> None:
+        """Test that the pool never holds more than maxsize events."""
+        from wexample_event.common.event_pool import EventPool
+
+        pool = EventPool(maxsize=1)
+        pool.release(pool.acquire("a"))
+        pool.release(pool.acquire("b").derive(name="c"))
+        pool.release(pool.acquire("d"))
+
+        assert len(pool) == 1
+
+    def test_event_pool_recycles_instances(self) -> None:
+        """Test that released events are reused and reset."""
+        from wexample_event.common.event_pool import EventPool
+
+        pool = EventPool()
+        first = pool.acquire("first", payload={"a": 1}, source=object())
+        pool.release(first)
+
+        assert first.payload is None
+        assert first.source is None
+
+        second = pool.acquire("second", payload={"b": 2})
+
+        assert second is first
+        assert second.name == "second"
+        assert second.payload == {"b": 2}
+        assert len(pool) == 0
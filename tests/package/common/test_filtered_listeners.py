@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestFilteredListeners(AbstractTestHelpers):
+    def test_filtered_listeners_decorator(self) -> None:
+        """Test where filters declared with EventListenerMixin.on."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.listener import EventListenerMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        class Handler(EventListenerMixin):
+            def __init__(self) -> None:
+                self.received = []
+
+            @EventListenerMixin.on("order", where={"tenant": "acme"})
+            def on_acme_order(self, event) -> None:
+                self.received.append(event.payload["id"])
+
+        dispatcher = TestDispatcher()
+        handler = Handler()
+        handler.bind_to_dispatcher(dispatcher)
+        dispatcher.dispatch("order", payload={"tenant": "acme", "id": 1})
+        dispatcher.dispatch("order", payload={"tenant": "other", "id": 2})
+        handler.unbind_from_dispatcher()
+        dispatcher.dispatch("order", payload={"tenant": "acme", "id": 3})
+
+        assert handler.received == [1]
+        assert not dispatcher.has_event_listeners("order")
+        assert not dispatcher._event_listener_filters
+
+    def test_filtered_listeners_index(self) -> None:
+        """Test that only listeners whose filter matches are invoked."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        calls = []
+        for tenant in range(100):
+            dispatcher.add_event_listener(
+                "order",
+                lambda event, tenant=tenant: calls.append(tenant),
+                where={"tenant": tenant},
+            )
+        dispatcher.add_event_listener(
+            "order", lambda event: calls.append("all"), priority=-1
+        )
+        dispatcher.add_event_listener(
+            "order",
+            lambda event: calls.append("eu"),
+            where={"tenant": [3, 4], "metadata.region": "eu"},
+            priority=1,
+        )
+
+        result = dispatcher.dispatch_with_result(
+            "order", payload={"tenant": 3}, metadata={"region": "eu"}
+        )
+        dispatcher.dispatch("order", payload={"tenant": 4})
+        dispatcher.dispatch("order", payload={"tenant": ["unhashable"]})
+        dispatcher.dispatch("order")
+
+        assert len(result.outcomes) == 3
+        assert calls == ["eu", 3, "all", 4, "all", "all", "all"]
+
+    def test_filtered_listeners_lock_free(self) -> None:
+        """Test that indexed filters are checked without taking the lock."""
+        import threading
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class CountingLock:
+            def __init__(self) -> None:
+                self.acquired = 0
+                self.lock = threading.RLock()
+
+            def __enter__(self):
+                self.acquired += 1
+                return self.lock.__enter__()
+
+            def __exit__(self, *exc_info):
+                return self.lock.__exit__(*exc_info)
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        calls = []
+        dispatcher.add_event_listener(
+            "order", lambda event: calls.append("acme"), where={"tenant": "acme"}
+        )
+        dispatcher.add_event_listener(
+            "order",
+            lambda event: calls.append("acme eu"),
+            where={"tenant": "acme", "metadata.region": ["eu"]},
+        )
+        lock = dispatcher._event_listener_lock = CountingLock()
+
+        dispatcher.dispatch("order", payload={"tenant": "acme"})
+        dispatcher.dispatch(
+            "order", payload={"tenant": "acme"}, metadata={"region": "eu"}
+        )
+        dispatcher.dispatch("order", payload={"tenant": "other"})
+
+        assert calls == ["acme", "acme", "acme eu"]
+        assert lock.acquired == 0
+
+    def test_filtered_listeners_once_and_remove(self) -> None:
+        """Test once filtered listeners and removal across indexed values."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        once_calls = []
+        calls = []
+
+        def once_listener(event) -> None:
+            once_calls.append(event.payload["tenant"])
+
+        def listener(event) -> None:
+            calls.append(event.payload["tenant"])
+
+        def fail(event) -> None:
+            raise RuntimeError("boom")
+
+        dispatcher.add_event_listener(
+            "order", once_listener, once=True, where={"tenant": {"a", "b"}}
+        )
+        dispatcher.add_event_listener("order", listener, where={"tenant": {"a", "b"}})
+
+        dispatcher.dispatch("order", payload={"tenant": "c"})
+        dispatcher.dispatch("order", payload={"tenant": "b"})
+        dispatcher.dispatch("order", payload={"tenant": "a"})
+
+        assert once_calls == ["b"]
+        assert calls == ["b", "a"]
+
+        dispatcher.add_event_listener(
+            "order", once_listener, once=True, where={"tenant": "c"}
+        )
+        dispatcher.add_event_listener("order", fail, priority=1, where={"tenant": "c"})
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch("order", payload={"tenant": "c"})
+        dispatcher.remove_event_listener("order", fail)
+        dispatcher.dispatch("order", payload={"tenant": "c"})
+        assert once_calls == ["b", "c"]
+        assert set(dispatcher._event_listener_filters["order"]) == {
+            ("payload", "tenant")
+        }
+        assert dispatcher._event_listener_filters["order"][
+            "payload", "tenant"
+        ] == frozenset({"a", "b"})
+        assert dispatcher.remove_event_listener("order", listener)
+        assert not dispatcher.has_event_listeners("order")
+        assert not dispatcher._event_listener_filters
+        assert not dispatcher.remove_event_listener("order", listener)
+        with pytest.raises(ValueError):
+            dispatcher.add_event_listener("order", listener, where={})
+
+    def test_filtered_listeners_typed_event(self) -> None:
+        """Test filters on listeners registered by event class."""
+        from dataclasses import dataclass
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.typed_event import TypedEvent
+
+        @dataclass(frozen=True, slots=True, kw_only=True)
+        class OrderPlaced(TypedEvent):
+            pass
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+        dispatcher.add_event_listener(
+            OrderPlaced,
+            lambda event: received.append(event.payload["tenant"]),
+            where={"tenant": "acme"},
+        )
+
+        dispatcher.dispatch(OrderPlaced(payload={"tenant": "acme"}))
+        dispatcher.dispatch(OrderPlaced(payload={"tenant": "other"}))
+        dispatcher.clear_event_listeners(OrderPlaced)
+        dispatcher.dispatch(OrderPlaced(payload={"tenant": "acme"}))
+
+        assert received == ["acme"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestIndexedEventJournal(AbstractTestHelpers):
+    def test_indexed_event_journal_reads_unindexed_tail(self, tmp_path) -> None:
+        """Test that frames written after the last index save are still found."""
+        from wexample_event.common.indexed_event_journal import IndexedEventJournal
+        from wexample_event.common.indexed_event_journal_reader import (
+            IndexedEventJournalReader,
+        )
+        from wexample_event.dataclass.event import Event
+
+        journal = IndexedEventJournal(tmp_path, sync_policy="never")
+        journal.record(Event(name="order.created"))
+        journal.flush()
+        journal.record(Event(name="order.paid"))
+        journal.record(Event(name="user.created"))
+        journal._file.flush()
+
+        reader = IndexedEventJournalReader(tmp_path)
+        names = [event.name for event in reader.iter_events(["order.*"])]
+        journal.close()
+
+        assert names == ["order.created", "order.paid"]
+        assert reader.load_index(reader.segments()[0]).count == 3
+
+    def test_indexed_event_journal_query_by_name_and_range(self, tmp_path) -> None:
+        """Test glob name queries and time ranges across segments."""
+        from wexample_event.common.indexed_event_journal import IndexedEventJournal
+        from wexample_event.common.indexed_event_journal_reader import (
+            IndexedEventJournalReader,
+        )
+        from wexample_event.dataclass.event import Event
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        with IndexedEventJournal(
+            tmp_path, segment_size=256, bucket_seconds=10
+        ) as journal:
+            for index in range(60):
+                name = ("order.created", "order.paid", "user.created")[index % 3]
+                journal.record(
+                    Event(
+                        name=name,
+                        payload={"index": index},
+                        timestamp=start + timedelta(seconds=index),
+                    )
+                )
+
+        reader = IndexedEventJournalReader(tmp_path)
+        assert len(reader.segments()) > 1
+
+        orders = [
+            event.payload["index"]
+            for event in reader.iter_events(
+                ["order.*"],
+                since=start + timedelta(seconds=15),
+                until=start + timedelta(seconds=25),
+            )
+        ]
+        everything = [event.payload["index"] for event in reader.iter_events()]
+        users = list(reader.iter_events(["user.created"]))
+
+        assert orders == [15, 16, 18, 19, 21, 22, 24]
+        assert everything == list(range(60))
+        assert len(users) == 20
+
+    def test_indexed_event_journal_without_index(self, tmp_path) -> None:
+        """Test that segments missing their index fall back to a scan."""
+        from wexample_event.common.indexed_event_journal import (
+            IndexedEventJournal,
+            index_path,
+        )
+        from wexample_event.common.indexed_event_journal_reader import (
+            IndexedEventJournalReader,
+        )
+        from wexample_event.dataclass.event import Event
+
+        with IndexedEventJournal(tmp_path) as journal:
+            journal.record(Event(name="order.created"))
+            journal.record(Event(name="user.created"))
+
+        reader = IndexedEventJournalReader(tmp_path)
+        index_path(reader.segments()[0]).unlink()
+
+        assert [event.name for event in reader.iter_events(["order.*"])] == [
+            "order.created"
+        ]
+
+    def test_indexed_event_journal_with_empty_segment(self, tmp_path) -> None:
+        """Test time range queries over a segment whose only append failed."""
+        import pytest
+
+        from wexample_event.common.indexed_event_journal import IndexedEventJournal
+        from wexample_event.common.indexed_event_journal_reader import (
+            IndexedEventJournalReader,
+        )
+        from wexample_event.dataclass.event import Event
+
+        with IndexedEventJournal(tmp_path) as journal:
+            with pytest.raises(TypeError):
+                journal.record(Event(name="bad", payload={"x": object()}))
+
+        reader = IndexedEventJournalReader(tmp_path)
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert reader.load_index(reader.segments()[0]).count == 0
+        assert list(reader.iter_events(since=since)) == []
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import multiprocessing
+import sys
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+def _publish_from_child(bus, count: int) -> None:
+    from wexample_event.dataclass.event import Event
+
+    for index in range(count):
+        bus.publish(Event(name="job.done", payload={"index": index}))
+    bus.close()
+
+
+class TestMultiprocessEventBus(AbstractTestHelpers):
+    def test_bus_across_processes(self) -> None:
+        """Test that events published by a child process reach the parent."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.multiprocess_event_bus import (
+            MultiprocessEventBus,
+        )
+
+        if sys.platform == "win32":
+            pytest.skip("fork start method is not available")
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        context = multiprocessing.get_context("fork")
+        bus = MultiprocessEventBus.create(capacity=1 << 16, lock=context.Lock())
+        dispatcher = TestDispatcher()
+        received = []
+        dispatcher.add_event_listener(
+            "job.done", lambda event: received.append(event.payload["index"])
+        )
+        bus.attach_dispatcher(dispatcher)
+
+        try:
+            child = context.Process(target=_publish_from_child, args=(bus, 20))
+            child.start()
+            child.join(10)
+            bus.poll()
+        finally:
+            bus.close()
+            bus.unlink()
+
+        assert child.exitcode == 0
+        assert received == list(range(20))
+
+    def test_bus_errors_do_not_stop_polling(self) -> None:
+        """Test failing listeners, bad records and writes in progress."""
+        import time
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.multiprocess_event_bus import (
+            _POSITION,
+            _RECORD,
+            _WRITE_RESERVED_OFFSET,
+            MultiprocessEventBus,
+        )
+        from wexample_event.dataclass.event import Event
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        def fail(event: Event) -> None:
+            raise RuntimeError("boom")
+
+        publisher = MultiprocessEventBus.create(capacity=4096)
+        subscriber = MultiprocessEventBus.attach(publisher.name)
+        dispatcher = TestDispatcher()
+        received = []
+        dispatcher.add_event_listener("fail", fail)
+        dispatcher.add_event_listener("ok", lambda event: received.append(event))
+        subscriber.attach_dispatcher(dispatcher)
+
+        try:
+            # A writer reserving the bytes of an unread record laps the reader.
+            publisher.publish(Event(name="ok"))
+            _POSITION.pack_into(
+                publisher.memory.buf, _WRITE_RESERVED_OFFSET, 4096 + _RECORD.size + 1
+            )
+            assert subscriber.poll() == 0
+            assert subscriber.dropped == 1
+
+            subscriber.start()
+            publisher._append(bytearray(_RECORD.pack(3, 0) + b"bad"))
+            publisher.publish(Event(name="fail"))
+            publisher.publish(Event(name="ok"))
+            deadline = time.monotonic() + 5
+            while not received and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert len(received) == 1
+            assert subscriber.dropped == 2
+            assert subscriber._thread.is_alive()
+        finally:
+            subscriber.close()
+            publisher.close()
+            publisher.unlink()
+
+    def test_bus_forward_and_filter(self) -> None:
+        """Test forwarding dispatcher events and filtering received names."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.multiprocess_event_bus import (
+            MultiprocessEventBus,
+        )
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        publisher_bus = MultiprocessEventBus.create(capacity=4096)
+        subscriber_bus = MultiprocessEventBus.attach(publisher_bus.name)
+        publisher = TestDispatcher()
+        subscriber = TestDispatcher()
+        received = []
+        subscriber.add_event_listener("a", lambda event: received.append(event.name))
+        subscriber.add_event_listener("b", lambda event: received.append(event.name))
+
+        try:
+            publisher_bus.forward(publisher, ["a", "b"])
+            subscriber_bus.attach_dispatcher(subscriber, names=["a"])
+            # Received events re-dispatched locally must not be forwarded again.
+            subscriber_bus.forward(subscriber, ["a"])
+
+            publisher.dispatch("a")
+            publisher.dispatch("b")
+            publisher.dispatch("c")
+
+            assert subscriber_bus.poll() == 2
+            assert publisher_bus.poll() == 0
+        finally:
+            subscriber_bus.close()
+            publisher_bus.close()
+            publisher_bus.unlink()
+
+        assert received == ["a"]
+
+    def test_bus_forwards_listener_events(self) -> None:
+        """Test forwarding events dispatched by listeners of received events."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.multiprocess_event_bus import (
+            MultiprocessEventBus,
+        )
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        first_bus = MultiprocessEventBus.create(capacity=4096)
+        second_bus = MultiprocessEventBus.attach(first_bus.name)
+        first = TestDispatcher()
+        second = TestDispatcher()
+        received = []
+        first.add_event_listener("invoice.created", received.append)
+        second.add_event_listener(
+            "order.placed",
+            lambda event: second.dispatch(
+                "invoice.created", payload={"order": event.payload["id"]}
+            ),
+        )
+
+        try:
+            first_bus.forward(first, ["order.placed"])
+            first_bus.attach_dispatcher(first)
+            second_bus.forward(second, ["order.placed", "invoice.created"])
+            second_bus.attach_dispatcher(second)
+
+            first.dispatch("order.placed", payload={"id": 7})
+            assert second_bus.poll() == 1
+            assert first_bus.poll() == 1
+
+            first.dispatch("order.placed", payload={"id": object()})
+            assert first_bus.dropped == 1
+        finally:
+            second_bus.close()
+            first_bus.close()
+            first_bus.unlink()
+
+        assert [event.payload for event in received] == [{"order": 7}]
+
+    def test_bus_wraps_and_detects_overrun(self) -> None:
+        """Test records wrapping around the ring and lapped subscribers."""
+        from wexample_event.common.multiprocess_event_bus import (
+            MultiprocessEventBus,
+        )
+        from wexample_event.dataclass.event import Event
+
+        class Collector:
+            def __init__(self) -> None:
+                self.events = []
+
+            def dispatch(self, event: Event, **kwargs) -> None:
+                self.events.append(event.payload["index"])
+
+        publisher = MultiprocessEventBus.create(capacity=256)
+        subscriber = MultiprocessEventBus.attach(publisher.name)
+        collector = Collector()
+        subscriber.attach_dispatcher(collector)  # type: ignore[arg-type]
+
+        try:
+            for index in range(40):
+                publisher.publish(Event(name="tick", payload={"index": index}))
+                if index < 20:
+                    subscriber.poll()
+            subscriber.poll()
+        finally:
+            subscriber.close()
+            publisher.close()
+            publisher.unlink()
+
+        assert collector.events[:20] == list(range(20))
+        assert subscriber.dropped == 1
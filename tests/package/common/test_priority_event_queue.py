@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestPriorityEventQueue(AbstractTestHelpers):
+    def test_priority_event_queue_aging(self) -> None:
+        """Test that waiting low priority events overtake fresh urgent ones."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.priority import EventPriority
+        from wexample_event.common.priority_event_queue import PriorityEventQueue
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        now = [0.0]
+        dispatcher = TestDispatcher()
+        received = []
+        for name in ("analytics", "system"):
+            dispatcher.add_event_listener(name, lambda e: received.append(e.name))
+        queue = PriorityEventQueue(dispatcher, aging_rate=10, clock=lambda: now[0])
+
+        queue.put("analytics", priority=EventPriority.LOW)
+        now[0] = 30.0
+        queue.put("system", priority=EventPriority.HIGH)
+        queue.drain()
+
+        assert received == ["analytics", "system"]
+
+    def test_priority_event_queue_order(self) -> None:
+        """Test strict priority order, FIFO within a level."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.priority import EventPriority
+        from wexample_event.common.priority_event_queue import PriorityEventQueue
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+        dispatcher.add_event_listener(
+            "job", lambda event: received.append(event.payload["id"])
+        )
+        queue = PriorityEventQueue(dispatcher, aging_rate=0)
+
+        for index in range(3):
+            queue.put("job", payload={"id": f"low{index}"}, priority=EventPriority.LOW)
+        queue.put("job", payload={"id": "high"}, priority=EventPriority.HIGH)
+        queue.put("job", payload={"id": "normal"})
+
+        assert len(queue) == 5
+        assert queue.drain(max_events=2) == 2
+        queue.drain()
+
+        assert received == ["high", "normal", "low0", "low1", "low2"]
+        assert len(queue) == 0
+        with pytest.raises(ValueError):
+            PriorityEventQueue(dispatcher, aging_rate=-1)
+
+    def test_priority_event_queue_worker(self) -> None:
+        """Test background dispatch and that failures don't stop the worker."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.priority_event_queue import PriorityEventQueue
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        threads = set()
+
+        def listener(event) -> None:
+            threads.add(threading.get_ident())
+            if event.payload["index"] == 0:
+                raise RuntimeError("boom")
+
+        dispatcher.add_event_listener("job", listener)
+        queue = PriorityEventQueue(dispatcher)
+        queue.start()
+        for index in range(10):
+            queue.put("job", payload={"index": index})
+        queue.stop()
+
+        assert queue.dispatched == 10
+        assert threading.get_ident() not in threads
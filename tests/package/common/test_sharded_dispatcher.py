@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestShardedDispatcher(AbstractTestHelpers):
+    def test_sharded_dispatcher_keeps_per_key_order(self) -> None:
+        """Test that events of one key are handled in order by one worker."""
+        from wexample_event.common.sharded_dispatcher import ShardedDispatcher
+
+        seen: dict[int, list[int]] = {}
+        threads: dict[int, set[int]] = {}
+        lock = threading.Lock()
+
+        def listener(event) -> None:
+            user_id = event.payload["user_id"]
+            with lock:
+                seen.setdefault(user_id, []).append(event.payload["seq"])
+                threads.setdefault(user_id, set()).add(threading.get_ident())
+
+        with ShardedDispatcher(4, partition_key="user_id") as dispatcher:
+            dispatcher.add_event_listener("update", listener)
+            for seq in range(50):
+                for user_id in range(8):
+                    dispatcher.dispatch(
+                        "update", payload={"user_id": user_id, "seq": seq}
+                    )
+            dispatcher.join()
+
+            assert all(values == list(range(50)) for values in seen.values())
+            assert all(len(ids) == 1 for ids in threads.values())
+            assert len({frozenset(ids) for ids in threads.values()}) > 1
+
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch("update")
+
+    def test_sharded_dispatcher_partition_callable(self) -> None:
+        """Test callable keys, name fallback and logged failures."""
+        from wexample_event.common.sharded_dispatcher import ShardedDispatcher
+
+        dispatcher = ShardedDispatcher(
+            3, partition_key=lambda event: (event.metadata or {}).get("tenant")
+        )
+        received = []
+
+        def listener(event) -> None:
+            received.append(event.name)
+            raise RuntimeError("boom")
+
+        dispatcher.add_event_listener("a", listener)
+        event = dispatcher.dispatch("a", metadata={"tenant": "acme"})
+        dispatcher.dispatch("a")
+        dispatcher.close()
+
+        assert received == ["a", "a"]
+        assert dispatcher.shard_for(event) == hash("acme") % 3
+        with pytest.raises(ValueError):
+            ShardedDispatcher(0)
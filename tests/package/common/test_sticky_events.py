@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestStickyEvents(AbstractTestHelpers):
+    def test_sticky_events_history_and_filters(self) -> None:
+        """Test bounded history, where filters and clearing."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        dispatcher.make_sticky("config.loaded", history=2)
+        for index in range(3):
+            dispatcher.dispatch("config.loaded", payload={"index": index})
+
+        received = []
+        dispatcher.add_event_listener(
+            "config.loaded",
+            lambda event: received.append(event.payload["index"]),
+            replay=True,
+        )
+        dispatcher.add_event_listener(
+            "config.loaded",
+            lambda event: received.append(("even", event.payload["index"])),
+            replay=True,
+            where={"index": 2},
+        )
+        dispatcher.clear_sticky_events()
+        dispatcher.add_event_listener(
+            "config.loaded", lambda event: received.append("late"), replay=True
+        )
+
+        assert received == [1, 2, ("even", 2)]
+        assert dispatcher.get_sticky_events("config.loaded") == ()
+        with pytest.raises(ValueError):
+            dispatcher.make_sticky("config.loaded", history=0)
+
+    def test_sticky_events_replay_to_late_listener(self) -> None:
+        """Test that late listeners receive the last sticky event."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.listener import EventListenerMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        class Component(EventListenerMixin):
+            def __init__(self) -> None:
+                self.ready = []
+
+            @EventListenerMixin.on("app.ready", replay=True)
+            def on_ready(self, event) -> None:
+                self.ready.append(event.payload["version"])
+
+        dispatcher = TestDispatcher()
+        dispatcher.make_sticky("app.ready")
+        dispatcher.dispatch("app.ready", payload={"version": 1})
+        dispatcher.dispatch("app.other")
+
+        component = Component()
+        component.bind_to_dispatcher(dispatcher)
+        once = []
+        dispatcher.add_event_listener(
+            "app.ready", lambda event: once.append(event), once=True, replay=True
+        )
+        not_sticky = []
+        dispatcher.add_event_listener(
+            "app.other", lambda event: not_sticky.append(event), replay=True
+        )
+        dispatcher.dispatch("app.ready", payload={"version": 2})
+
+        assert component.ready == [1, 2]
+        assert len(once) == 1
+        assert not_sticky == []
+        assert [
+            event.payload["version"]
+            for event in dispatcher.get_sticky_events("app.ready")
+        ] == [2]
+
+    def test_sticky_events_replay_while_dispatching(self) -> None:
+        """Test that sticky events dispatched during a replay reach the listener once."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        dispatcher.make_sticky("app.ready", history=5)
+        dispatcher.dispatch("app.ready", payload={"version": 1})
+
+        def on_ready(event) -> None:
+            received.append(event.payload["version"])
+            if event.payload["version"] == 1:
+                dispatcher.dispatch("app.ready", payload={"version": 2})
+
+        received = []
+        dispatcher.add_event_listener("app.ready", on_ready, replay=True)
+        once = []
+        dispatcher.add_event_listener(
+            "app.ready",
+            lambda event: once.append(event.payload["version"]),
+            once=True,
+            replay=True,
+        )
+        dispatcher.dispatch("app.ready", payload={"version": 3})
+
+        assert received == [1, 2, 3]
+        assert once == [2]
+
+    def test_sticky_events_typed(self) -> None:
+        """Test sticky keys given as event classes."""
+        from dataclasses import dataclass
+
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.dataclass.typed_event import TypedEvent
+
+        @dataclass(frozen=True, slots=True, kw_only=True)
+        class ConfigLoaded(TypedEvent):
+            path: str
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        dispatcher.make_sticky(ConfigLoaded)
+        dispatcher.dispatch(ConfigLoaded(path="/etc/app"))
+        received = []
+        dispatcher.add_event_listener(
+            ConfigLoaded, lambda event: received.append(event.path), replay=True
+        )
+
+        assert received == ["/etc/app"]
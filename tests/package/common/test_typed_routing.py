@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+from wexample_event.dataclass.typed_event import TypedEvent
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserEvent(TypedEvent):
+    user_id: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserCreated(UserEvent):
+    email: str
+
+
+class TestTypedRouting(AbstractTestHelpers):
+    def test_typed_routing_by_class(self) -> None:
+        """Test that class listeners receive the event and its subclasses."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+
+        dispatcher.add_event_listener(
+            UserEvent, lambda event: received.append(("base", event.user_id))
+        )
+        dispatcher.add_event_listener(
+            UserCreated, lambda event: received.append(("created", event.email))
+        )
+
+        dispatcher.dispatch(UserCreated(user_id=1, email="a@b.c"))
+        dispatcher.dispatch(UserEvent(user_id=2))
+
+        assert received == [("base", 1), ("created", "a@b.c"), ("base", 2)]
+
+    def test_typed_routing_by_name(self) -> None:
+        """Test that typed events also reach listeners of their name."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+
+        dispatcher.add_event_listener("UserCreated", received.append)
+
+        dispatcher.dispatch(UserCreated(user_id=1, email="a@b.c"))
+
+        assert len(received) == 1
+
+    def test_typed_routing_invalid_class(self) -> None:
+        """Test that only Event subclasses can be used as listener keys."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        with pytest.raises(TypeError):
+            TestDispatcher().add_event_listener(int, lambda event: None)
+
+    def test_typed_routing_listener_mixin(self) -> None:
+        """Test the on decorator with an event class."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.listener import EventListenerMixin
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        class Handler(EventListenerMixin):
+            def __init__(self) -> None:
+                self.user_ids = []
+
+            @EventListenerMixin.on(UserEvent)
+            def handle(self, event: UserEvent) -> None:
+                self.user_ids.append(event.user_id)
+
+        dispatcher = TestDispatcher()
+        handler = Handler()
+        handler.bind_to_dispatcher(dispatcher)
+
+        dispatcher.dispatch(UserCreated(user_id=7, email="a@b.c"))
+        handler.unbind_from_dispatcher()
+        dispatcher.dispatch(UserCreated(user_id=8, email="a@b.c"))
+
+        assert handler.user_ids == [7]
+
+    def test_typed_routing_once_and_priority(self) -> None:
+        """Test priority ordering and once handling across class buckets."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.priority import EventPriority
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        received = []
+
+        dispatcher.add_event_listener(UserCreated, lambda event: received.append("low"))
+        dispatcher.add_event_listener(
+            UserEvent,
+            lambda event: received.append("high"),
+            priority=EventPriority.HIGH,
+            once=True,
+        )
+
+        dispatcher.dispatch(UserCreated(user_id=1, email="a@b.c"))
+        dispatcher.dispatch(UserCreated(user_id=1, email="a@b.c"))
+
+        assert received == ["high", "low", "low"]
+        assert not dispatcher.has_event_listeners(UserEvent)
+
+    def test_typed_routing_once_restored_on_abort(self) -> None:
+        """Test that unreached once-listeners return to their own class bucket."""
+        from wexample_event.common.dispatcher import EventDispatcherMixin
+        from wexample_event.common.priority import EventPriority
+
+        class TestDispatcher(EventDispatcherMixin):
+            pass
+
+        dispatcher = TestDispatcher()
+        failures = [ValueError("boom")]
+
+        def failing(event: UserEvent) -> None:
+            if failures:
+                raise failures.pop()
+
+        dispatcher.add_event_listener(UserEvent, failing, priority=EventPriority.HIGH)
+        dispatcher.add_event_listener(UserCreated, lambda event: None, once=True)
+
+        with pytest.raises(ValueError):
+            dispatcher.dispatch(UserCreated(user_id=1, email="a@b.c"))
+
+        assert dispatcher.has_event_listeners(UserCreated)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestValuePacker(AbstractTestHelpers):
+    def test_value_packer_default_hook(self) -> None:
+        """Test that unsupported values go through the default hook."""
+        from datetime import date
+
+        from wexample_event.common.value_packer import pack_value, unpack_value
+
+        buffer = bytearray()
+        pack_value(date(2024, 1, 2), buffer, default=lambda value: value.isoformat())
+
+        assert unpack_value(bytes(buffer)) == ("2024-01-02", len(buffer))
+
+    def test_value_packer_msgpack_encoding(self) -> None:
+        """Test a few canonical MessagePack encodings."""
+        from wexample_event.common.value_packer import pack_value
+
+        buffer = bytearray()
+        pack_value({"a": [1, -1, None, True]}, buffer)
+
+        assert bytes(buffer) == b"\x81\xa1a\x94\x01\xff\xc0\xc3"
+
+    def test_value_packer_roundtrip(self) -> None:
+        """Test that supported values survive a roundtrip."""
+        from wexample_event.common.value_packer import pack_value, unpack_value
+
+        values = [
+            None,
+            True,
+            False,
+            0,
+            127,
+            -32,
+            -33,
+            255,
+            65536,
+            2**40,
+            2**64 - 1,
+            -(2**63),
+            1.5,
+            "",
+            "é" * 40,
+            "x" * 70000,
+            b"\x00" * 300,
+            list(range(20)),
+            {"nested": {"key": [1, 2, {"deep": "value"}]}},
+            {str(index): index for index in range(20)},
+        ]
+        for value in values:
+            buffer = bytearray()
+            pack_value(value, buffer)
+            assert unpack_value(memoryview(buffer)) == (value, len(buffer))
+
+    def test_value_packer_unsupported(self) -> None:
+        """Test that unsupported values raise without a default hook."""
+        from wexample_event.common.value_packer import pack_value
+
+        with pytest.raises(TypeError):
+            pack_value(object(), bytearray())
+        with pytest.raises(OverflowError):
+            pack_value(2**64, bytearray())
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestDispatchResult(AbstractTestHelpers):
+    def test_dispatch_result_empty(self) -> None:
+        """Test a result without outcomes."""
+        from wexample_event.dataclass.dispatch_result import DispatchResult
+        from wexample_event.dataclass.event import Event
+
+        result = DispatchResult(event=Event(name="test"))
+
+        assert result.ok
+        assert result.errors == []
+        assert result.duration == 0
+        result.raise_for_errors()
+
+    def test_dispatch_result_failures(self) -> None:
+        """Test errors and failed outcomes are exposed."""
+        from wexample_event.dataclass.dispatch_result import DispatchResult
+        from wexample_event.dataclass.event import Event
+        from wexample_event.dataclass.listener_outcome import ListenerOutcome
+        from wexample_event.exception.event_dispatch_error import EventDispatchError
+
+        def callback(event: Event) -> None:
+            pass
+
+        error = ValueError("boom")
+        result = DispatchResult(
+            event=Event(name="test"),
+            outcomes=[
+                ListenerOutcome(callback=callback, duration=0.5),
+                ListenerOutcome(callback=callback, duration=0.25, error=error),
+            ],
+        )
+
+        assert not result.ok
+        assert result.errors == [error]
+        assert result.failed == [result.outcomes[1]]
+        assert result.duration == 0.75
+        with pytest.raises(EventDispatchError):
+            result.raise_for_errors()
+
+    def test_types(self) -> None:
+        """Test type validation for DispatchResult."""
+        from wexample_event.dataclass.dispatch_result import DispatchResult
+        from wexample_event.dataclass.event import Event
+
+        result = DispatchResult(event=Event(name="test"))
+
+        self._test_type_validate_or_fail(success_cases=[(result, DispatchResult)])
@@ -44,6 +44,27 @@ class TestEvent(AbstractTestHelpers):
         assert derived.metadata == original.metadata
         assert derived is not original
 
+    def test_event_derive_shares_unchanged_fields(self) -> None:
+        """Test that derive shares payload and metadata views instead of copying."""
+        from wexample_event.dataclass.event import Event
+
+        payload = {"a": 1}
+        original = Event(name="test", payload=payload, metadata={"m": 1})
+        derived = original.derive(name="derived")
+        payload["a"] = 2
+
+        assert original.payload is payload
+        assert derived.payload == {"a": 2}
+        assert derived.derive(name="again").payload is derived.payload
+        assert derived.timestamp == original.timestamp
+
+    def test_event_derive_unknown_field(self) -> None:
+        """Test that unknown fields are rejected."""
+        from wexample_event.dataclass.event import Event
+
+        with pytest.raises(TypeError):
+            Event(name="test").derive(unknown=1)
+
     def test_event_derive_with_changes(self) -> None:
         """Test derive with additional field changes."""
         from wexample_event.dataclass.event import Event
@@ -94,6 +115,50 @@ class TestEvent(AbstractTestHelpers):
 
         assert event1 != event2
 
+    def test_event_payload_is_read_only_view(self) -> None:
+        """Test that derived payloads are read-only views over the caller mapping."""
+        from wexample_event.dataclass.event import Event
+
+        payload = {"key": "value"}
+        event = Event(name="test", payload=payload).derive(name="derived")
+
+        with pytest.raises(TypeError):
+            event.payload["key"] = "changed"  # type: ignore[index]
+        payload["other"] = 1
+        assert event.payload["other"] == 1
+
+    def test_event_pickle(self) -> None:
+        """Test that events with payload views can be pickled."""
+        import pickle
+
+        from wexample_event.dataclass.event import Event
+
+        event = Event(name="test", payload={"key": "value"})
+        restored = pickle.loads(pickle.dumps(event))
+
+        assert restored == event
+        assert restored.payload == {"key": "value"}
+
+    def test_event_serialization(self) -> None:
+        """Test json and asdict on events, and to_dict on derived events."""
+        import copy
+        import json
+        from dataclasses import asdict
+
+        from wexample_event.dataclass.event import Event
+
+        event = Event(name="test", payload={"key": [1]}, metadata={"m": 1})
+        derived = event.derive(name="derived")
+
+        assert json.loads(json.dumps(event.payload)) == {"key": [1]}
+        assert asdict(event)["payload"] == {"key": [1]}
+        assert json.loads(json.dumps(derived.to_dict()["payload"])) == {"key": [1]}
+        assert derived.to_dict()["metadata"] == {"m": 1}
+
+        copied = copy.deepcopy(derived)
+        assert copied == derived
+        assert copied.payload["key"] is not event.payload["key"]
+
     def test_event_timestamp_is_utc(self) -> None:
         """Test that timestamp is in UTC timezone."""
         from wexample_event.dataclass.event import Event
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestEventFilter(AbstractTestHelpers):
+    def test_event_filter_from_mapping(self) -> None:
+        """Test condition parsing and matching."""
+        from wexample_event.dataclass.event import Event
+        from wexample_event.dataclass.event_filter import EventFilter
+
+        event_filter = EventFilter.from_mapping(
+            {"tenant": {"a", "b"}, "metadata.region": "eu", "payload.kind": 1}
+        )
+
+        assert [
+            (condition.source, condition.field) for condition in event_filter.conditions
+        ] == [("payload", "tenant"), ("metadata", "region"), ("payload", "kind")]
+        assert event_filter.index_condition().field == "region"
+        assert event_filter.matches(
+            Event(
+                name="x", payload={"tenant": "a", "kind": 1}, metadata={"region": "eu"}
+            )
+        )
+        assert not event_filter.matches(
+            Event(
+                name="x", payload={"tenant": "c", "kind": 1}, metadata={"region": "eu"}
+            )
+        )
+        assert not event_filter.matches(Event(name="x"))
+
+    def test_event_filter_index_condition(self) -> None:
+        """Test the fallback to in-set conditions."""
+        from wexample_event.dataclass.event_filter import EventFilter
+
+        event_filter = EventFilter.from_mapping({"tenant": ["a", "b"]})
+
+        assert event_filter.index_condition().values == frozenset({"a", "b"})
+        assert event_filter.index_condition(allow_in_set=False) is None
+        with pytest.raises(ValueError):
+            EventFilter.from_mapping({})
+
+    def test_event_filter_without_condition(self) -> None:
+        """Test removing the indexed condition from a filter."""
+        from wexample_event.dataclass.event_filter import EventFilter
+
+        event_filter = EventFilter.from_mapping({"tenant": "a", "kind": [1, 2]})
+        indexed = event_filter.index_condition()
+        residual = event_filter.without_condition(indexed)
+
+        assert [condition.field for condition in residual.conditions] == ["kind"]
+        assert residual.without_condition(residual.conditions[0]) is None
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestJournalSegmentIndex(AbstractTestHelpers):
+    def test_journal_segment_index_offsets(self) -> None:
+        """Test candidate offsets by name pattern and time bucket."""
+        from wexample_event.dataclass.journal_segment_index import (
+            JournalSegmentIndex,
+        )
+
+        index = JournalSegmentIndex(bucket_ns=10)
+        index.add("order.created", 5, 100)
+        index.add("order.paid", 15, 200)
+        index.add("user.created", 25, 300)
+
+        assert index.offsets() == [100, 200, 300]
+        assert index.offsets(frozenset({"order.*"})) == [100, 200]
+        assert index.offsets(frozenset({"order.*"}), since_ns=12) == [200]
+        assert index.offsets(until_ns=20) == [100, 200]
+        assert index.offsets(since_ns=30) == []
+        assert not index.overlaps(26, None)
+
+    def test_journal_segment_index_round_trip(self) -> None:
+        """Test that an index survives serialization."""
+        from wexample_event.dataclass.journal_segment_index import (
+            JournalSegmentIndex,
+        )
+
+        index = JournalSegmentIndex(bucket_ns=10, end_offset=400)
+        index.add("a", 5, 8)
+
+        assert JournalSegmentIndex.from_bytes(index.to_bytes()) == index
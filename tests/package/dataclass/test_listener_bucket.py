@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestListenerBucket(AbstractTestHelpers):
+    def test_listener_bucket_from_records_sorted(self) -> None:
+        """Test that records are sorted by priority then order."""
+        from wexample_event.dataclass.listener_bucket import ListenerBucket
+        from wexample_event.dataclass.listener_record import ListenerRecord
+
+        def low(event) -> None:
+            pass
+
+        def high(event) -> None:
+            pass
+
+        def normal(event) -> None:
+            pass
+
+        bucket = ListenerBucket.from_records(
+            [
+                ListenerRecord(callback=low, once=False, order=0, priority=-100),
+                ListenerRecord(callback=high, once=True, order=1, priority=100),
+                ListenerRecord(callback=normal, once=False, order=2, priority=0),
+            ]
+        )
+
+        assert bucket.callbacks == (high, normal, low)
+        assert list(bucket.priorities) == [100, 0, -100]
+        assert bucket.once_mask == 0b001
+        assert bucket.is_once(0)
+        assert not bucket.is_once(1)
+
+    def test_listener_bucket_inserted(self) -> None:
+        """Test insertion keeps ordering and shifts the once mask."""
+        from wexample_event.dataclass.listener_bucket import ListenerBucket
+        from wexample_event.dataclass.listener_record import ListenerRecord
+
+        def callback(event) -> None:
+            pass
+
+        bucket = ListenerBucket()
+        bucket = bucket.inserted(
+            ListenerRecord(callback=callback, once=True, order=0, priority=0)
+        )
+        bucket = bucket.inserted(
+            ListenerRecord(callback=callback, once=False, order=1, priority=100)
+        )
+        bucket = bucket.inserted(
+            ListenerRecord(callback=callback, once=False, order=2, priority=0)
+        )
+
+        assert list(bucket.orders) == [1, 0, 2]
+        assert bucket.once_mask == 0b010
+
+    def test_listener_bucket_inserted_older_record(self) -> None:
+        """Test that re-inserting an older record restores its original position."""
+        from wexample_event.dataclass.listener_bucket import ListenerBucket
+        from wexample_event.dataclass.listener_record import ListenerRecord
+
+        def callback(event) -> None:
+            pass
+
+        bucket = ListenerBucket.from_records(
+            [ListenerRecord(callback=callback, once=False, order=5, priority=0)]
+        )
+        bucket = bucket.inserted(
+            ListenerRecord(callback=callback, once=True, order=1, priority=0)
+        )
+
+        assert list(bucket.orders) == [1, 5]
+        assert bucket.once_mask == 0b01
+
+    def test_listener_bucket_records_roundtrip(self) -> None:
+        """Test that records can be materialized back from columns."""
+        from wexample_event.dataclass.listener_bucket import ListenerBucket
+        from wexample_event.dataclass.listener_record import ListenerRecord
+
+        def callback(event) -> None:
+            pass
+
+        records = [
+            ListenerRecord(callback=callback, once=True, order=0, priority=10),
+            ListenerRecord(callback=callback, once=False, order=1, priority=0),
+        ]
+
+        assert list(ListenerBucket.from_records(records)) == records
+
+    def test_listener_bucket_without(self) -> None:
+        """Test removal by mask compacts columns and once mask."""
+        from wexample_event.dataclass.listener_bucket import ListenerBucket
+        from wexample_event.dataclass.listener_record import ListenerRecord
+
+        def callback(event) -> None:
+            pass
+
+        bucket = ListenerBucket.from_records(
+            [
+                ListenerRecord(
+                    callback=callback, once=index % 2 == 1, order=index, priority=0
+                )
+                for index in range(4)
+            ]
+        )
+        remaining = bucket.without(0b0101)
+
+        assert len(remaining) == 2
+        assert list(remaining.orders) == [1, 3]
+        assert remaining.once_mask == 0b11
+        assert bucket.without(0) is bucket
+        assert not bucket.without(bucket.once_mask).once_mask
+
+    def test_types(self) -> None:
+        """Test type validation for ListenerBucket."""
+        from wexample_event.dataclass.listener_bucket import ListenerBucket
+
+        self._test_type_validate_or_fail(
+            success_cases=[(ListenerBucket(), ListenerBucket)]
+        )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from wexample_helpers.testing.abstract_test_helpers import AbstractTestHelpers
+
+
+class TestTypedEvent(AbstractTestHelpers):
+    def test_typed_event_custom_name(self) -> None:
+        """Test that event_name overrides the class name."""
+        from wexample_event.dataclass.typed_event import TypedEvent
+
+        @dataclass(frozen=True, slots=True, kw_only=True)
+        class Ready(TypedEvent):
+            event_name = "app.ready"
+
+        assert Ready().name == "app.ready"
+
+    def test_typed_event_derive(self) -> None:
+        """Test that derive keeps the class and updates typed fields."""
+        from wexample_event.dataclass.typed_event import TypedEvent
+
+        @dataclass(frozen=True, slots=True, kw_only=True)
+        class UserCreated(TypedEvent):
+            user_id: int
+
+        event = UserCreated(user_id=1)
+        derived = event.derive(user_id=2)
+
+        assert type(derived) is UserCreated
+        assert derived.user_id == 2
+        assert derived.timestamp == event.timestamp
+
+    def test_typed_event_fields(self) -> None:
+        """Test that fields are slotted and the name defaults to the class name."""
+        from wexample_event.dataclass.typed_event import TypedEvent
+
+        @dataclass(frozen=True, slots=True, kw_only=True)
+        class UserCreated(TypedEvent):
+            user_id: int
+
+        event = UserCreated(user_id=42)
+
+        assert event.name == "UserCreated"
+        assert event.user_id == 42
+        assert event.payload is None
+        assert not hasattr(event, "__dict__")
+
+    def test_types(self) -> None:
+        """Test type validation for TypedEvent."""
+        from wexample_event.dataclass.event import Event
+        from wexample_event.dataclass.typed_event import TypedEvent
+
+        self._test_type_validate_or_fail(
+            success_cases=[(TypedEvent(), TypedEvent), (TypedEvent(), Event)]
+        )